@@ -11,6 +11,14 @@ from .models import (
     Thread, Agent, Session, Project
 )
 
+# Use orjson for line parsing when available
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 # Use timezone-aware min datetime for consistent comparisons
 DATETIME_MIN = datetime.min.replace(tzinfo=timezone.utc)
@@ -41,8 +49,8 @@ def iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
             if not line:
                 continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError as e:
+                yield _loads(line)
+            except json.JSONDecodeError as e:  # also raised by orjson
                 warnings.warn(f"{path}:{line_no}: JSON parse error: {e}")
                 continue
 
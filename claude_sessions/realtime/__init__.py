@@ -83,7 +83,14 @@ from .events import (
     SessionEventType,
     truncate_tool_input,
 )
-from .tailer import JSONLTailer, TailerState, MultiFileTailer
+from .tailer import (
+    JSONLTailer,
+    TailerState,
+    MultiFileTailer,
+    LazyEntry,
+    EntryBatch,
+    EntryRing,
+)
 from .parser import IncrementalParser
 from .emitter import EventEmitter
 from .watcher import SessionWatcher, WatcherConfig, TrackedSession
@@ -121,6 +128,7 @@ from .formatters import (
 from .prometheus_server import PrometheusServer
 from .webhook import (
     WebhookDispatcher,
+    AsyncWebhookDispatcher,
     WebhookConfig,
     WebhookPayload,
     serialize_event,
@@ -145,6 +153,9 @@ __all__ = [
     "JSONLTailer",
     "TailerState",
     "MultiFileTailer",
+    "LazyEntry",
+    "EntryBatch",
+    "EntryRing",
     "IncrementalParser",
     "EventEmitter",
     # Session watcher (Phase 2)
@@ -181,6 +192,7 @@ __all__ = [
     "PrometheusServer",
     # Webhook dispatcher (Phase 5)
     "WebhookDispatcher",
+    "AsyncWebhookDispatcher",
     "WebhookConfig",
     "WebhookPayload",
     "serialize_event",
@@ -38,7 +38,7 @@ Example usage (decorator style):
 import asyncio
 import inspect
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import (
     Any,
     AsyncIterator,
@@ -133,6 +133,11 @@ class AsyncSessionWatcher:
         self._dispatch_task: Optional[asyncio.Task] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+        # Events dispatched to handlers since start(), by type; the signal
+        # is set after each one for wait_for_events()
+        self._dispatched: Counter = Counter()
+        self._dispatched_signal: Optional[asyncio.Event] = None
+
         # Track active iterators for cleanup
         self._active_iterators: Set[int] = set()
 
@@ -274,6 +279,8 @@ class AsyncSessionWatcher:
         self._running = True
         self._loop = asyncio.get_running_loop()
         self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._dispatched.clear()
+        self._dispatched_signal = asyncio.Event()
 
         # Set up event routing from sync watcher to our queue
         self._watcher.on_any(self._on_sync_event)
@@ -300,8 +307,9 @@ class AsyncSessionWatcher:
             except asyncio.QueueFull:
                 pass
 
-        # Stop the sync watcher
-        self._watcher.stop()
+        # Stop the sync watcher; joining the observer blocks, so keep it
+        # off the event loop
+        await asyncio.to_thread(self._watcher.stop)
 
         # Cancel tasks
         if self._dispatch_task is not None:
@@ -322,6 +330,10 @@ class AsyncSessionWatcher:
 
         self._queue = None
         self._loop = None
+        if self._dispatched_signal is not None:
+            # Wake any wait_for_events() callers so they can return
+            self._dispatched_signal.set()
+            self._dispatched_signal = None
 
         logger.debug("Stopped async session watcher")
 
@@ -337,6 +349,55 @@ class AsyncSessionWatcher:
         finally:
             await self.stop()
 
+    async def wait_for_events(
+        self,
+        count: int = 1,
+        event_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Wait until handlers have been run for a number of events.
+
+        Counts events dispatched since start(), so callers can react to
+        a known amount of activity instead of sleeping for a fixed time.
+
+        Args:
+            count: Number of dispatched events to wait for
+            event_type: Only count events of this type (all types if None)
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the count was reached, False on timeout or stop().
+
+        Example:
+            async with watcher:
+                if await watcher.wait_for_events(event_type="message", timeout=5):
+                    print("first message handled")
+        """
+        if not self._running or self._dispatched_signal is None:
+            raise RuntimeError("Watcher not started. Call start() first.")
+
+        def seen() -> int:
+            if event_type is None:
+                return sum(self._dispatched.values())
+            return self._dispatched[event_type]
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while seen() < count:
+            signal = self._dispatched_signal
+            if signal is None:
+                return False
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            signal.clear()
+            try:
+                await asyncio.wait_for(signal.wait(), remaining)
+            except asyncio.TimeoutError:
+                return seen() >= count
+        return True
+
     # --- Public API: Properties ---
 
     @property
@@ -397,12 +458,11 @@ class AsyncSessionWatcher:
             pass
 
     async def _run_watcher(self) -> None:
-        """Run the sync watcher in a thread executor."""
-        loop = asyncio.get_running_loop()
+        """Run the sync watcher's poll cycles from this event loop."""
         try:
-            await loop.run_in_executor(None, self._watcher.start)
+            await self._watcher.run_async()
         except Exception as e:
-            logger.exception("Error in watcher thread: %s", e)
+            logger.exception("Error in watcher loop: %s", e)
 
     async def _dispatch_loop(self) -> None:
         """Dispatch events to registered handlers."""
@@ -419,6 +479,9 @@ class AsyncSessionWatcher:
                     break
 
                 await self._dispatch_event(event)
+                self._dispatched[getattr(event, "event_type", None)] += 1
+                if self._dispatched_signal is not None:
+                    self._dispatched_signal.set()
 
             except asyncio.TimeoutError:
                 continue
@@ -6,7 +6,7 @@ events to registered handlers.
 
 import logging
 from collections import defaultdict
-from typing import Callable, Dict, List, Literal, Optional, Union, overload
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union, overload
 
 from .events import (
     SessionEvent,
@@ -66,6 +66,9 @@ class EventEmitter:
     def __init__(self):
         """Initialize the event emitter."""
         self._handlers: Dict[str, List[EventHandler]] = defaultdict(list)
+        # Per-type handler tuples (type handlers + wildcard handlers),
+        # built on first emit and replaced whenever registrations change
+        self._resolved: Dict[str, Tuple[EventHandler, ...]] = {}
 
     def on(
         self,
@@ -92,11 +95,13 @@ class EventEmitter:
         if handler is not None:
             # Direct call: emitter.on("message", handler)
             self._handlers[event_type].append(handler)
+            self._invalidate()
             return handler
 
         # Decorator call: @emitter.on("message")
         def decorator(fn: EventHandler) -> EventHandler:
             self._handlers[event_type].append(fn)
+            self._invalidate()
             return fn
 
         return decorator
@@ -114,9 +119,10 @@ class EventEmitter:
         handlers = self._handlers[event_type]
         try:
             handlers.remove(handler)
-            return True
         except ValueError:
             return False
+        self._invalidate()
+        return True
 
     def on_any(self, handler: EventHandler) -> EventHandler:
         """Register a handler for all event types.
@@ -133,6 +139,7 @@ class EventEmitter:
             The handler (for decorator use)
         """
         self._handlers[self._ANY_KEY].append(handler)
+        self._invalidate()
         return handler
 
     def off_any(self, handler: EventHandler) -> bool:
@@ -147,9 +154,31 @@ class EventEmitter:
         handlers = self._handlers[self._ANY_KEY]
         try:
             handlers.remove(handler)
-            return True
         except ValueError:
             return False
+        self._invalidate()
+        return True
+
+    def _invalidate(self) -> None:
+        """Drop resolved handler tuples after registrations change.
+
+        Called after _handlers has been updated. The cache is replaced
+        rather than cleared, so an emit on another thread that built a
+        tuple from the old registrations stores it in the discarded dict.
+        """
+        self._resolved = {}
+
+    def _handlers_for(self, event_type: str) -> Tuple[EventHandler, ...]:
+        """Get the handlers to call for an event type, in call order."""
+        # Snapshot the cache before reading _handlers; see _invalidate()
+        resolved = self._resolved
+        handlers = resolved.get(event_type)
+        if handlers is None:
+            handlers = tuple(self._handlers.get(event_type, ())) + tuple(
+                self._handlers.get(self._ANY_KEY, ())
+            )
+            resolved[event_type] = handlers
+        return handlers
 
     def emit(self, event: SessionEventType) -> int:
         """Dispatch an event to all registered handlers.
@@ -165,23 +194,47 @@ class EventEmitter:
         """
         handlers_called = 0
 
-        # Get handlers for this event type
-        type_handlers = self._handlers.get(event.event_type, [])
-        any_handlers = self._handlers.get(self._ANY_KEY, [])
-
-        all_handlers = type_handlers + any_handlers
-
-        for handler in all_handlers:
+        for handler in self._handlers_for(event.event_type):
             try:
                 handler(event)
                 handlers_called += 1
             except Exception as e:
+                # partials and callable objects have no __name__
+                name = getattr(handler, "__name__", repr(handler))
                 logger.exception(
-                    f"Error in event handler {handler.__name__} for {event.event_type}: {e}"
+                    f"Error in event handler {name} for {event.event_type}: {e}"
                 )
 
         return handlers_called
 
+    def emit_many(self, events: Iterable[SessionEventType]) -> int:
+        """Dispatch a batch of events in order.
+
+        Equivalent to calling emit() for each event.
+
+        Args:
+            events: Events to dispatch
+
+        Returns:
+            Total number of handler calls
+        """
+        handlers_called = 0
+        handlers_for = self._handlers_for
+
+        for event in events:
+            event_type = event.event_type
+            for handler in handlers_for(event_type):
+                try:
+                    handler(event)
+                    handlers_called += 1
+                except Exception as e:
+                    name = getattr(handler, "__name__", repr(handler))
+                    logger.exception(
+                        f"Error in event handler {name} for {event_type}: {e}"
+                    )
+
+        return handlers_called
+
     def emit_all(self, events: List[SessionEventType]) -> int:
         """Dispatch multiple events.
 
@@ -191,10 +244,7 @@ class EventEmitter:
         Returns:
             Total number of handler calls
         """
-        total = 0
-        for event in events:
-            total += self.emit(event)
-        return total
+        return self.emit_many(events)
 
     def clear(self, event_type: Union[EventType, None] = None) -> None:
         """Remove all handlers for an event type.
@@ -206,6 +256,7 @@ class EventEmitter:
             self._handlers.clear()
         else:
             self._handlers[event_type].clear()
+        self._invalidate()
 
     @property
     def handler_count(self) -> int:
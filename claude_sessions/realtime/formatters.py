@@ -209,6 +209,14 @@ class JsonFormatter(OutputFormatter):
         data = self._serialize(event)
         return json.dumps(data, default=str, ensure_ascii=False)
 
+    def to_dict(self, event: SessionEventType) -> Dict[str, Any]:
+        """Return the data format() would encode, without encoding it.
+
+        Useful for callers that add fields or use their own JSON encoder,
+        saving a json.loads() of format()'s output.
+        """
+        return self._serialize(event)
+
     def _serialize(self, event: SessionEventType) -> Dict[str, Any]:
         """Serialize event to dictionary."""
         result: Dict[str, Any] = {
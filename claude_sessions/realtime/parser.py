@@ -4,6 +4,7 @@ This module provides the IncrementalParser class for parsing individual
 JSONL entries into events without requiring full session context.
 """
 
+import json
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -24,6 +25,14 @@ from .events import (
     truncate_tool_input,
 )
 
+# Use orjson for line parsing when available
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 class IncrementalParser:
     """Parses individual JSONL entries into session events.
@@ -218,14 +227,12 @@ class IncrementalParser:
         Returns:
             List of events (includes ErrorEvent if JSON is invalid)
         """
-        import json
-
         line = line.strip()
         if not line:
             return []
 
         try:
-            entry = json.loads(line)
+            entry = _loads(line)
             return self.parse_entry(entry)
         except json.JSONDecodeError as e:
             return [
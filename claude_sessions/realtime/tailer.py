@@ -4,11 +4,428 @@ This module provides the JSONLTailer class for incrementally reading
 new entries from JSONL files as they are appended.
 """
 
+import asyncio
 import json
+import mmap
 import os
+import re
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+# Use orjson for line parsing when available (accepts bytes directly)
+try:
+    import orjson
+
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Use watchdog (inotify/FSEvents/kqueue) to wait for changes when available
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object  # type: ignore
+    Observer = None  # type: ignore
+
+# Reads at least this large are served from a memory map instead of pread
+_MMAP_THRESHOLD = 1 << 20
+
+# Reads at least this large are split into lines in one bytes.split call
+_SPLIT_THRESHOLD = 64 * 1024
+
+if hasattr(os, "pread"):
+    _pread = os.pread
+else:  # pragma: no cover - platforms without pread (Windows)
+
+    def _pread(fd: int, length: int, offset: int) -> bytes:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, length)
+
+
+if hasattr(os, "preadv"):
+
+    def _pread_into(fd: int, view: memoryview, offset: int) -> int:
+        return os.preadv(fd, [view], offset)
+
+else:  # pragma: no cover - platforms without preadv (macOS < 11, Windows)
+
+    def _pread_into(fd: int, view: memoryview, offset: int) -> int:
+        data = _pread(fd, len(view), offset)
+        view[: len(data)] = data
+        return len(data)
+
+
+# Top-level "type" field, looked for near the start of each line in lazy mode
+_TYPE_RE = re.compile(rb'"type"\s*:\s*"([A-Za-z_-]+)"')
+_TYPE_PEEK = 512
+
+# Entry types that may be returned unparsed as LazyEntry
+_LAZY_TYPES = frozenset(
+    {
+        "user",
+        "assistant",
+        "system",
+        "summary",
+        "queue-operation",
+        "file-history-snapshot",
+    }
+)
+
+if hasattr(os, "pwrite"):
+    _pwrite = os.pwrite
+else:  # pragma: no cover - platforms without pwrite (Windows)
+
+    def _pwrite(fd: int, data: bytes, offset: int) -> int:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.write(fd, data)
+
+
+if hasattr(os, "posix_fadvise"):
+
+    def _fadvise(fd: int, advice: int) -> None:
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            pass
+
+    _FADV_SEQUENTIAL = os.POSIX_FADV_SEQUENTIAL
+    _FADV_WILLNEED = os.POSIX_FADV_WILLNEED
+else:  # pragma: no cover - platforms without posix_fadvise (macOS, Windows)
+
+    def _fadvise(fd: int, advice: int) -> None:
+        pass
+
+    _FADV_SEQUENTIAL = _FADV_WILLNEED = 0
+
+
+# Bytes read per step by JSONLTailer.iter_new()
+_ITER_CHUNK = 1 << 20
+
+# Resume sidecar layout: inode, position, pending length, padded to 24 bytes
+_SIDECAR = struct.Struct("<QQI4x")
+
+# Reads between automatic sidecar saves
+_SAVE_INTERVAL = 100
+
+# Initial size of the per-tailer scratch buffer used for small reads
+_SCRATCH_SIZE = 64 * 1024
+
+# How often MultiFileTailer.wait_for_changes() re-checks file sizes when
+# watchdog isn't installed
+_FALLBACK_POLL_INTERVAL = 0.1
+
+
+def _loads_lenient(line: bytes) -> Optional[Any]:
+    """Re-parse a line that failed to parse, tolerating invalid UTF-8.
+
+    Args:
+        line: Raw line bytes that the JSON parser rejected
+
+    Returns:
+        The parsed entry if the line only failed because of invalid
+        UTF-8 (decoded with replacement characters), otherwise None
+    """
+    try:
+        line.decode("utf-8")
+    except UnicodeDecodeError:
+        try:
+            return _loads(line.decode("utf-8", errors="replace"))
+        except ValueError:
+            return None
+    return None
+
+
+class LazyEntry(Mapping):
+    """A JSONL entry whose body is parsed only when first needed.
+
+    Returned by JSONLTailer in lazy mode. The entry type is read from the
+    raw line without parsing, so consumers that only look at
+    entry["type"] (for example to skip non-message entries) never pay
+    for a full JSON parse. Any other access parses the line once and
+    behaves like the resulting dict.
+
+    Example:
+        >>> entry = LazyEntry(b'{"type": "summary", "summary": "..."}', "summary")
+        >>> entry["type"]       # no parse
+        'summary'
+        >>> entry["summary"]    # parses the line
+        '...'
+    """
+
+    __slots__ = ("_raw", "_type", "_data")
+
+    def __init__(self, raw: bytes, entry_type: str):
+        """Wrap a raw JSON line.
+
+        Args:
+            raw: Raw line bytes holding a JSON object
+            entry_type: Value of the line's top-level "type" field
+        """
+        self._raw = raw
+        self._type = entry_type
+        self._data: Optional[dict] = None
+
+    def _load(self) -> dict:
+        """Parse the raw line on first use.
+
+        Raises:
+            ValueError: If the line is not valid JSON
+        """
+        if self._data is None:
+            try:
+                data = _loads(self._raw)
+            except ValueError:
+                data = _loads_lenient(self._raw)
+                if data is None:
+                    raise
+            self._data = data
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "type" and self._data is None:
+            return self._type
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        if self._data is not None:
+            return repr(self._data)
+        return self._raw.decode("utf-8", errors="replace")
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the raw line has been parsed."""
+        return self._data is not None
+
+    def to_dict(self) -> dict:
+        """Return the fully parsed entry as a plain dict."""
+        return self._load()
+
+
+def _peek_type(line: bytes) -> Optional[str]:
+    """Read a line's top-level "type" without parsing it.
+
+    Only trusts a match that precedes any nested object, so a "type"
+    key inside "message" or a content block is never mistaken for the
+    entry type.
+
+    Args:
+        line: Raw line bytes
+
+    Returns:
+        The entry type, or None if it can't be read without parsing
+    """
+    if line[:1] != b"{":
+        return None
+    match = _TYPE_RE.search(line, 0, _TYPE_PEEK)
+    if match is None or line.find(b"{", 1, match.start()) != -1:
+        return None
+    return match.group(1).decode("ascii")
+
+
+def _looks_like_json(line: bytes) -> bool:
+    """Cheaply reject lines that cannot hold a JSON object or array.
+
+    Checks only the first and last byte (ignoring a trailing CR), so
+    plain-text noise is dropped without the cost of a parser exception.
+    Lines with surrounding whitespace are left for the parser to judge.
+
+    Args:
+        line: Non-empty raw line bytes
+
+    Returns:
+        False if the line certainly isn't a JSON object or array
+    """
+    first = line[0]
+    last = line[-1]
+    if last == 0x0D and len(line) > 1:
+        last = line[-2]
+    if first != 0x7B and first != 0x5B and first > 0x20:
+        return False
+    if last != 0x7D and last != 0x5D and last > 0x20:
+        return False
+    return True
+
+
+def _parse_line(line: bytes) -> Optional[Any]:
+    """Parse one raw line, returning None if it is malformed."""
+    if not _looks_like_json(line):
+        return None
+    try:
+        return _loads(line)
+    except ValueError:
+        return _loads_lenient(line)
+
+
+@dataclass
+class EntryBatch:
+    """Entries from one read, stored as parallel arrays of type and raw line.
+
+    Returned by JSONLTailer.read_batch(). Types are read from the raw
+    bytes without parsing, and lines are only parsed when iterated, so
+    filtering with select() parses just the entries that match.
+
+    Example:
+        >>> batch = tailer.read_batch()
+        >>> for entry in batch.select("user", "assistant"):
+        ...     print(entry["message"])
+
+    Attributes:
+        types: Top-level "type" of each line (None if not peekable)
+        raw: Raw bytes of each non-blank line
+    """
+
+    types: List[Optional[str]] = field(default_factory=list)
+    raw: List[bytes] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Parse and yield every entry, skipping malformed lines."""
+        for line in self.raw:
+            entry = _parse_line(line)
+            if entry is not None:
+                yield entry
+
+    def select(self, *entry_types: str) -> Iterator[dict]:
+        """Parse and yield only entries of the given types.
+
+        Args:
+            *entry_types: Entry "type" values to keep
+
+        Yields:
+            Parsed entries whose type matches, in file order
+        """
+        wanted = frozenset(entry_types)
+        for entry_type, line in zip(self.types, self.raw):
+            if entry_type is not None and entry_type not in wanted:
+                continue
+            entry = _parse_line(line)
+            if entry is None:
+                continue
+            # Lines whose type couldn't be peeked are checked after parsing
+            if entry_type is None and entry.get("type") not in wanted:
+                continue
+            yield entry
+
+
+class EntryRing:
+    """Bounded ring of raw entry lines between a tailer and a consumer.
+
+    JSONLTailer.read_into() pushes raw lines without building a result
+    list, and the consumer drains and parses them at its own pace. Safe
+    for one producer thread and one consumer thread: each side only
+    advances its own counter, and each counter update is a single
+    attribute store.
+
+    Example:
+        >>> ring = EntryRing(capacity=1024)
+        >>> tailer.read_into(ring)          # producer (e.g. poll thread)
+        >>> for entry in ring.drain_entries():  # consumer (e.g. UI)
+        ...     render(entry)
+    """
+
+    __slots__ = ("_slots", "_capacity", "_head", "_tail")
+
+    def __init__(self, capacity: int = 4096):
+        """Initialize an empty ring.
+
+        Args:
+            capacity: Maximum number of lines held at once
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._slots: List[Optional[bytes]] = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # Next slot to read, advanced by the consumer
+        self._tail = 0  # Next slot to write, advanced by the producer
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of lines the ring holds."""
+        return self._capacity
+
+    @property
+    def free(self) -> int:
+        """Number of lines that can be pushed before the ring is full."""
+        return self._capacity - (self._tail - self._head)
+
+    def push(self, line: bytes) -> bool:
+        """Append a raw line.
+
+        Args:
+            line: Raw line bytes
+
+        Returns:
+            False if the ring is full and the line was not added
+        """
+        tail = self._tail
+        if tail - self._head >= self._capacity:
+            return False
+        self._slots[tail % self._capacity] = line
+        self._tail = tail + 1
+        return True
+
+    def drain(self, max_items: Optional[int] = None) -> List[bytes]:
+        """Remove and return buffered raw lines, oldest first.
+
+        Args:
+            max_items: Maximum number of lines to remove (default: all)
+
+        Returns:
+            Raw lines in the order they were pushed
+        """
+        head = self._head
+        count = self._tail - head
+        if max_items is not None:
+            count = min(count, max_items)
+
+        slots = self._slots
+        capacity = self._capacity
+        lines = []
+        for i in range(head, head + count):
+            index = i % capacity
+            lines.append(slots[index])
+            slots[index] = None
+        self._head = head + count
+        return lines
+
+    def drain_entries(self, max_items: Optional[int] = None) -> List[dict]:
+        """Remove buffered lines and parse them, skipping malformed ones.
+
+        Args:
+            max_items: Maximum number of lines to remove (default: all)
+
+        Returns:
+            Parsed entries in the order they were pushed
+        """
+        entries = []
+        for line in self.drain(max_items):
+            entry = _parse_line(line)
+            if entry is not None:
+                entries.append(entry)
+        return entries
 
 
 @dataclass
@@ -19,18 +436,43 @@ class TailerState:
         file_path: Path to the JSONL file being tailed
         position: Current byte position in the file
         inode: File inode for detecting rotation/truncation
-        line_buffer: Incomplete line from previous read
+        pending_chunks: Pieces of an incomplete line from previous reads
+        pending_len: Total size in bytes of pending_chunks
+        fd: Open file descriptor, kept across reads (None when closed)
+        scratch: Reusable read buffer for reads below _MMAP_THRESHOLD
     """
 
     file_path: Path
     position: int = 0
     inode: int = 0
-    line_buffer: str = ""
+    pending_chunks: List[bytes] = field(default_factory=list)
+    pending_len: int = 0
+    fd: Optional[int] = None
+    scratch: bytearray = field(default_factory=bytearray, repr=False, compare=False)
+
+    @property
+    def line_buffer(self) -> bytes:
+        """Incomplete line from previous reads, joined into one bytes."""
+        return b"".join(self.pending_chunks)
+
+    def add_pending(self, chunk: bytes) -> None:
+        """Buffer a piece of an incomplete line without copying earlier pieces.
+
+        A single JSON record can span many polls; appending to a list
+        keeps that O(n) where repeated bytes concatenation would be O(n²).
+        """
+        self.pending_chunks.append(chunk)
+        self.pending_len += len(chunk)
+
+    def clear_pending(self) -> None:
+        """Discard any buffered incomplete line."""
+        self.pending_chunks.clear()
+        self.pending_len = 0
 
     def reset(self) -> None:
         """Reset state to beginning of file."""
         self.position = 0
-        self.line_buffer = ""
+        self.clear_pending()
 
 
 class JSONLTailer:
@@ -41,6 +483,11 @@ class JSONLTailer:
     - File truncation/rotation detection via inode
     - Graceful handling of malformed JSON
 
+    The file descriptor is opened once and reused for every read, so a
+    poll costs a positioned read rather than an open/seek/read/close
+    sequence. Call close() (or use the tailer as a context manager) to
+    release it.
+
     Example:
         >>> tailer = JSONLTailer(Path("session.jsonl"))
         >>> for entry in tailer.read_new():
@@ -50,15 +497,108 @@ class JSONLTailer:
         ...     print(entry.get("type"))
     """
 
-    def __init__(self, file_path: Path):
+    def __init__(
+        self,
+        file_path: Path,
+        lazy: bool = False,
+        resume_from: Optional[Path] = None,
+    ):
         """Initialize tailer for the given file.
 
         Args:
             file_path: Path to the JSONL file to tail
+            lazy: Return entries of known types as LazyEntry mappings
+                that defer JSON parsing until a field other than
+                "type" is accessed
+            resume_from: Sidecar file holding a saved position. If it
+                matches the current file, reading resumes there instead
+                of reparsing from the start; the position is saved back
+                every _SAVE_INTERVAL reads and on close()
         """
-        self.state = TailerState(file_path=Path(file_path))
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+        self.state = TailerState(file_path=file_path)
+        self._lazy = lazy
+        self._sidecar_path = Path(resume_from) if resume_from is not None else None
+        self._sidecar_fd: Optional[int] = None
+        self._reads_since_save = 0
+        # Lines read but not yet accepted by a full EntryRing
+        self._overflow: List[bytes] = []
         self._update_inode()
 
+        if self._sidecar_path is not None:
+            self._resume(self._sidecar_path)
+
+    def _resume(self, sidecar_path: Path) -> bool:
+        """Seed the read position from a sidecar written by save_state().
+
+        The saved position is only used if the inode still matches and the
+        file has not shrunk below it; otherwise the tailer starts from the
+        beginning. Any partial line pending at save time is re-read.
+
+        Args:
+            sidecar_path: Path to the sidecar file
+
+        Returns:
+            True if the saved position was applied
+        """
+        try:
+            slab = sidecar_path.read_bytes()
+        except OSError:
+            return False
+        if len(slab) != _SIDECAR.size:
+            return False
+
+        inode, position, pending_len = _SIDECAR.unpack(slab)
+        fd = self._open_fd()
+        if fd is None:
+            return False
+
+        try:
+            stat = os.fstat(fd)
+        except OSError:
+            return False
+        if stat.st_ino != inode or stat.st_size < position:
+            return False
+
+        self.state.inode = inode
+        self.state.position = max(position - pending_len, 0)
+        return True
+
+    def save_state(self, sidecar_path: Optional[Path] = None) -> None:
+        """Write the current position to a sidecar file.
+
+        The state is packed into a fixed 24-byte record and written with a
+        single positioned write, so saving is cheap enough to do often.
+
+        Args:
+            sidecar_path: Where to write (default: the resume_from path)
+
+        Raises:
+            ValueError: If no path is given and resume_from was not set
+            OSError: If the sidecar cannot be written
+        """
+        slab = _SIDECAR.pack(
+            self.state.inode, self.state.position, self.state.pending_len
+        )
+
+        if sidecar_path is None or Path(sidecar_path) == self._sidecar_path:
+            if self._sidecar_path is None:
+                raise ValueError("No sidecar path given and resume_from not set")
+            if self._sidecar_fd is None:
+                self._sidecar_fd = os.open(
+                    self._sidecar_path, os.O_WRONLY | os.O_CREAT, 0o644
+                )
+            _pwrite(self._sidecar_fd, slab, 0)
+            self._reads_since_save = 0
+            return
+
+        fd = os.open(sidecar_path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            _pwrite(fd, slab, 0)
+        finally:
+            os.close(fd)
+
     def _update_inode(self) -> None:
         """Update stored inode from current file."""
         try:
@@ -67,81 +607,251 @@ class JSONLTailer:
         except OSError:
             self.state.inode = 0
 
-    def _check_rotation(self) -> bool:
+    def _check_rotation(self) -> Optional[int]:
         """Check if file has been rotated or truncated.
 
+        Resets state when the file was rotated or truncated. The same
+        stat result also sizes the following read, so a poll costs a
+        single stat call.
+
         Returns:
-            True if file was rotated/truncated and state was reset
+            Current file size, or None if the file cannot be stat-ed
         """
         try:
             stat = os.stat(self.state.file_path)
-            current_inode = stat.st_ino
-            current_size = stat.st_size
+        except OSError:
+            return None
 
-            # Inode changed = file was rotated
-            if current_inode != self.state.inode:
-                self.state.reset()
-                self.state.inode = current_inode
-                return True
+        current_inode = stat.st_ino
+        current_size = stat.st_size
 
-            # Size shrunk = file was truncated
-            if current_size < self.state.position:
-                self.state.reset()
-                return True
+        # Inode changed = file was rotated
+        if current_inode != self.state.inode:
+            self._close_fd()
+            self.state.reset()
+            self.state.inode = current_inode
 
-            return False
-        except OSError:
-            return False
+        # Size shrunk = file was truncated
+        elif current_size < self.state.position:
+            self.state.reset()
+
+        return current_size
 
-    def _read_bytes(self) -> bytes:
-        """Read new bytes from file starting at current position.
+    def _open_fd(self) -> Optional[int]:
+        """Return the open file descriptor, opening the file if needed.
 
         Returns:
-            New bytes read from file, or empty bytes on error
+            File descriptor, or None if the file cannot be opened
         """
+        if self.state.fd is None:
+            try:
+                self.state.fd = os.open(self.state.file_path, os.O_RDONLY)
+            except OSError:
+                return None
+            # Tailing is strictly sequential; let the kernel read ahead
+            _fadvise(self.state.fd, _FADV_SEQUENTIAL)
+        return self.state.fd
+
+    def _close_fd(self) -> None:
+        """Close the file descriptor if one is open."""
+        fd, self.state.fd = self.state.fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    @contextmanager
+    def _read_view(
+        self, size: int
+    ) -> Iterator[Tuple[Union[bytes, mmap.mmap], int, int]]:
+        """Yield the bytes appended since the current position.
+
+        Small reads land in the tailer's scratch buffer, which is reused
+        across polls so the read target isn't reallocated, and are copied
+        out once as bytes so the lines sliced from them are bytes too,
+        as they are on the mmap path. Reads of at
+        least _MMAP_THRESHOLD bytes (typically catching up on a large
+        session) are served from a read-only memory map instead, so lines
+        are sliced straight out of the page cache without first copying
+        the whole tail.
+
+        Args:
+            size: File size from the rotation check
+
+        Yields:
+            Tuple of (buffer, start, end); the new bytes are
+            buffer[start:end], and start == end when there is nothing new.
+            The buffer is only valid until the context exits.
+        """
+        fd = self._open_fd()
+        if fd is None:
+            yield b"", 0, 0
+            return
+
+        position = self.state.position
         try:
-            with open(self.state.file_path, "rb") as f:
-                f.seek(self.state.position)
-                return f.read()
-        except OSError:
-            return b""
+            need = size - position
+            if need < _MMAP_THRESHOLD:
+                scratch = self.state.scratch
+                if need > len(scratch):
+                    grow = max(need, 2 * len(scratch), _SCRATCH_SIZE)
+                    grow = min(grow, _MMAP_THRESHOLD)
+                    scratch.extend(bytes(grow - len(scratch)))
+                with memoryview(scratch) as view:
+                    count = _pread_into(fd, view[:need], position)
+                    data = view[:count].tobytes()
+                mapped = None
+            else:
+                # Map offsets must be aligned to the allocation granularity
+                offset = position - position % mmap.ALLOCATIONGRANULARITY
+                mapped = mmap.mmap(
+                    fd, size - offset, access=mmap.ACCESS_READ, offset=offset
+                )
+        except (OSError, ValueError):
+            yield b"", 0, 0
+            return
+
+        if mapped is None:
+            yield data, 0, count
+            return
+
+        try:
+            yield mapped, position - offset, len(mapped)
+        finally:
+            mapped.close()
+
+    def _split_lines(
+        self, buf: Union[bytes, mmap.mmap], start: int, end: int
+    ) -> Tuple[List[bytes], bytes]:
+        """Split buf[start:end] into complete lines and a trailing remainder.
 
-    def _parse_lines(self, data: bytes) -> Tuple[List[dict], str]:
-        """Parse complete JSON lines from data.
+        Any partial line buffered from previous reads is joined onto the
+        first line, so its pieces are copied exactly once. Small reads are
+        scanned with bytes.find (a C-level memchr) one line at a time; reads of at least _SPLIT_THRESHOLD
+        bytes locate every line with a single bytes.split call, which
+        avoids one interpreter loop iteration per line on catch-up reads.
 
         Args:
-            data: Raw bytes read from file
+            buf: Raw bytes read from file (bytes or memory map)
+            start: Offset of the first new byte in buf
+            end: Offset just past the last new byte
 
         Returns:
-            Tuple of (parsed entries, remaining incomplete line)
+            Tuple of (complete lines, new bytes after the last newline)
         """
-        # Decode and prepend any buffered partial line
-        try:
-            text = self.state.line_buffer + data.decode("utf-8")
-        except UnicodeDecodeError:
-            # Try with error handling
-            text = self.state.line_buffer + data.decode("utf-8", errors="replace")
+        state = self.state
+
+        if end - start >= _SPLIT_THRESHOLD:
+            last_nl = buf.rfind(b"\n", start, end)
+            if last_nl == -1:
+                return [], buf[start:end]
+
+            lines = buf[start:last_nl].split(b"\n")
+            if state.pending_chunks:
+                state.pending_chunks.append(lines[0])
+                lines[0] = b"".join(state.pending_chunks)
+                state.clear_pending()
+            return lines, buf[last_nl + 1:end]
+
+        lines: List[bytes] = []
+        while True:
+            nl = buf.find(b"\n", start, end)
+            if nl == -1:
+                break
+
+            line = buf[start:nl]
+            start = nl + 1
 
-        lines = text.split("\n")
+            # Complete any partial line left over from previous reads
+            if state.pending_chunks:
+                state.pending_chunks.append(line)
+                line = b"".join(state.pending_chunks)
+                state.clear_pending()
+
+            lines.append(line)
+
+        # Whatever follows the last newline is an incomplete line
+        return lines, buf[start:end]
+
+    def _read_lines(self, max_bytes: Optional[int] = None) -> List[bytes]:
+        """Read new bytes and return the complete lines among them.
+
+        Advances the position past everything read and buffers any
+        trailing partial line.
+
+        Args:
+            max_bytes: Read at most this many bytes (default: all new data)
+
+        Returns:
+            Complete raw lines (may be empty)
+        """
+        # Check for rotation/truncation first
+        size = self._check_rotation()
+        if size is None or size <= self.state.position:
+            return []
+        if max_bytes is not None:
+            size = min(size, self.state.position + max_bytes)
+
+        with self._read_view(size) as (buf, start, end):
+            if start == end:
+                return []
+
+            # Lines are copies, so they outlive the read view
+            lines, incomplete = self._split_lines(buf, start, end)
+
+            # Update state
+            self.state.position += end - start
+            if incomplete:
+                self.state.add_pending(incomplete)
+
+        if self._sidecar_path is not None:
+            self._reads_since_save += 1
+            if self._reads_since_save >= _SAVE_INTERVAL:
+                self._save_quietly()
+
+        return lines
+
+    def _parse_lines(self, lines: List[bytes]) -> List[dict]:
+        """Parse complete JSON lines.
+
+        Lines are handed to the JSON parser (orjson when installed, else
+        json) as bytes, so the data is never decoded to str as a whole.
+
+        Args:
+            lines: Complete raw lines
+
+        Returns:
+            Parsed entries, with malformed and blank lines skipped
+        """
         entries: List[dict] = []
+        lazy = self._lazy
 
-        # Last element is incomplete line (or empty if text ends with \n)
-        incomplete = lines[-1]
-        complete_lines = lines[:-1]
+        for line in lines:
+            # Blank lines (including CRLF blanks) are skipped without
+            # allocating a stripped copy; whitespace-only lines fail to
+            # parse below and are dropped there
+            if not line or line == b"\r":
+                continue
+
+            if lazy:
+                entry_type = _peek_type(line)
+                if entry_type in _LAZY_TYPES:
+                    entries.append(LazyEntry(line, entry_type))
+                    continue
 
-        for line in complete_lines:
-            line = line.strip()
-            if not line:
+            if not _looks_like_json(line):
                 continue
 
             try:
-                entry = json.loads(line)
-                entries.append(entry)
-            except json.JSONDecodeError:
+                entries.append(_loads(line))
+            except ValueError:
                 # Skip malformed lines - caller can handle via ErrorEvent
-                pass
+                entry = _loads_lenient(line)
+                if entry is not None:
+                    entries.append(entry)
 
-        return entries, incomplete
+        return entries
 
     def read_new(self) -> List[dict]:
         """Read and parse any new entries since last read.
@@ -150,24 +860,95 @@ class JSONLTailer:
         any new entries, or an empty list if no new data.
 
         Returns:
-            List of parsed JSON entries (may be empty)
+            List of parsed JSON entries (may be empty); in lazy mode,
+            entries of known types are LazyEntry mappings
         """
-        # Check for rotation/truncation first
-        self._check_rotation()
-
-        # Read new bytes
-        data = self._read_bytes()
-        if not data:
+        lines = self._read_lines()
+        if not lines:
             return []
+        return self._parse_lines(lines)
 
-        # Parse complete lines
-        entries, incomplete = self._parse_lines(data)
+    def iter_new(self, chunk_size: int = _ITER_CHUNK) -> Iterator[dict]:
+        """Yield new entries, reading the file in bounded chunks.
 
-        # Update state
-        self.state.position += len(data)
-        self.state.line_buffer = incomplete
+        Unlike read_new(), memory stays proportional to chunk_size rather
+        than to the amount of new data, which matters when catching up on
+        a large session. Each chunk is read only after the entries of the
+        previous one have been consumed.
 
-        return entries
+        Args:
+            chunk_size: Maximum bytes read per step
+
+        Yields:
+            Parsed JSON entries (LazyEntry mappings in lazy mode)
+        """
+        while True:
+            before = self.state.position
+            lines = self._read_lines(chunk_size)
+            advanced = self.state.position - before
+            if lines:
+                yield from self._parse_lines(lines)
+            # A short read means the end of the file was reached
+            if advanced < chunk_size:
+                return
+
+    def read_batch(self) -> EntryBatch:
+        """Read new entries as an unparsed EntryBatch.
+
+        Like read_new(), but no line is parsed until the batch is
+        iterated, so callers that filter by entry type with
+        EntryBatch.select() only parse the entries they keep.
+
+        Returns:
+            Batch of new entries (may be empty)
+        """
+        batch = EntryBatch()
+        for line in self._read_lines():
+            if not line or line == b"\r":
+                continue
+            batch.types.append(_peek_type(line))
+            batch.raw.append(line)
+        return batch
+
+    def _save_quietly(self) -> None:
+        """Save to the resume sidecar, ignoring write failures."""
+        try:
+            self.save_state()
+        except OSError:
+            pass
+
+    def read_into(self, ring: EntryRing) -> int:
+        """Push new raw lines into a ring instead of returning a list.
+
+        Applies back-pressure: while the ring is full nothing new is read,
+        so unconsumed data stays in the file. Lines read that did not fit
+        are held by the tailer and pushed first on the next call.
+
+        Args:
+            ring: Ring shared with the consumer
+
+        Returns:
+            Number of lines pushed
+        """
+        pushed = 0
+        pending = self._overflow
+        if not pending:
+            if not ring.free:
+                return 0
+            pending = self._read_lines()
+
+        index = 0
+        for index, line in enumerate(pending):
+            if not line or line == b"\r":
+                continue
+            if not ring.push(line):
+                break
+            pushed += 1
+        else:
+            index = len(pending)
+
+        self._overflow = pending[index:]
+        return pushed
 
     def tail(self) -> Iterator[dict]:
         """Yield new entries as they appear (single pass).
@@ -191,13 +972,62 @@ class JSONLTailer:
             List of all parsed JSON entries
         """
         self.reset()
+        fd = self._open_fd()
+        if fd is not None:
+            # Start pulling the whole file into the page cache up front
+            _fadvise(fd, _FADV_WILLNEED)
         return self.read_new()
 
+    async def read_all_async(self) -> List[dict]:
+        """Read all entries from beginning of file without blocking the loop.
+
+        Runs read_all() in the default thread executor so an event loop
+        (for example a TUI) keeps running while a large session is parsed.
+        Do not use the tailer from other threads until this completes.
+
+        Returns:
+            List of all parsed JSON entries
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.read_all)
+
     def reset(self) -> None:
         """Reset to beginning of file."""
+        self._close_fd()
         self.state.reset()
+        self._overflow = []
         self._update_inode()
 
+    def close(self) -> None:
+        """Release the underlying file descriptor.
+
+        The tailer remains usable; the file is reopened on the next read.
+        When resume_from was given, the position is saved first.
+        """
+        if self._sidecar_path is not None:
+            self._save_quietly()
+            sidecar_fd, self._sidecar_fd = self._sidecar_fd, None
+            if sidecar_fd is not None:
+                os.close(sidecar_fd)
+        self._close_fd()
+
+    def __enter__(self) -> "JSONLTailer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        state = getattr(self, "state", None)
+        if state is not None and state.fd is not None:
+            self._close_fd()
+        sidecar_fd = getattr(self, "_sidecar_fd", None)
+        if sidecar_fd is not None:
+            try:
+                os.close(sidecar_fd)
+            except OSError:
+                pass
+
     @property
     def position(self) -> int:
         """Current byte position in file."""
@@ -211,7 +1041,24 @@ class JSONLTailer:
     @property
     def has_pending_data(self) -> bool:
         """Whether there's buffered incomplete data."""
-        return bool(self.state.line_buffer)
+        return self.state.pending_len > 0
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Forward file system events to a MultiFileTailer."""
+
+    def __init__(self, owner: "MultiFileTailer"):
+        super().__init__()
+        self._owner = owner
+
+    def on_any_event(self, event: Any) -> None:
+        if event.is_directory:
+            return
+        self._owner._mark_changed(event.src_path)
+        # Renames onto a tailed path (log rotation) report it as dest_path
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            self._owner._mark_changed(dest_path)
 
 
 class MultiFileTailer:
@@ -223,6 +1070,16 @@ class MultiFileTailer:
         >>> tailer = MultiFileTailer([main_file, agent_file1, agent_file2])
         >>> for file_path, entry in tailer.read_new():
         ...     print(f"{file_path.name}: {entry.get('type')}")
+
+    Instead of polling every file on a timer, wait_for_changes() blocks
+    until the OS reports a write and returns only the tailers that need
+    reading, so idle files cost no syscalls between modifications.
+
+    Example (change-driven):
+        >>> while True:
+        ...     for tailer in multi.wait_for_changes(timeout=1.0):
+        ...         for entry in tailer.read_new():
+        ...             print(entry.get("type"))
     """
 
     def __init__(self, file_paths: List[Path]):
@@ -232,6 +1089,15 @@ class MultiFileTailer:
             file_paths: List of paths to JSONL files to tail
         """
         self._tailers = {path: JSONLTailer(path) for path in file_paths}
+        # Flat snapshot of _tailers for the poll loop, rebuilt on add/remove
+        self._pairs: Tuple[Tuple[Path, JSONLTailer], ...] = tuple(self._tailers.items())
+
+        # Change notification state, set up lazily by wait_for_changes()
+        self._by_abspath: Dict[str, JSONLTailer] = {}
+        self._changed: Set[str] = set()
+        self._cond = threading.Condition()
+        self._observer: Optional[Any] = None
+        self._watched_dirs: Set[str] = set()
 
     def add_file(self, file_path: Path) -> None:
         """Add a new file to tail.
@@ -241,6 +1107,9 @@ class MultiFileTailer:
         """
         if file_path not in self._tailers:
             self._tailers[file_path] = JSONLTailer(file_path)
+            self._pairs = tuple(self._tailers.items())
+            if self._observer is not None:
+                self._watch(file_path)
 
     def remove_file(self, file_path: Path) -> None:
         """Remove a file from tailing.
@@ -248,7 +1117,12 @@ class MultiFileTailer:
         Args:
             file_path: Path to remove
         """
-        self._tailers.pop(file_path, None)
+        tailer = self._tailers.pop(file_path, None)
+        if tailer is not None:
+            tailer.close()
+            self._pairs = tuple(self._tailers.items())
+            with self._cond:
+                self._by_abspath.pop(os.path.abspath(file_path), None)
 
     def read_new(self) -> List[Tuple[Path, dict]]:
         """Read new entries from all files.
@@ -258,17 +1132,119 @@ class MultiFileTailer:
         """
         results: List[Tuple[Path, dict]] = []
 
-        for file_path, tailer in self._tailers.items():
-            for entry in tailer.read_new():
-                results.append((file_path, entry))
+        for file_path, tailer in self._pairs:
+            entries = tailer.read_new()
+            if entries:
+                results.extend([(file_path, entry) for entry in entries])
 
         return results
 
+    def _watch(self, file_path: Path) -> None:
+        """Register a file with the change observer."""
+        abspath = os.path.abspath(file_path)
+        with self._cond:
+            self._by_abspath[abspath] = self._tailers[file_path]
+            # Anything written before the watch existed still needs reading
+            self._changed.add(abspath)
+
+        directory = os.path.dirname(abspath)
+        if directory not in self._watched_dirs:
+            self._observer.schedule(_ChangeHandler(self), directory, recursive=False)
+            self._watched_dirs.add(directory)
+
+    def _mark_changed(self, path: str) -> None:
+        """Record a change reported by the observer thread."""
+        with self._cond:
+            if path in self._by_abspath:
+                self._changed.add(path)
+                self._cond.notify_all()
+
+    def _start_observer(self) -> bool:
+        """Start the watchdog observer on first use.
+
+        Returns:
+            True if change notifications are active
+        """
+        if self._observer is not None:
+            return True
+        if not WATCHDOG_AVAILABLE:
+            return False
+
+        try:
+            self._observer = Observer()
+            for file_path in self._tailers:
+                self._watch(file_path)
+            self._observer.start()
+        except Exception:
+            self._observer = None
+            self._watched_dirs.clear()
+            return False
+        return True
+
+    def _poll_changes(self) -> List[JSONLTailer]:
+        """Return tailers whose file size differs from their read position."""
+        changed = []
+        for file_path, tailer in self._pairs:
+            try:
+                if os.stat(file_path).st_size != tailer.position:
+                    changed.append(tailer)
+            except OSError:
+                continue
+        return changed
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> List[JSONLTailer]:
+        """Block until tailed files change and return their tailers.
+
+        Uses watchdog's native backend (inotify on Linux) when installed,
+        so no file is stat-ed until the OS reports a write, rename or
+        delete. Without watchdog, falls back to comparing file sizes
+        every _FALLBACK_POLL_INTERVAL seconds until something changes or
+        the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Tailers whose files changed; empty if the timeout expired
+        """
+        if not self._start_observer():
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                changed = self._poll_changes()
+                if changed:
+                    return changed
+                if deadline is None:
+                    delay = _FALLBACK_POLL_INTERVAL
+                else:
+                    delay = min(deadline - time.monotonic(), _FALLBACK_POLL_INTERVAL)
+                    if delay <= 0:
+                        return changed
+                time.sleep(delay)
+
+        with self._cond:
+            if not self._changed:
+                self._cond.wait(timeout)
+            changed, self._changed = self._changed, set()
+            return [self._by_abspath[p] for p in changed if p in self._by_abspath]
+
     def reset(self) -> None:
         """Reset all tailers to beginning of their files."""
         for tailer in self._tailers.values():
             tailer.reset()
 
+    def close(self) -> None:
+        """Release the file descriptors held by all tailers.
+
+        Also stops the change observer if wait_for_changes() started one.
+        """
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2.0)
+            self._watched_dirs.clear()
+        for tailer in self._tailers.values():
+            tailer.close()
+
     @property
     def file_paths(self) -> List[Path]:
         """List of files being tailed."""
@@ -19,13 +19,17 @@ Example usage:
     watcher.start()  # Blocks until Ctrl+C
 """
 
+import asyncio
 import logging
+import os
 import threading
 import time
+from collections import OrderedDict, deque
+from itertools import chain
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     from .live import LiveSessionConfig, LiveSessionManager
@@ -47,17 +51,74 @@ from .tailer import JSONLTailer
 try:
     from watchdog.events import FileSystemEventHandler, FileModifiedEvent, FileCreatedEvent
     from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
 
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
     FileSystemEventHandler = object  # type: ignore
     Observer = None  # type: ignore
+    PollingObserver = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Events buffered per session read before being dispatched together
+_EMIT_BATCH = 256
 
-@dataclass
+# Filesystems where inotify/FSEvents miss changes made by other hosts
+_NETWORK_FS_TYPES = frozenset(
+    {"nfs", "nfs4", "cifs", "smbfs", "smb3", "9p", "afs", "fuse.sshfs", "ceph"}
+)
+
+
+def _is_network_filesystem(path: Path, mounts_file: str = "/proc/mounts") -> bool:
+    """Check whether a path lives on a network filesystem.
+
+    Uses /proc/mounts, so detection only works on Linux; elsewhere this
+    returns False.
+
+    Args:
+        path: Path to check
+        mounts_file: Mount table to read
+
+    Returns:
+        True if the longest matching mount point has a network fs type
+    """
+    try:
+        with open(mounts_file) as f:
+            mounts = f.read().splitlines()
+    except OSError:
+        return False
+
+    target = os.path.realpath(path)
+    best_mount = ""
+    best_type = ""
+    for line in mounts:
+        parts = line.split()
+        if len(parts) < 3:
+            continue
+        # Mount points escape spaces as \040
+        mount_point = parts[1].replace("\\040", " ")
+        if (
+            target == mount_point
+            or target.startswith(mount_point.rstrip("/") + "/")
+        ) and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, parts[2]
+
+    return best_type in _NETWORK_FS_TYPES
+
+
+def _path_key(path: Union[str, Path]) -> str:
+    """Normalize a path for the file-to-session table.
+
+    Watchdog reports paths built from the watched directory, while
+    discovery builds them from the configured base path; resolving both
+    makes relative, ``..`` and symlinked spellings of one file agree.
+    """
+    return os.path.realpath(path)
+
+
+@dataclass(slots=True)
 class WatcherConfig:
     """Configuration for SessionWatcher.
 
@@ -73,6 +134,20 @@ class WatcherConfig:
         state_file: Path to save/load watcher state for resumable watching.
             If None (default), state is not persisted.
         save_interval: How often to auto-save state when state_file is set.
+        force_polling: Use watchdog's PollingObserver instead of the native
+            (inotify/FSEvents) observer. Native events cost nothing while
+            idle but are not delivered for changes made on other hosts of
+            a network filesystem; polling works everywhere at the cost of
+            periodic directory scans. Polling is also chosen
+            automatically when projects_path is on NFS/CIFS/9p.
+        observer_timeout: Scan interval in seconds for the PollingObserver.
+        max_pending_events: Maximum number of file events buffered between
+            poll cycles. If more arrive, the oldest are dropped and the next
+            cycle rescans the projects directory instead.
+        session_filter: Optional predicate on session IDs. Sessions it
+            rejects are never tracked, which lets several watchers split
+            one projects directory between them. If None (default), every
+            session is tracked.
     """
 
     base_path: Path = field(default_factory=lambda: Path.home() / ".claude")
@@ -85,6 +160,10 @@ class WatcherConfig:
     max_input_length: int = 1024
     state_file: Optional[Path] = None
     save_interval: timedelta = field(default_factory=lambda: timedelta(seconds=30))
+    force_polling: bool = False
+    observer_timeout: float = 1.0
+    max_pending_events: int = 8192
+    session_filter: Optional[Callable[[str], bool]] = None
 
     @property
     def projects_path(self) -> Path:
@@ -92,7 +171,7 @@ class WatcherConfig:
         return self.base_path / "projects"
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackedSession:
     """Internal state for a tracked session.
 
@@ -103,7 +182,7 @@ class TrackedSession:
     session_id: str
     project_slug: str
     file_path: Path
-    tailer: JSONLTailer
+    tailer: Optional[JSONLTailer]  # None once the session has ended
 
     # Timestamps
     discovered_at: datetime = field(
@@ -128,25 +207,29 @@ class TrackedSession:
     # Related agent files
     agent_files: Dict[str, JSONLTailer] = field(default_factory=dict)
 
-    def update_activity(self) -> bool:
+    def update_activity(self, now: Optional[datetime] = None) -> bool:
         """Mark session as active.
 
+        Args:
+            now: Current time (default: datetime.now(timezone.utc)).
+
         Returns:
             True if session was previously idle (resumed), False otherwise.
         """
         was_idle = self.is_idle
 
-        self.last_activity = datetime.now(timezone.utc)
+        self.last_activity = now or datetime.now(timezone.utc)
         self.is_idle = False
         self.idle_since = None
 
         return was_idle
 
-    def check_idle(self, timeout: timedelta) -> bool:
+    def check_idle(self, timeout: timedelta, now: Optional[datetime] = None) -> bool:
         """Check if session has become idle.
 
         Args:
             timeout: Duration after which session is considered idle.
+            now: Current time (default: datetime.now(timezone.utc)).
 
         Returns:
             True if session just became idle, False otherwise.
@@ -154,18 +237,21 @@ class TrackedSession:
         if self.is_idle or self.is_ended:
             return False
 
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
         if now - self.last_activity > timeout:
             self.is_idle = True
             self.idle_since = self.last_activity
             return True
         return False
 
-    def check_ended(self, end_timeout: timedelta) -> bool:
+    def check_ended(
+        self, end_timeout: timedelta, now: Optional[datetime] = None
+    ) -> bool:
         """Check if idle session should be considered ended.
 
         Args:
             end_timeout: Duration after idle before session is ended.
+            now: Current time (default: datetime.now(timezone.utc)).
 
         Returns:
             True if session just ended, False otherwise.
@@ -176,7 +262,7 @@ class TrackedSession:
         if self.idle_since is None:
             return False
 
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
         if now - self.idle_since > end_timeout:
             self.is_ended = True
             return True
@@ -194,13 +280,13 @@ class SessionFileHandler(FileSystemEventHandler):
         if event.is_directory:
             return
         if event.src_path.endswith(".jsonl"):
-            self._watcher._queue_file_event("created", Path(event.src_path))
+            self._watcher._queue_file_event("created", event.src_path)
 
     def on_modified(self, event: Any) -> None:
         if event.is_directory:
             return
         if event.src_path.endswith(".jsonl"):
-            self._watcher._queue_file_event("modified", Path(event.src_path))
+            self._watcher._queue_file_event("modified", event.src_path)
 
 
 class SessionWatcher:
@@ -269,7 +355,20 @@ class SessionWatcher:
         self._sessions: Dict[str, TrackedSession] = {}
 
         # File path to session_id mapping
-        self._file_to_session: Dict[Path, str] = {}
+        # Keyed by _path_key() string so watchdog's src_path can be looked
+        # up without building a Path per event
+        self._file_to_session: Dict[str, str] = {}
+
+        # IDs of sessions that haven't ended, in discovery order (a dict
+        # used as an ordered set); guarded by _lock
+        self._active_session_ids: Dict[str, None] = {}
+
+        # Sessions waiting to go idle, least recently active first, and idle
+        # sessions waiting to end, longest idle first. Timeouts are fixed,
+        # so each order is also deadline order and timeout checks stop at
+        # the first session that isn't due. Only touched from the poll thread.
+        self._idle_order: "OrderedDict[str, None]" = OrderedDict()
+        self._end_order: "OrderedDict[str, None]" = OrderedDict()
 
         # Live session management (optional)
         self._live_manager: Optional["LiveSessionManager"] = None
@@ -292,11 +391,27 @@ class SessionWatcher:
 
         # Thread safety
         self._lock = threading.Lock()
-        self._pending_files: List[Tuple[str, Path]] = []
+
+        # File events from the watchdog thread. deque.append/popleft are
+        # atomic, so the producer never waits on _lock. The queue is bounded;
+        # _events_dropped records that an event storm overflowed it.
+        self._pending_files: Deque[Tuple[str, str]] = deque(
+            maxlen=self._config.max_pending_events
+        )
+        self._events_dropped = False
+
+        # Sessions with file changes reported by watchdog since the last
+        # poll cycle (only used while the observer is running)
+        self._dirty: Set[str] = set()
 
         # State
         self._running = False
+        # Serializes start/stop of the observer and persistence; stop can
+        # be reached from several threads (run_async, stop())
+        self._lifecycle_lock = threading.Lock()
         self._stop_event = threading.Event()
+        # Set when there may be work: a queued file event or stop()
+        self._wake = threading.Event()
         self._background_thread: Optional[threading.Thread] = None
 
     # --- Public API ---
@@ -366,10 +481,34 @@ class SessionWatcher:
         try:
             while not self._stop_event.is_set():
                 self._poll_cycle()
-                self._stop_event.wait(self._config.poll_interval)
+                self._wait_for_work()
         finally:
             self._stop_watching()
 
+    async def run_async(self) -> None:
+        """Watch for sessions on the running event loop.
+
+        Startup discovery, each poll cycle and the wait for the next one
+        run in worker threads via asyncio.to_thread, so the loop stays
+        free while files are read. Between cycles the watcher waits on
+        file events and timeout deadlines, as start() does, rather than
+        polling on a fixed interval. Returns once stop() is called.
+        Cancelling the task also stops watching.
+
+        Handlers are called from the worker thread, as with
+        start_background().
+        """
+        await asyncio.to_thread(self._start_watching)
+        try:
+            while not self._stop_event.is_set():
+                await asyncio.to_thread(self._poll_cycle)
+                await asyncio.to_thread(self._wait_for_work)
+        finally:
+            # On cancellation, release the worker blocked in _wait_for_work
+            self._stop_event.set()
+            self._wake.set()
+            await asyncio.to_thread(self._stop_watching)
+
     def start_background(self) -> None:
         """Start watching in a background thread.
 
@@ -385,6 +524,7 @@ class SessionWatcher:
     def stop(self) -> None:
         """Stop watching for sessions."""
         self._stop_event.set()
+        self._wake.set()
         if self._background_thread is not None:
             self._background_thread.join(timeout=5.0)
             self._background_thread = None
@@ -402,20 +542,15 @@ class SessionWatcher:
             while time.time() < deadline and not self._stop_event.is_set():
                 self._poll_cycle()
                 remaining = deadline - time.time()
-                wait_time = min(self._config.poll_interval, max(0, remaining))
-                if wait_time > 0:
-                    self._stop_event.wait(wait_time)
+                if remaining > 0:
+                    self._wait_for_work(remaining)
         finally:
             self._stop_watching()
 
     def get_active_sessions(self) -> List[str]:
         """Get list of active (non-ended) session IDs."""
         with self._lock:
-            return [
-                sid
-                for sid, ts in self._sessions.items()
-                if not ts.is_ended
-            ]
+            return list(self._active_session_ids)
 
     def get_session_stats(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get statistics for a tracked session.
@@ -457,23 +592,28 @@ class SessionWatcher:
 
     # --- Internal Methods ---
 
-    def _queue_file_event(self, action: str, path: Path) -> None:
+    def _queue_file_event(self, action: str, path: str) -> None:
         """Queue a file event from watchdog thread for processing.
 
         Args:
             action: "created" or "modified"
-            path: Path to the file.
+            path: Path to the file, as reported by watchdog.
         """
-        with self._lock:
-            self._pending_files.append((action, path))
+        pending = self._pending_files
+        if len(pending) == pending.maxlen:
+            self._events_dropped = True
+        pending.append((action, path))
+        self._wake.set()
 
     def _start_watching(self) -> None:
         """Initialize file watching."""
-        if self._running:
-            return
+        with self._lifecycle_lock:
+            if self._running:
+                return
+            self._running = True
 
-        self._running = True
         self._stop_event.clear()
+        self._wake.clear()
 
         # Start state persistence if configured
         if self._persistence is not None:
@@ -484,7 +624,7 @@ class SessionWatcher:
         if WATCHDOG_AVAILABLE and projects_path.exists():
             try:
                 self._handler = SessionFileHandler(self)
-                self._observer = Observer()
+                self._observer = self._create_observer(projects_path)
                 self._observer.schedule(
                     self._handler,
                     str(projects_path),
@@ -503,59 +643,165 @@ class SessionWatcher:
         if self._config.process_existing:
             self._discover_existing_sessions()
 
+    def _create_observer(self, projects_path: Path) -> Any:
+        """Pick the native observer, or polling for network filesystems."""
+        use_polling = self._config.force_polling
+        if not use_polling and _is_network_filesystem(projects_path):
+            logger.info(
+                "%s is on a network filesystem, using polling observer",
+                projects_path,
+            )
+            use_polling = True
+
+        if use_polling:
+            return PollingObserver(timeout=self._config.observer_timeout)
+        return Observer()
+
     def _stop_watching(self) -> None:
-        """Clean up file watching."""
-        # Stop state persistence (does final save)
-        if self._persistence is not None:
-            self._persistence.stop()
+        """Clean up file watching.
 
-        if self._observer is not None:
-            self._observer.stop()
-            self._observer.join(timeout=5.0)
-            self._observer = None
-        self._handler = None
-        self._running = False
+        Safe to call more than once and from several threads; only the
+        first call after _start_watching() does anything.
+        """
+        with self._lifecycle_lock:
+            if not self._running:
+                return
+
+            # Stop state persistence (does final save)
+            if self._persistence is not None:
+                self._persistence.stop()
+
+            if self._observer is not None:
+                self._observer.stop()
+                self._observer.join(timeout=5.0)
+                self._observer = None
+            self._handler = None
+            self._running = False
 
     def _background_loop(self) -> None:
         """Background thread main loop."""
         try:
             while not self._stop_event.is_set():
                 self._poll_cycle()
-                self._stop_event.wait(self._config.poll_interval)
+                self._wait_for_work()
         except Exception as e:
             logger.exception("Error in background loop: %s", e)
 
+    def _wait_for_work(self, limit: Optional[float] = None) -> None:
+        """Sleep until the next poll cycle is needed.
+
+        Without an observer, files have to be polled, so this waits
+        poll_interval. With one, changes arrive as queued file events,
+        so it waits until an event is queued, the earliest idle/end
+        deadline passes, or stop() is called.
+
+        Args:
+            limit: Maximum time to wait in seconds.
+        """
+        deadline = self._next_deadline()
+        if self._observer is None:
+            timeout: Optional[float] = self._config.poll_interval
+        elif deadline is not None:
+            due = deadline - datetime.now(timezone.utc)
+            timeout = max(due.total_seconds(), 0.0)
+        else:
+            timeout = None
+
+        if limit is not None:
+            timeout = limit if timeout is None else min(timeout, limit)
+
+        self._wake.wait(timeout)
+        self._wake.clear()
+
     def _poll_cycle(self) -> None:
-        """Single poll iteration - process pending events, read new data, check timeouts."""
+        """Single poll iteration - process pending events, read new data, check timeouts.
+
+        With watchdog running, only sessions whose files were reported as
+        modified are read; without it every tracked session is polled.
+        """
+        # One timestamp for everything this cycle does
+        now = datetime.now(timezone.utc)
+
         # Process pending file events from watchdog
         self._process_pending_file_events()
 
-        # Read new data from all tracked sessions
+        # Read new data from changed (or, without watchdog, all) sessions
         with self._lock:
-            sessions = list(self._sessions.items())
+            if self._observer is not None:
+                dirty, self._dirty = self._dirty, set()
+                sessions = [
+                    (sid, self._sessions[sid]) for sid in dirty if sid in self._sessions
+                ]
+            else:
+                sessions = list(self._sessions.items())
 
         for session_id, tracked in sessions:
             if tracked.is_ended:
                 continue
-            self._process_session_updates(tracked)
+            self._process_session_updates(tracked, now)
 
         # Check for idle/end timeouts
-        self._check_timeouts()
+        self._check_timeouts(now)
 
     def _process_pending_file_events(self) -> None:
-        """Process file events queued from watchdog."""
+        """Process file events queued from watchdog.
+
+        A burst of writes produces one modified event per write; events
+        are collapsed to one set of actions per path so each file is
+        handled once per cycle. A path that was both created and modified
+        is handled as both, so writes following the creation are read.
+        """
+        pending: Dict[str, Set[str]] = {}
+        popleft = self._pending_files.popleft
+        try:
+            while True:
+                action, path = popleft()
+                actions = pending.get(path)
+                if actions is None:
+                    pending[path] = {action}
+                else:
+                    actions.add(action)
+        except IndexError:
+            pass
+
+        for path, actions in pending.items():
+            for action in ("created", "modified"):
+                if action not in actions:
+                    continue
+                try:
+                    if action == "created":
+                        self._handle_file_created(path)
+                    else:
+                        self._handle_file_modified(path)
+                except Exception as e:
+                    logger.warning(
+                        "Error processing file event %s %s: %s", action, path, e
+                    )
+
+        if self._events_dropped:
+            self._events_dropped = False
+            self._recover_dropped_events()
+
+    def _recover_dropped_events(self) -> None:
+        """Catch up after file events were dropped from a full queue.
+
+        The dropped events may have announced new sessions or agent files
+        or modified tracked ones, so the directory is rescanned and every
+        active session is read on this cycle.
+        """
+        logger.warning(
+            "More than %d file events queued; rescanning %s",
+            self._config.max_pending_events,
+            self._config.projects_path,
+        )
+        self._discover_existing_sessions()
+
         with self._lock:
-            pending = list(self._pending_files)
-            self._pending_files.clear()
+            active = [self._sessions[sid] for sid in self._active_session_ids]
+            self._dirty.update(self._active_session_ids)
 
-        for action, path in pending:
-            try:
-                if action == "created":
-                    self._handle_file_created(path)
-                elif action == "modified":
-                    self._handle_file_modified(path)
-            except Exception as e:
-                logger.warning("Error processing file event %s %s: %s", action, path, e)
+        for tracked in active:
+            self._discover_agent_files(tracked)
 
     def _discover_existing_sessions(self) -> None:
         """Scan for existing session files on startup."""
@@ -564,76 +810,129 @@ class SessionWatcher:
             logger.debug("Projects path does not exist: %s", projects_path)
             return
 
-        for project_dir in projects_path.iterdir():
-            if not project_dir.is_dir():
-                continue
+        # scandir exposes d_type, so filtering by name and type needs no
+        # extra stat calls, and Paths are only built for tracked files
+        with os.scandir(projects_path) as projects:
+            project_dirs = [
+                entry for entry in projects if entry.is_dir(follow_symlinks=True)
+            ]
 
+        for project_dir in project_dirs:
             project_slug = project_dir.name
 
-            for jsonl_file in project_dir.glob("*.jsonl"):
-                # Skip agent files - they'll be associated with sessions
-                if jsonl_file.stem.startswith("agent-"):
-                    continue
+            try:
+                with os.scandir(project_dir.path) as it:
+                    names = [
+                        entry.name
+                        for entry in it
+                        if entry.name.endswith(".jsonl")
+                        # Skip agent files - they'll be associated with sessions
+                        and not entry.name.startswith("agent-")
+                    ]
+            except OSError:
+                continue
 
-                session_id = jsonl_file.stem
-                with self._lock:
-                    if session_id not in self._sessions:
-                        self._track_session(session_id, project_slug, jsonl_file)
+            for name in names:
+                session_id = name[: -len(".jsonl")]
+                self._track_session(
+                    session_id, project_slug, Path(project_dir.path) / name
+                )
 
-    def _handle_file_created(self, file_path: Path) -> None:
-        """Handle new file creation."""
-        try:
-            project_slug = file_path.parent.name
-        except Exception:
+    def _handle_file_created(self, path: str) -> None:
+        """Handle new file creation.
+
+        The observer starts before the startup scan, so a created event can
+        arrive for a file that is already tracked. That file is marked
+        dirty like a modification, so writes coalesced into the event are
+        still read.
+        """
+        if self._handle_file_modified(path):
             return
 
+        file_path = Path(path)
+        project_slug = file_path.parent.name
+
         filename = file_path.stem
 
         if filename.startswith("agent-"):
             # Agent file - associate with parent session
-            self._handle_agent_file(file_path, project_slug)
+            self._register_agent_file(file_path)
         else:
             # Main session file
-            session_id = filename
-            with self._lock:
-                if session_id not in self._sessions:
-                    self._track_session(session_id, project_slug, file_path)
+            self._track_session(filename, project_slug, file_path)
+
+    def _handle_file_modified(self, path: str) -> bool:
+        """Handle file modification by marking its session dirty.
 
-    def _handle_file_modified(self, file_path: Path) -> None:
-        """Handle file modification."""
+        Returns:
+            True if the file belongs to a tracked session.
+        """
         with self._lock:
-            session_id = self._file_to_session.get(file_path)
-            if session_id:
-                tracked = self._sessions.get(session_id)
-                if tracked and not tracked.is_ended:
-                    # Will be processed in next poll cycle
-                    pass
+            session_id = self._file_to_session.get(_path_key(path))
+            if not session_id:
+                return False
+            tracked = self._sessions.get(session_id)
+            if tracked and not tracked.is_ended:
+                # Will be read in this poll cycle
+                self._dirty.add(session_id)
+            return True
 
     def _track_session(
         self,
         session_id: str,
         project_slug: str,
         file_path: Path,
-    ) -> TrackedSession:
-        """Start tracking a new session.
+    ) -> Optional[TrackedSession]:
+        """Start tracking a session and read its existing content.
 
-        Note: Must be called with self._lock held.
+        Returns:
+            The new TrackedSession, or None if the session was already tracked
+            or is rejected by the configured session_filter.
         """
-        tailer = JSONLTailer(file_path)
+        session_filter = self._config.session_filter
+        if session_filter is not None and not session_filter(session_id):
+            return None
 
-        # Restore position from persisted state if available
-        if self._persistence is not None:
-            self._persistence.apply_to_tailer(tailer)
+        tracked = self._register_session(session_id, project_slug, file_path)
+        if tracked is not None:
+            # Initial reads and event emission happen without the lock held
+            self._process_session_updates(tracked)
+            # Look for associated agent files
+            self._discover_agent_files(tracked)
+        return tracked
 
-        tracked = TrackedSession(
-            session_id=session_id,
-            project_slug=project_slug,
-            file_path=file_path,
-            tailer=tailer,
-        )
+    def _register_session(
+        self,
+        session_id: str,
+        project_slug: str,
+        file_path: Path,
+    ) -> Optional[TrackedSession]:
+        """Add a session to the tracking tables and emit its start event.
+
+        Returns:
+            The new TrackedSession, or None if the session was already tracked.
+        """
+        with self._lock:
+            if session_id in self._sessions:
+                return None
 
-        self._sessions[session_id] = tracked
-        self._file_to_session[file_path] = session_id
+            tailer = JSONLTailer(file_path)
+
+            # Restore position from persisted state if available
+            if self._persistence is not None:
+                self._persistence.apply_to_tailer(tailer)
+
+            tracked = TrackedSession(
+                session_id=session_id,
+                project_slug=project_slug,
+                file_path=file_path,
+                tailer=tailer,
+            )
+
+            self._sessions[session_id] = tracked
+            self._file_to_session[_path_key(file_path)] = session_id
+            self._active_session_ids[session_id] = None
+            self._schedule_idle_check(tracked)
 
         # Emit session start event
         if self._config.emit_session_events:
@@ -646,68 +945,94 @@ class SessionWatcher:
                 )
             )
 
-        # Process initial content (release lock temporarily)
-        # We need to release lock to avoid deadlock during event emission
-        self._lock.release()
-        try:
-            self._process_session_updates(tracked)
-            # Look for associated agent files
-            self._discover_agent_files(tracked)
-        finally:
-            self._lock.acquire()
-
         return tracked
 
-    def _handle_agent_file(self, file_path: Path, project_slug: str) -> None:
-        """Associate an agent file with its parent session."""
-        # Read first entry to get session_id
-        tailer = JSONLTailer(file_path)
-        entries = tailer.read_new()
+    def _register_agent_file(self, file_path: Path) -> None:
+        """Associate an agent file with its parent session and read it.
 
-        if not entries:
-            return
+        Both the created-event path and agent discovery come through here.
+        A file already claimed by a session is skipped before anything is
+        read, and the claim itself is made under the lock, so an agent file
+        is never tailed twice.
+        """
+        key = _path_key(file_path)
+        with self._lock:
+            if key in self._file_to_session:
+                return
 
-        session_id = entries[0].get("sessionId")
-        if not session_id:
-            return
+        # Read first entry to get session_id
+        tailer = JSONLTailer(file_path)
+        entries = tailer.iter_new()
+        first = next(entries, None)
+        session_id = first.get("sessionId") if first is not None else None
 
         with self._lock:
-            tracked = self._sessions.get(session_id)
-            if tracked:
+            tracked = self._sessions.get(session_id) if session_id else None
+            if (
+                tracked is None
+                # The parent session has already ended and released its files
+                or tracked.tailer is None
+                # Claimed by a concurrent registration
+                or key in self._file_to_session
+            ):
+                tracked = None
+            else:
                 agent_id = file_path.stem  # "agent-{short_id}"
                 tracked.agent_files[agent_id] = tailer
+                self._file_to_session[key] = session_id
 
-        # Process the entries we already read
-        if tracked:
-            for entry in entries:
-                self._process_entry(tracked, entry)
+        if tracked is None:
+            tailer.close()
+            return
+
+        # Process the first entry and stream the rest
+        for entry in chain((first,), entries):
+            self._process_entry(tracked, entry)
 
     def _discover_agent_files(self, tracked: TrackedSession) -> None:
         """Find existing agent files for a session."""
         project_dir = tracked.file_path.parent
 
-        for agent_file in project_dir.glob("agent-*.jsonl"):
-            if agent_file.stem in tracked.agent_files:
-                continue
+        try:
+            with os.scandir(project_dir) as it:
+                names = [
+                    entry.name
+                    for entry in it
+                    if entry.name.startswith("agent-") and entry.name.endswith(".jsonl")
+                ]
+        except OSError:
+            return
+
+        for name in names:
+            self._register_agent_file(project_dir / name)
 
-            # Check if it belongs to this session
-            tailer = JSONLTailer(agent_file)
-            entries = tailer.read_new()
+    def _process_session_updates(
+        self, tracked: TrackedSession, now: Optional[datetime] = None
+    ) -> None:
+        """Read and process new entries from a session.
 
-            if entries and entries[0].get("sessionId") == tracked.session_id:
-                tracked.agent_files[agent_file.stem] = tailer
-                for entry in entries:
-                    self._process_entry(tracked, entry)
+        Args:
+            tracked: Session to read.
+            now: Timestamp of the current poll cycle (default: now).
+        """
+        if tracked.tailer is None:
+            return
 
-    def _process_session_updates(self, tracked: TrackedSession) -> None:
-        """Read and process new entries from a session."""
+        now = now or datetime.now(timezone.utc)
         had_activity = False
 
+        # Events are dispatched in batches to amortize handler lookup
+        pending: List[SessionEventType] = []
+        emit_many = self._emitter.emit_many
+
         # Read main session file
         try:
-            for entry in tracked.tailer.read_new():
-                self._process_entry(tracked, entry)
+            for entry in tracked.tailer.iter_new():
+                self._process_entry(tracked, entry, now, pending)
                 had_activity = True
+                if len(pending) >= _EMIT_BATCH:
+                    emit_many(pending)
+                    pending.clear()
         except Exception as e:
             logger.warning(
                 "Error reading session file %s: %s", tracked.file_path, e
@@ -716,15 +1041,22 @@ class SessionWatcher:
         # Read agent files
         for agent_id, tailer in list(tracked.agent_files.items()):
             try:
-                for entry in tailer.read_new():
-                    self._process_entry(tracked, entry)
+                for entry in tailer.iter_new():
+                    self._process_entry(tracked, entry, now, pending)
                     had_activity = True
+                    if len(pending) >= _EMIT_BATCH:
+                        emit_many(pending)
+                        pending.clear()
             except Exception as e:
                 logger.warning("Error reading agent file %s: %s", agent_id, e)
 
+        if pending:
+            emit_many(pending)
+
         # Update activity if we had new data
         if had_activity:
-            was_idle = tracked.update_activity()
+            was_idle = tracked.update_activity(now)
+            self._schedule_idle_check(tracked)
 
             # Save tailer positions for resumability
             if self._persistence is not None:
@@ -734,26 +1066,42 @@ class SessionWatcher:
 
             # Emit resume event if coming back from idle
             if was_idle and tracked.idle_since:
-                idle_duration = datetime.now(timezone.utc) - tracked.idle_since
+                idle_duration = now - tracked.idle_since
                 self._emitter.emit(
                     SessionResumeEvent(
-                        timestamp=datetime.now(timezone.utc),
+                        timestamp=now,
                         session_id=tracked.session_id,
                         idle_duration=idle_duration,
                     )
                 )
 
-    def _process_entry(self, tracked: TrackedSession, entry: Dict[str, Any]) -> None:
-        """Process a single JSONL entry."""
+    def _process_entry(
+        self,
+        tracked: TrackedSession,
+        entry: Dict[str, Any],
+        now: Optional[datetime] = None,
+        pending: Optional[List[SessionEventType]] = None,
+    ) -> None:
+        """Process a single JSONL entry.
+
+        Args:
+            tracked: Session the entry belongs to.
+            entry: Parsed JSONL entry.
+            now: Timestamp of the current poll cycle, used for
+                synthesized events (default: now).
+            pending: If given, events are appended here for the caller
+                to dispatch instead of being emitted immediately.
+        """
         events = self._parser.parse_entry(entry)
+        emit = self._emitter.emit if pending is None else pending.append
 
         for event in events:
             # Update counters
             if event.event_type == "message":
                 tracked.message_count += 1
-                # Capture cwd from first message
-                if tracked.cwd is None and hasattr(event, "message"):
-                    tracked.cwd = getattr(event.message, "cwd", None)
+                # Capture cwd from first message that has one
+                if tracked.cwd is None:
+                    tracked.cwd = event.message.cwd
             elif event.event_type == "tool_use":
                 tracked.tool_count += 1
 
@@ -763,52 +1111,132 @@ class SessionWatcher:
 
                 # Emit ToolCallCompletedEvent when a tool call is paired
                 if completed_tool_call is not None:
-                    self._emitter.emit(
+                    emit(
                         ToolCallCompletedEvent(
-                            timestamp=datetime.now(timezone.utc),
+                            timestamp=now or datetime.now(timezone.utc),
                             session_id=tracked.session_id,
                             tool_call=completed_tool_call,
-                            agent_id=getattr(event, "agent_id", None),
+                            agent_id=event.agent_id,
                         )
                     )
 
             # Emit the event
-            self._emitter.emit(event)
+            emit(event)
+
+    def _schedule_idle_check(self, tracked: TrackedSession) -> None:
+        """Move a session to the back of the idle order after activity."""
+        session_id = tracked.session_id
+        self._end_order.pop(session_id, None)
+        self._idle_order[session_id] = None
+        self._idle_order.move_to_end(session_id)
+
+    def _next_deadline(self) -> Optional[datetime]:
+        """Earliest pending idle/end deadline, or None if nothing is due."""
+        deadlines = []
+        for order, timeout, attr in (
+            (self._idle_order, self._config.idle_timeout, "last_activity"),
+            (self._end_order, self._config.end_timeout, "idle_since"),
+        ):
+            if order:
+                tracked = self._sessions.get(next(iter(order)))
+                since = getattr(tracked, attr, None)
+                if since is not None:
+                    deadlines.append(since + timeout)
+        return min(deadlines, default=None)
+
+    def _check_timeouts(self, now: Optional[datetime] = None) -> None:
+        """Check sessions whose idle/end deadline has passed.
+
+        Args:
+            now: Timestamp of the current poll cycle (default: now).
+        """
+        now = now or datetime.now(timezone.utc)
+
+        # Deadlines are exclusive, matching the strict comparisons in
+        # TrackedSession.check_idle/check_ended
+        idle_order = self._idle_order
+        idle_timeout = self._config.idle_timeout
+        while idle_order:
+            session_id = next(iter(idle_order))
+            with self._lock:
+                tracked = self._sessions.get(session_id)
+            if tracked is not None and not tracked.is_ended:
+                if now - tracked.last_activity <= idle_timeout:
+                    break
+                self._fire_idle(tracked, now)
+            del idle_order[session_id]
+
+        end_order = self._end_order
+        end_timeout = self._config.end_timeout
+        while end_order:
+            session_id = next(iter(end_order))
+            with self._lock:
+                tracked = self._sessions.get(session_id)
+            if tracked is not None and tracked.idle_since is not None:
+                if now - tracked.idle_since <= end_timeout:
+                    break
+                self._fire_end(tracked, now)
+            del end_order[session_id]
+
+    def _fire_idle(self, tracked: TrackedSession, now: datetime) -> None:
+        """Mark a session idle and queue it to end."""
+        session_id = tracked.session_id
+
+        # Check for new idle
+        if tracked.check_idle(self._config.idle_timeout, now):
+            if self._config.emit_session_events and tracked.idle_since:
+                self._emitter.emit(
+                    SessionIdleEvent(
+                        timestamp=now,
+                        session_id=session_id,
+                        idle_since=tracked.idle_since,
+                    )
+                )
+
+            if tracked.idle_since is not None:
+                self._end_order[session_id] = None
+
+    def _release_session_files(self, tracked: TrackedSession) -> None:
+        """Close an ended session's tailers, keeping its statistics.
+
+        Ended sessions are never read again, so their file descriptors
+        and read buffers are released rather than held for the life of
+        the watcher.
+        """
+        tailers = list(tracked.agent_files.values())
+        if tracked.tailer is not None:
+            tailers.append(tracked.tailer)
 
-    def _check_timeouts(self) -> None:
-        """Check all sessions for idle/end timeouts."""
         with self._lock:
-            sessions = list(self._sessions.items())
+            for tailer in tailers:
+                self._file_to_session.pop(_path_key(tailer.file_path), None)
 
-        for session_id, tracked in sessions:
-            if tracked.is_ended:
-                continue
+        for tailer in tailers:
+            tailer.close()
+        tracked.tailer = None
+        tracked.agent_files.clear()
 
-            # Check for new idle
-            if tracked.check_idle(self._config.idle_timeout):
-                if self._config.emit_session_events and tracked.idle_since:
-                    self._emitter.emit(
-                        SessionIdleEvent(
-                            timestamp=datetime.now(timezone.utc),
-                            session_id=session_id,
-                            idle_since=tracked.idle_since,
-                        )
-                    )
+    def _fire_end(self, tracked: TrackedSession, now: datetime) -> None:
+        """End an idle session whose end deadline has passed."""
+        session_id = tracked.session_id
 
-            # Check for end (after idle)
-            if tracked.check_ended(self._config.end_timeout):
-                if self._config.emit_session_events:
-                    idle_duration = None
-                    if tracked.idle_since:
-                        idle_duration = datetime.now(timezone.utc) - tracked.idle_since
-
-                    self._emitter.emit(
-                        SessionEndEvent(
-                            timestamp=datetime.now(timezone.utc),
-                            session_id=session_id,
-                            reason="idle_timeout",
-                            idle_duration=idle_duration,
-                            message_count=tracked.message_count,
-                            tool_count=tracked.tool_count,
-                        )
+        if tracked.check_ended(self._config.end_timeout, now):
+            with self._lock:
+                self._active_session_ids.pop(session_id, None)
+            self._release_session_files(tracked)
+
+            if self._config.emit_session_events:
+                idle_duration = None
+                if tracked.idle_since:
+                    idle_duration = now - tracked.idle_since
+
+                self._emitter.emit(
+                    SessionEndEvent(
+                        timestamp=now,
+                        session_id=session_id,
+                        reason="idle_timeout",
+                        idle_duration=idle_duration,
+                        message_count=tracked.message_count,
+                        tool_count=tracked.tool_count,
                     )
+                )
@@ -22,6 +22,16 @@ Example usage:
     watcher.start()
     dispatcher.stop()
 
+For asyncio applications, AsyncWebhookDispatcher sends from the running
+event loop instead of one thread per webhook:
+
+    dispatcher = AsyncWebhookDispatcher()
+    dispatcher.add_webhook(WebhookConfig(url="https://example.com/webhook"))
+    watcher.on_any(dispatcher.handle_event)
+
+    async with dispatcher:
+        await watcher.run_async()
+
 The webhook payload format:
     {
         "events": [
@@ -39,14 +49,20 @@ The webhook payload format:
     }
 """
 
+import asyncio
+import gzip
+import heapq
+import itertools
 import json
 import logging
 import queue
+import random
+import socket
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
@@ -58,13 +74,65 @@ logger = logging.getLogger(__name__)
 # Try to import requests for better HTTP handling
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
 
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
 
-@dataclass
+# TCP keep-alive for pooled webhook connections, so a peer that went
+# away between batches is noticed after ~2.5 minutes instead of the
+# system default of 2 hours (the tuning options are Linux-only)
+_KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+for _name, _value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30), ("TCP_KEEPCNT", 3)):
+    if hasattr(socket, _name):
+        _KEEPALIVE_OPTIONS.append((socket.IPPROTO_TCP, getattr(socket, _name), _value))
+del _name, _value
+
+if REQUESTS_AVAILABLE:
+
+    class _KeepAliveAdapter(HTTPAdapter):
+        """HTTPAdapter whose sockets use TCP_NODELAY and TCP keep-alive."""
+
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            # urllib3's defaults already include TCP_NODELAY; keep them
+            kwargs["socket_options"] = (
+                HTTPConnection.default_socket_options + _KEEPALIVE_OPTIONS
+            )
+            super().init_poolmanager(*args, **kwargs)
+
+# Try to import orjson for faster payload serialization
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import aiohttp for AsyncWebhookDispatcher
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Try to import httpx (with its HTTP/2 support) for the http2 option
+try:
+    import h2  # noqa: F401
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Queue sentinel telling a dispatch loop to flush and exit
+_SHUTDOWN = object()
+
+
+@dataclass(slots=True)
 class WebhookConfig:
     """Configuration for a webhook endpoint.
 
@@ -72,24 +140,40 @@ class WebhookConfig:
         url: The webhook URL to send events to
         headers: HTTP headers to include in requests (e.g., auth tokens)
         event_filter: Optional filter function to select which events to send
+        event_types: Optional set of event types to send (e.g.
+            {"tool_use", "error"}); checked with a lookup table instead of
+            a per-event call, and combined with event_filter if both are set
         batch_size: Number of events to batch before sending (default: 10)
         batch_timeout: Max seconds to wait before sending incomplete batch (default: 5.0)
         max_retries: Maximum retry attempts for failed requests (default: 3)
         retry_backoff: Base seconds for exponential backoff (default: 1.0)
         timeout: Request timeout in seconds (default: 30.0)
+        gzip_threshold: Gzip request bodies of at least this many bytes and
+            send them with Content-Encoding: gzip (default: None, never;
+            only enable it for receivers that accept compressed bodies)
+        display_url: Shortened URL used in log messages and thread names
+            (derived from url, not an init argument)
     """
 
     url: str
     headers: Dict[str, str] = field(default_factory=dict)
     event_filter: Optional[Callable[[SessionEventType], bool]] = None
+    event_types: Optional[FrozenSet[str]] = None
     batch_size: int = 10
     batch_timeout: float = 5.0
     max_retries: int = 3
     retry_backoff: float = 1.0
     timeout: float = 30.0
+    gzip_threshold: Optional[int] = None
+    display_url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.event_types is not None:
+            self.event_types = frozenset(self.event_types)
+        self.display_url = self.url[:50]
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookPayload:
     """Payload sent to webhooks.
 
@@ -115,6 +199,82 @@ class WebhookPayload:
         """Serialize to JSON string."""
         return json.dumps(self.to_dict(), default=str, ensure_ascii=False)
 
+    def to_bytes(self) -> bytes:
+        """Serialize to UTF-8 encoded JSON, ready to be sent as a request body.
+
+        Uses orjson when available, which encodes straight to bytes in
+        one pass instead of building a str and then encoding it. The
+        bytes are only meant for the wire: orjson output is compact and
+        writes datetimes in RFC 3339 form with UTC as "Z", so it can
+        differ from to_json() while decoding to the same data.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                self.to_dict(),
+                default=str,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC,
+            )
+        return self.to_json().encode("utf-8")
+
+
+def _message_fields(event: Any, result: Dict[str, Any]) -> None:
+    result["role"] = event.message.role.value
+    result["text_preview"] = event.message.text_content[:500]
+    result["has_tool_calls"] = event.message.has_tool_calls
+
+
+def _tool_use_fields(event: Any, result: Dict[str, Any]) -> None:
+    result["tool_name"] = event.tool_name
+    result["tool_category"] = event.tool_category
+    result["tool_use_id"] = event.tool_use_id
+    # Don't include full tool_input as it can be large
+
+
+def _tool_result_fields(event: Any, result: Dict[str, Any]) -> None:
+    result["tool_use_id"] = event.tool_use_id
+    result["is_error"] = event.is_error
+    # Don't include full content as it can be very large
+
+
+def _tool_call_completed_fields(event: Any, result: Dict[str, Any]) -> None:
+    result["tool_name"] = event.tool_name
+    result["tool_use_id"] = event.tool_use_id
+    result["is_error"] = event.is_error
+    if event.duration:
+        result["duration_ms"] = event.duration.total_seconds() * 1000
+
+
+def _session_start_fields(event: Any, result: Dict[str, Any]) -> None:
+    result["project_slug"] = event.project_slug
+    result["file_path"] = str(event.file_path)
+
+
+def _session_end_fields(event: Any, result: Dict[str, Any]) -> None:
+    result["reason"] = event.reason
+    result["message_count"] = event.message_count
+    result["tool_count"] = event.tool_count
+
+
+def _session_resume_fields(event: Any, result: Dict[str, Any]) -> None:
+    result["idle_duration_seconds"] = event.idle_duration.total_seconds()
+
+
+def _error_fields(event: Any, result: Dict[str, Any]) -> None:
+    result["error_message"] = event.error_message
+
+
+# Type-specific fields, by event_type (session_idle has none)
+_FIELD_SERIALIZERS: Dict[str, Callable[[Any, Dict[str, Any]], None]] = {
+    "message": _message_fields,
+    "tool_use": _tool_use_fields,
+    "tool_result": _tool_result_fields,
+    "tool_call_completed": _tool_call_completed_fields,
+    "session_start": _session_start_fields,
+    "session_end": _session_end_fields,
+    "session_resume": _session_resume_fields,
+    "error": _error_fields,
+}
+
 
 def serialize_event(event: SessionEventType) -> Dict[str, Any]:
     """Serialize an event to a JSON-compatible dictionary.
@@ -125,8 +285,9 @@ def serialize_event(event: SessionEventType) -> Dict[str, Any]:
     Returns:
         JSON-serializable dictionary representation
     """
+    event_type = event.event_type
     result: Dict[str, Any] = {
-        "event_type": event.event_type,
+        "event_type": event_type,
         "timestamp": event.timestamp.isoformat(),
         "session_id": event.session_id,
     }
@@ -135,48 +296,202 @@ def serialize_event(event: SessionEventType) -> Dict[str, Any]:
         result["agent_id"] = event.agent_id
 
     # Add type-specific fields
-    if event.event_type == "message":
-        result["role"] = event.message.role.value
-        result["text_preview"] = event.message.text_content[:500]
-        result["has_tool_calls"] = event.message.has_tool_calls
-    elif event.event_type == "tool_use":
-        result["tool_name"] = event.tool_name
-        result["tool_category"] = event.tool_category
-        result["tool_use_id"] = event.tool_use_id
-        # Don't include full tool_input as it can be large
-    elif event.event_type == "tool_result":
-        result["tool_use_id"] = event.tool_use_id
-        result["is_error"] = event.is_error
-        # Don't include full content as it can be very large
-    elif event.event_type == "tool_call_completed":
-        result["tool_name"] = event.tool_name
-        result["tool_use_id"] = event.tool_use_id
-        result["is_error"] = event.is_error
-        if event.duration:
-            result["duration_ms"] = event.duration.total_seconds() * 1000
-    elif event.event_type == "session_start":
-        result["project_slug"] = event.project_slug
-        result["file_path"] = str(event.file_path)
-    elif event.event_type == "session_end":
-        result["reason"] = event.reason
-        result["message_count"] = event.message_count
-        result["tool_count"] = event.tool_count
-    elif event.event_type == "session_idle":
-        pass  # No additional fields
-    elif event.event_type == "session_resume":
-        result["idle_duration_seconds"] = event.idle_duration.total_seconds()
-    elif event.event_type == "error":
-        result["error_message"] = event.error_message
+    add_fields = _FIELD_SERIALIZERS.get(event_type)
+    if add_fields is not None:
+        add_fields(event, result)
 
     return result
 
 
+def _routes_for(
+    event_type: str, webhooks: Iterable[WebhookConfig], queues: Dict[str, Any]
+) -> Tuple[List[Tuple[str, Any]], List[Tuple[str, Callable, Any]], List[str]]:
+    """Work out which webhooks receive events of one type.
+
+    Dispatchers cache the result per event type, so event_types is
+    checked once per type rather than once per event.
+
+    Args:
+        event_type: Event type to route
+        webhooks: Configured webhooks
+        queues: Per-webhook queues keyed by URL
+
+    Returns:
+        Tuple of (unfiltered, filtered, skipped): (url, queue) pairs that
+        take every event of this type, (url, event_filter, queue) triples
+        whose filter still has to be called, and URLs excluded by their
+        event_types
+    """
+    unfiltered = []
+    filtered = []
+    skipped = []
+    for config in webhooks:
+        if config.event_types is not None and event_type not in config.event_types:
+            skipped.append(config.url)
+        elif config.event_filter is None:
+            unfiltered.append((config.url, queues[config.url]))
+        else:
+            filtered.append((config.url, config.event_filter, queues[config.url]))
+    return unfiltered, filtered, skipped
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time in ISO 8601 format, for payload timestamps.
+
+    Formats time.time() through time.gmtime() instead of building an
+    aware datetime and calling isoformat(). Microseconds are always
+    included.
+
+    Returns:
+        Timestamp such as "2024-01-15T14:32:05.123456+00:00"
+    """
+    now = time.time()
+    secs = int(now)
+    t = time.gmtime(secs)
+    return "%04d-%02d-%02dT%02d:%02d:%02d.%06d+00:00" % (
+        t.tm_year,
+        t.tm_mon,
+        t.tm_mday,
+        t.tm_hour,
+        t.tm_min,
+        t.tm_sec,
+        int((now - secs) * 1_000_000),
+    )
+
+
+def _encode_request(
+    config: WebhookConfig, payload: WebhookPayload
+) -> Tuple[bytes, Dict[str, str]]:
+    """Build the request body and headers for a payload.
+
+    Args:
+        config: Webhook configuration
+        payload: Payload to send
+
+    Returns:
+        Tuple of (body, headers), with the body gzipped if it reaches
+        the configured gzip_threshold
+    """
+    body = payload.to_bytes()
+    headers = {"Content-Type": "application/json", **config.headers}
+
+    if config.gzip_threshold is not None and len(body) >= config.gzip_threshold:
+        # Level 1 is several times faster than the default and compresses
+        # repetitive JSON almost as well
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+
+    return body, headers
+
+
+def _post_with_urllib(config: WebhookConfig, payload: WebhookPayload) -> None:
+    """POST a payload to a webhook using stdlib urllib.
+
+    Args:
+        config: Webhook configuration
+        payload: Payload to send
+
+    Raises:
+        Exception: If request fails
+    """
+    body, headers = _encode_request(config, payload)
+
+    req = Request(
+        config.url,
+        data=body,
+        headers=headers,
+        method="POST",
+    )
+
+    with urlopen(req, timeout=config.timeout) as response:
+        if response.status >= 400:
+            raise HTTPError(
+                config.url,
+                response.status,
+                f"HTTP Error {response.status}",
+                response.headers,
+                None,
+            )
+
+
+class _EventQueue:
+    """Bounded queue for handing events to one webhook's dispatch thread.
+
+    A lighter queue.Queue for the single-consumer case. deque.append and
+    deque.popleft are atomic, so put_nowait() takes no lock; the
+    consumer's wake-up event is only set when the consumer is actually
+    waiting for data.
+    """
+
+    __slots__ = ("_items", "_maxsize", "_nudge", "_waiting")
+
+    def __init__(self, maxsize: int):
+        self._items: deque = deque()
+        self._maxsize = maxsize
+        self._nudge = threading.Event()
+        self._waiting = False
+
+    def put_nowait(self, item: Any) -> None:
+        """Append an item, raising queue.Full if the queue is at capacity."""
+        if len(self._items) >= self._maxsize:
+            raise queue.Full
+        self._items.append(item)
+        if self._waiting:
+            self._nudge.set()
+
+    def get_nowait(self) -> Any:
+        """Remove and return the oldest item, raising queue.Empty if none."""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return the oldest item, waiting up to timeout seconds.
+
+        Raises:
+            queue.Empty: If no item arrived in time.
+        """
+        items = self._items
+        if items:
+            return items.popleft()
+
+        # Announce the wait before re-checking, so an item appended in
+        # between either is seen here or sets the nudge
+        self._nudge.clear()
+        self._waiting = True
+        try:
+            if not items:
+                self._nudge.wait(timeout)
+        finally:
+            self._waiting = False
+        return self.get_nowait()
+
+    def close(self) -> None:
+        """Queue the shutdown sentinel, even if the queue is full."""
+        self._items.append(_SHUTDOWN)
+        if self._waiting:
+            self._nudge.set()
+
+    def empty(self) -> bool:
+        """Whether the queue has no items."""
+        return not self._items
+
+    def qsize(self) -> int:
+        """Number of queued items."""
+        return len(self._items)
+
+
 class WebhookDispatcher:
     """Dispatches events to webhook endpoints with batching and retry.
 
     Manages multiple webhook configurations, batches events for efficiency,
-    and handles retries with exponential backoff. Each webhook runs in its
-    own background thread.
+    and handles retries with exponential backoff. handle_event() only
+    appends to a shared inbox; a router thread applies each webhook's
+    filter and hands events to the webhook's own sender thread. Failed
+    batches are resent by a separate retry thread, so backoff never
+    holds up a webhook's new batches (retried batches may therefore
+    arrive after later ones).
 
     Example:
         dispatcher = WebhookDispatcher()
@@ -196,16 +511,42 @@ class WebhookDispatcher:
             dispatcher.add_webhook(WebhookConfig(url="..."))
             watcher.on_any(dispatcher.handle_event)
             watcher.start()
+
+    With http2=True (requires httpx[http2]) all webhooks share one
+    HTTP/2 client, so webhooks on the same host multiplex their requests
+    over a single connection.
     """
 
-    def __init__(self):
-        """Initialize the webhook dispatcher."""
+    def __init__(self, http2: bool = False):
+        """Initialize the webhook dispatcher.
+
+        Args:
+            http2: Send through a shared httpx HTTP/2 client instead of
+                per-webhook requests sessions
+        """
         self._webhooks: List[WebhookConfig] = []
-        self._queues: Dict[str, queue.Queue] = {}
+        self._http2 = http2
+        # Events from handle_event(), routed to the per-webhook queues
+        self._inbox = _EventQueue(maxsize=10000)
+        self._router: Optional[threading.Thread] = None
+        self._queues: Dict[str, _EventQueue] = {}
         self._threads: Dict[str, threading.Thread] = {}
-        self._stop_event = threading.Event()
         self._running = False
         self._stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+        # One requests.Session per webhook, so batches reuse the pooled
+        # TCP/TLS connection
+        self._sessions: Dict[str, Any] = {}
+        # Shared httpx client when http2 is enabled
+        self._client: Optional[Any] = None
+
+        # Failed batches waiting to be resent, as a min-heap of
+        # (retry_at, seq, attempt, config, payload, event_count)
+        self._retry_heap: List[Tuple[Any, ...]] = []
+        self._retry_cond = threading.Condition()
+        self._retry_seq = itertools.count()
+        self._retry_thread: Optional[threading.Thread] = None
+        self._retry_stopping = False
 
     def add_webhook(self, config: WebhookConfig) -> None:
         """Add a webhook configuration.
@@ -221,14 +562,15 @@ class WebhookDispatcher:
             return
 
         self._webhooks.append(config)
-        self._queues[config.url] = queue.Queue(maxsize=10000)
+        self._queues[config.url] = _EventQueue(maxsize=10000)
         self._stats[config.url] = {"sent": 0, "failed": 0, "filtered": 0}
 
     def handle_event(self, event: SessionEventType) -> None:
         """Handle an event from the watcher.
 
-        Routes the event to appropriate webhook queues based on filters.
-        This method is thread-safe and non-blocking.
+        Queues the event for the router thread, which applies filters and
+        routes it to the webhook queues. This method is thread-safe and
+        non-blocking, and its cost does not grow with the number of webhooks.
 
         Args:
             event: The event to dispatch
@@ -236,19 +578,10 @@ class WebhookDispatcher:
         if not self._running:
             return
 
-        for config in self._webhooks:
-            # Apply filter if configured
-            if config.event_filter and not config.event_filter(event):
-                self._stats[config.url]["filtered"] += 1
-                continue
-
-            # Queue the event (non-blocking)
-            try:
-                self._queues[config.url].put_nowait(event)
-            except queue.Full:
-                logger.warning(
-                    "Webhook queue full for %s, dropping event", config.url
-                )
+        try:
+            self._inbox.put_nowait(event)
+        except queue.Full:
+            logger.warning("Webhook inbox full, dropping event")
 
     def start(self) -> None:
         """Start the dispatcher threads.
@@ -265,13 +598,41 @@ class WebhookDispatcher:
             return
 
         self._running = True
-        self._stop_event.clear()
+
+        self._router = threading.Thread(
+            target=self._route_loop, name="webhook-router", daemon=True
+        )
+        self._router.start()
+
+        self._retry_stopping = False
+        self._retry_thread = threading.Thread(
+            target=self._retry_loop, name="webhook-retry", daemon=True
+        )
+        self._retry_thread.start()
+
+        if self._http2:
+            if HTTPX_AVAILABLE:
+                self._client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=32, max_connections=64
+                    ),
+                )
+            else:
+                logger.warning("httpx[http2] not installed, HTTP/2 disabled")
 
         for config in self._webhooks:
+            if REQUESTS_AVAILABLE and self._client is None:
+                session = requests.Session()
+                adapter = _KeepAliveAdapter()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[config.url] = session
+
             thread = threading.Thread(
                 target=self._dispatch_loop,
                 args=(config,),
-                name=f"webhook-{config.url[:30]}",
+                name=f"webhook-{config.display_url}",
                 daemon=True,
             )
             self._threads[config.url] = thread
@@ -281,8 +642,9 @@ class WebhookDispatcher:
     def stop(self, timeout: float = 10.0) -> None:
         """Stop the dispatcher and flush remaining events.
 
-        Signals all threads to stop, waits for them to flush their
-        queues, and joins the threads.
+        Queues a shutdown sentinel behind any pending events, so the
+        router and then each webhook thread handle everything queued
+        before stop() and exit.
 
         Args:
             timeout: Maximum seconds to wait for threads to finish
@@ -291,9 +653,18 @@ class WebhookDispatcher:
             return
 
         logger.debug("Stopping webhook dispatcher")
-        self._stop_event.set()
         self._running = False
 
+        # The router closes the webhook queues once the inbox is drained
+        self._inbox.close()
+        if self._router is not None:
+            self._router.join(timeout=timeout)
+            if self._router.is_alive():
+                logger.warning("Webhook router thread did not terminate")
+                for q in self._queues.values():
+                    q.close()
+            self._router = None
+
         for url, thread in self._threads.items():
             thread.join(timeout=timeout)
             if thread.is_alive():
@@ -301,11 +672,29 @@ class WebhookDispatcher:
 
         self._threads.clear()
 
+        # Pending retries get one last immediate attempt
+        with self._retry_cond:
+            self._retry_stopping = True
+            self._retry_cond.notify()
+        if self._retry_thread is not None:
+            self._retry_thread.join(timeout=timeout)
+            if self._retry_thread.is_alive():
+                logger.warning("Webhook retry thread did not terminate")
+            self._retry_thread = None
+
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
         # Log final stats
-        for url, stats in self._stats.items():
+        for config in self._webhooks:
+            stats = self._stats[config.url]
             logger.info(
                 "Webhook %s: sent=%d, failed=%d, filtered=%d",
-                url[:50],
+                config.display_url,
                 stats["sent"],
                 stats["failed"],
                 stats["filtered"],
@@ -322,6 +711,52 @@ class WebhookDispatcher:
         """
         return dict(self._stats)
 
+    def _route_loop(self) -> None:
+        """Move events from the inbox to the queues of matching webhooks."""
+        inbox = self._inbox
+        stats = self._stats
+        # Routes per event type. Webhooks without a filter callable skip
+        # the per-event call and its exception handling entirely.
+        by_event_type: Dict[str, Tuple[Any, ...]] = {}
+
+        while True:
+            event = inbox.get()
+            if event is _SHUTDOWN:
+                break
+
+            routes = by_event_type.get(event.event_type)
+            if routes is None:
+                routes = by_event_type[event.event_type] = _routes_for(
+                    event.event_type, self._webhooks, self._queues
+                )
+            unfiltered, filtered, skipped = routes
+
+            for url in skipped:
+                stats[url]["filtered"] += 1
+
+            for url, q in unfiltered:
+                try:
+                    q.put_nowait(event)
+                except queue.Full:
+                    logger.warning("Webhook queue full for %s, dropping event", url)
+
+            for url, event_filter, q in filtered:
+                try:
+                    if not event_filter(event):
+                        stats[url]["filtered"] += 1
+                        continue
+                except Exception:
+                    logger.exception("Error in event filter for %s", url)
+                    continue
+
+                try:
+                    q.put_nowait(event)
+                except queue.Full:
+                    logger.warning("Webhook queue full for %s, dropping event", url)
+
+        for q in self._queues.values():
+            q.close()
+
     def _dispatch_loop(self, config: WebhookConfig) -> None:
         """Main loop for dispatching events to a webhook.
 
@@ -329,51 +764,50 @@ class WebhookDispatcher:
         - batch_size events are collected
         - batch_timeout seconds have passed since last send
 
+        With no pending batch the thread blocks until an event arrives;
+        with one, it waits exactly until the batch is due. Runs until the
+        shutdown sentinel queued by stop() is reached.
+
         Args:
             config: Webhook configuration
         """
         q = self._queues[config.url]
         batch: List[SessionEventType] = []
-        last_send = time.time()
+        # Monotonic so batch timing survives wall-clock adjustments
+        now = last_send = time.monotonic()
+        stopping = False
+
+        while not stopping:
+            timeout = None
+            if batch:
+                timeout = max(config.batch_timeout - (now - last_send), 0.0)
 
-        while not self._stop_event.is_set():
-            # Try to get an event with timeout
+            # Wait for an event, then take whatever else is already queued
             try:
-                event = q.get(timeout=0.5)
-                batch.append(event)
+                item = q.get(timeout=timeout)
+                while True:
+                    if item is _SHUTDOWN:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= config.batch_size:
+                        break
+                    item = q.get_nowait()
             except queue.Empty:
                 pass
 
             # Check if we should send
-            elapsed = time.time() - last_send
-            should_send = (
-                len(batch) >= config.batch_size
-                or (batch and elapsed >= config.batch_timeout)
+            now = time.monotonic()
+            should_send = batch and (
+                stopping
+                or len(batch) >= config.batch_size
+                or now - last_send >= config.batch_timeout
             )
 
             if should_send:
-                success = self._send_batch(config, batch)
-                if success:
-                    self._stats[config.url]["sent"] += 1
-                else:
-                    self._stats[config.url]["failed"] += 1
+                self._send_batch(config, batch)
                 batch = []
-                last_send = time.time()
-
-        # Flush remaining events on shutdown
-        while not q.empty():
-            try:
-                event = q.get_nowait()
-                batch.append(event)
-            except queue.Empty:
-                break
-
-        if batch:
-            success = self._send_batch(config, batch)
-            if success:
-                self._stats[config.url]["sent"] += 1
-            else:
-                self._stats[config.url]["failed"] += 1
+                last_send = now
 
     def _send_batch(
         self,
@@ -382,57 +816,129 @@ class WebhookDispatcher:
     ) -> bool:
         """Send a batch of events to a webhook.
 
-        Retries with exponential backoff on failure.
+        On failure the batch is queued for the retry thread instead of
+        being retried here.
 
         Args:
             config: Webhook configuration
             events: List of events to send
 
         Returns:
-            True if successful, False if all retries failed
+            True if sent, False if the first attempt failed
         """
         if not events:
             return True
 
         payload = WebhookPayload(
             events=[serialize_event(e) for e in events],
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=_utc_now_iso(),
         )
+        return self._attempt_send(config, payload, len(events), attempt=0)
 
-        for attempt in range(config.max_retries + 1):
-            try:
-                self._send_request(config, payload)
-                logger.debug(
-                    "Sent %d events to %s",
-                    len(events),
-                    config.url[:50],
-                )
-                return True
+    def _attempt_send(
+        self,
+        config: WebhookConfig,
+        payload: WebhookPayload,
+        event_count: int,
+        attempt: int,
+        final: bool = False,
+    ) -> bool:
+        """Make one delivery attempt and record the outcome.
 
-            except Exception as e:
-                logger.warning(
-                    "Webhook request failed (attempt %d/%d): %s",
-                    attempt + 1,
-                    config.max_retries + 1,
-                    e,
-                )
+        Failed attempts are rescheduled with jittered exponential backoff
+        until max_retries is reached.
 
-                if attempt < config.max_retries:
-                    backoff = config.retry_backoff * (2**attempt)
-                    time.sleep(backoff)
+        Args:
+            config: Webhook configuration
+            payload: Payload to send
+            event_count: Number of events in the payload (for logging)
+            attempt: Zero-based attempt number
+            final: Don't reschedule on failure (used when stopping)
+
+        Returns:
+            True if sent, False otherwise
+        """
+        try:
+            self._send_request(config, payload)
+        except Exception as e:
+            logger.warning(
+                "Webhook request failed (attempt %d/%d): %s",
+                attempt + 1,
+                config.max_retries + 1,
+                e,
+            )
+        else:
+            logger.debug("Sent %d events to %s", event_count, config.display_url)
+            with self._stats_lock:
+                self._stats[config.url]["sent"] += 1
+            return True
+
+        if attempt < config.max_retries and not final:
+            backoff = config.retry_backoff * (2**attempt)
+            backoff *= 1 + random.random() * 0.5
+            with self._retry_cond:
+                heapq.heappush(
+                    self._retry_heap,
+                    (
+                        time.monotonic() + backoff,
+                        next(self._retry_seq),
+                        attempt + 1,
+                        config,
+                        payload,
+                        event_count,
+                    ),
+                )
+                self._retry_cond.notify()
+            return False
 
         logger.error(
             "Failed to send %d events to %s after %d attempts",
-            len(events),
-            config.url[:50],
-            config.max_retries + 1,
+            event_count,
+            config.display_url,
+            attempt + 1,
         )
+        with self._stats_lock:
+            self._stats[config.url]["failed"] += 1
         return False
 
+    def _retry_loop(self) -> None:
+        """Resend failed batches as their backoff expires.
+
+        When stopping, every batch still waiting gets one immediate
+        final attempt.
+        """
+        heap = self._retry_heap
+        cond = self._retry_cond
+
+        while True:
+            with cond:
+                while True:
+                    if self._retry_stopping:
+                        due = [heapq.heappop(heap) for _ in range(len(heap))]
+                        break
+                    if heap:
+                        delay = heap[0][0] - time.monotonic()
+                        if delay <= 0:
+                            due = [heapq.heappop(heap)]
+                            break
+                        cond.wait(delay)
+                    else:
+                        cond.wait()
+                stopping = self._retry_stopping
+
+            for _, _, attempt, config, payload, event_count in due:
+                self._attempt_send(
+                    config, payload, event_count, attempt, final=stopping
+                )
+
+            if stopping:
+                return
+
     def _send_request(self, config: WebhookConfig, payload: WebhookPayload) -> None:
         """Send HTTP request to webhook.
 
-        Uses requests library if available, falls back to urllib.
+        Uses the shared HTTP/2 client when enabled, otherwise the requests
+        library if available, falling back to urllib.
 
         Args:
             config: Webhook configuration
@@ -441,7 +947,9 @@ class WebhookDispatcher:
         Raises:
             Exception: If request fails
         """
-        if REQUESTS_AVAILABLE:
+        if self._client is not None:
+            self._send_with_httpx(config, payload)
+        elif REQUESTS_AVAILABLE:
             self._send_with_requests(config, payload)
         else:
             self._send_with_urllib(config, payload)
@@ -451,41 +959,59 @@ class WebhookDispatcher:
         config: WebhookConfig,
         payload: WebhookPayload,
     ) -> None:
-        """Send using requests library."""
-        headers = {"Content-Type": "application/json", **config.headers}
+        """Send using requests library.
 
-        response = requests.post(
+        The response is streamed: a success body is drained in chunks
+        (so the connection can return to the pool) without being kept,
+        and only the first few KB of an error body are read for the
+        exception message.
+        """
+        body, headers = _encode_request(config, payload)
+
+        session = self._sessions.get(config.url)
+        post = session.post if session is not None else requests.post
+        response = post(
             config.url,
-            data=payload.to_json(),
+            data=body,
             headers=headers,
             timeout=config.timeout,
+            stream=True,
         )
-        response.raise_for_status()
+        with response:
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                detail = next(response.iter_content(chunk_size=4096), b"")
+                raise requests.HTTPError(
+                    f"{e}: {detail[:4096].decode('utf-8', 'replace')}",
+                    response=response,
+                ) from None
+            for _ in response.iter_content(chunk_size=8192):
+                pass
 
-    def _send_with_urllib(
+    def _send_with_httpx(
         self,
         config: WebhookConfig,
         payload: WebhookPayload,
     ) -> None:
-        """Send using stdlib urllib."""
-        headers = {"Content-Type": "application/json", **config.headers}
+        """Send using the shared httpx client."""
+        body, headers = _encode_request(config, payload)
 
-        req = Request(
+        response = self._client.post(
             config.url,
-            data=payload.to_json().encode("utf-8"),
+            content=body,
             headers=headers,
-            method="POST",
+            timeout=config.timeout,
         )
+        response.raise_for_status()
 
-        with urlopen(req, timeout=config.timeout) as response:
-            if response.status >= 400:
-                raise HTTPError(
-                    config.url,
-                    response.status,
-                    f"HTTP Error {response.status}",
-                    response.headers,
-                    None,
-                )
+    def _send_with_urllib(
+        self,
+        config: WebhookConfig,
+        payload: WebhookPayload,
+    ) -> None:
+        """Send using stdlib urllib."""
+        _post_with_urllib(config, payload)
 
     def __enter__(self) -> "WebhookDispatcher":
         """Context manager entry - starts the dispatcher."""
@@ -495,3 +1021,356 @@ class WebhookDispatcher:
     def __exit__(self, *args) -> None:
         """Context manager exit - stops the dispatcher."""
         self.stop()
+
+
+class AsyncWebhookDispatcher:
+    """Dispatches events to webhook endpoints from a single asyncio loop.
+
+    Same batching, filtering and retry behaviour as WebhookDispatcher,
+    but every webhook is a task on the caller's event loop rather than
+    a thread, and retry backoff is an asyncio.sleep, so a slow endpoint
+    never holds up the others. Requests go through one shared
+    aiohttp.ClientSession when aiohttp is installed (or one
+    httpx.AsyncClient with http2=True); otherwise each request runs in a
+    worker thread via urllib.
+
+    handle_event() may be called from any thread, so it can be
+    registered directly on a SessionWatcher running in the background.
+
+    Example:
+        dispatcher = AsyncWebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(url="https://example.com/hook"))
+        watcher.on_any(dispatcher.handle_event)
+
+        async with dispatcher:
+            await watcher.run_async()
+    """
+
+    def __init__(self, http2: bool = False):
+        """Initialize the async webhook dispatcher.
+
+        Args:
+            http2: Send through a shared httpx HTTP/2 client instead of
+                aiohttp
+        """
+        self._webhooks: List[WebhookConfig] = []
+        self._http2 = http2
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[Any] = None
+        self._client: Optional[Any] = None
+        self._running = False
+        self._stats: Dict[str, Dict[str, int]] = {}
+        # Routes per event type, see _routes_for()
+        self._by_event_type: Dict[str, Tuple[Any, ...]] = {}
+
+    def add_webhook(self, config: WebhookConfig) -> None:
+        """Add a webhook configuration.
+
+        Must be called before start().
+
+        Args:
+            config: Webhook configuration to add
+        """
+        if self._running:
+            logger.warning("Cannot add webhook after dispatcher started")
+            return
+
+        self._webhooks.append(config)
+        self._stats[config.url] = {"sent": 0, "failed": 0, "filtered": 0}
+
+    def handle_event(self, event: SessionEventType) -> None:
+        """Handle an event from the watcher.
+
+        Thread-safe and non-blocking: from another thread the event is
+        handed to the dispatcher's loop with call_soon_threadsafe.
+
+        Args:
+            event: The event to dispatch
+        """
+        loop = self._loop
+        if not self._running or loop is None:
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            self._enqueue(event)
+        else:
+            try:
+                loop.call_soon_threadsafe(self._enqueue, event)
+            except RuntimeError:
+                # Loop closed
+                pass
+
+    async def start(self) -> None:
+        """Start a dispatch task for each configured webhook."""
+        if self._running:
+            logger.warning("Dispatcher already running")
+            return
+
+        if not self._webhooks:
+            logger.warning("No webhooks configured")
+            return
+
+        self._by_event_type.clear()
+        # Queues are created here so they belong to the running loop
+        self._queues = {
+            config.url: asyncio.Queue(maxsize=10000) for config in self._webhooks
+        }
+
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+
+        if self._http2 and HTTPX_AVAILABLE:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32, max_connections=64
+                ),
+            )
+        else:
+            if self._http2:
+                logger.warning("httpx[http2] not installed, HTTP/2 disabled")
+            if AIOHTTP_AVAILABLE:
+                self._session = aiohttp.ClientSession()
+
+        for config in self._webhooks:
+            self._tasks[config.url] = asyncio.create_task(
+                self._dispatch_loop(config),
+                name=f"webhook-{config.display_url}",
+            )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop the dispatcher and flush remaining events.
+
+        Args:
+            timeout: Maximum seconds to wait for the dispatch tasks to finish
+        """
+        if not self._running:
+            return
+
+        self._running = False
+
+        # A full queue may not take the sentinel before the timeout; that
+        # webhook's task is cancelled below instead of waiting on it
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        for config in self._webhooks:
+            q = self._queues[config.url]
+            try:
+                q.put_nowait(_SHUTDOWN)
+            except asyncio.QueueFull:
+                try:
+                    await asyncio.wait_for(
+                        q.put(_SHUTDOWN), max(deadline - loop.time(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        tasks = list(self._tasks.values())
+        done, pending = await asyncio.wait(
+            tasks, timeout=max(deadline - loop.time(), 0)
+        )
+        for task in pending:
+            logger.warning("Webhook task %s did not terminate", task.get_name())
+            task.cancel()
+        self._tasks.clear()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._loop = None
+
+        for config in self._webhooks:
+            stats = self._stats[config.url]
+            logger.info(
+                "Webhook %s: sent=%d, failed=%d, filtered=%d",
+                config.display_url,
+                stats["sent"],
+                stats["failed"],
+                stats["filtered"],
+            )
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get statistics for all webhooks.
+
+        Returns:
+            Dictionary mapping URL to stats dict (see WebhookDispatcher.get_stats)
+        """
+        return dict(self._stats)
+
+    def _enqueue(self, event: SessionEventType) -> None:
+        """Route an event to the webhook queues (runs on the loop)."""
+        routes = self._by_event_type.get(event.event_type)
+        if routes is None:
+            routes = self._by_event_type[event.event_type] = _routes_for(
+                event.event_type, self._webhooks, self._queues
+            )
+        unfiltered, filtered, skipped = routes
+
+        for url in skipped:
+            self._stats[url]["filtered"] += 1
+
+        for url, q in unfiltered:
+            try:
+                q.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning("Webhook queue full for %s, dropping event", url)
+
+        for url, event_filter, q in filtered:
+            try:
+                if not event_filter(event):
+                    self._stats[url]["filtered"] += 1
+                    continue
+            except Exception:
+                logger.exception("Error in event filter for %s", url)
+                continue
+
+            try:
+                q.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning("Webhook queue full for %s, dropping event", url)
+
+    async def _dispatch_loop(self, config: WebhookConfig) -> None:
+        """Batch events for one webhook until the shutdown sentinel arrives.
+
+        Args:
+            config: Webhook configuration
+        """
+        q = self._queues[config.url]
+        loop = asyncio.get_running_loop()
+        batch: List[SessionEventType] = []
+        last_send = loop.time()
+        stopping = False
+
+        while not stopping:
+            # Block until an event arrives, or until the pending batch is due
+            try:
+                if batch:
+                    remaining = config.batch_timeout - (loop.time() - last_send)
+                    item = await asyncio.wait_for(q.get(), max(remaining, 0))
+                else:
+                    item = await q.get()
+            except asyncio.TimeoutError:
+                item = None
+
+            if item is _SHUTDOWN:
+                stopping = True
+            elif item is not None:
+                batch.append(item)
+
+            # Take whatever else is already queued
+            while not stopping and len(batch) < config.batch_size:
+                try:
+                    item = q.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is _SHUTDOWN:
+                    stopping = True
+                else:
+                    batch.append(item)
+
+            if batch and (
+                stopping
+                or len(batch) >= config.batch_size
+                or loop.time() - last_send >= config.batch_timeout
+            ):
+                success = await self._send_batch(config, batch)
+                self._stats[config.url]["sent" if success else "failed"] += 1
+                batch = []
+                last_send = loop.time()
+
+    async def _send_batch(
+        self,
+        config: WebhookConfig,
+        events: List[SessionEventType],
+    ) -> bool:
+        """Send a batch of events, retrying with exponential backoff.
+
+        Args:
+            config: Webhook configuration
+            events: List of events to send
+
+        Returns:
+            True if successful, False if all retries failed
+        """
+        payload = WebhookPayload(
+            events=[serialize_event(e) for e in events],
+            timestamp=_utc_now_iso(),
+        )
+
+        for attempt in range(config.max_retries + 1):
+            try:
+                await self._send_request(config, payload)
+                logger.debug("Sent %d events to %s", len(events), config.display_url)
+                return True
+
+            except Exception as e:
+                logger.warning(
+                    "Webhook request failed (attempt %d/%d): %s",
+                    attempt + 1,
+                    config.max_retries + 1,
+                    e,
+                )
+
+                if attempt < config.max_retries:
+                    await asyncio.sleep(config.retry_backoff * (2**attempt))
+
+        logger.error(
+            "Failed to send %d events to %s after %d attempts",
+            len(events),
+            config.display_url,
+            config.max_retries + 1,
+        )
+        return False
+
+    async def _send_request(
+        self, config: WebhookConfig, payload: WebhookPayload
+    ) -> None:
+        """Send HTTP request to webhook.
+
+        Uses the shared HTTP/2 client or aiohttp session if available,
+        otherwise urllib in a worker thread.
+
+        Raises:
+            Exception: If request fails
+        """
+        body, headers = _encode_request(config, payload)
+
+        if self._client is not None:
+            response = await self._client.post(
+                config.url,
+                content=body,
+                headers=headers,
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+            return
+
+        if self._session is None:
+            await asyncio.to_thread(_post_with_urllib, config, payload)
+            return
+        async with self._session.post(
+            config.url,
+            data=body,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=config.timeout),
+        ) as response:
+            response.raise_for_status()
+
+    async def __aenter__(self) -> "AsyncWebhookDispatcher":
+        """Async context manager entry - starts the dispatcher."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Async context manager exit - stops the dispatcher."""
+        await self.stop()
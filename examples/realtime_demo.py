@@ -8,6 +8,9 @@ Usage:
     # Watch all sessions (high-level API using SessionWatcher)
     python realtime_demo.py --watch-all
 
+    # Shard many active sessions across 4 processes
+    python realtime_demo.py --watch-all --workers 4
+
     # Process a specific session file (low-level API)
     python realtime_demo.py /path/to/session.jsonl
 
@@ -18,31 +21,39 @@ Usage:
     python realtime_demo.py --latest --watch
 """
 
+from __future__ import annotations
+
 import argparse
+import multiprocessing as mp
+import os
+import queue
 import sys
+import threading
 import time
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 # Add parent directory to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from claude_sessions.realtime import (
-    JSONLTailer,
-    IncrementalParser,
-    EventEmitter,
-    MessageEvent,
-    ToolUseEvent,
-    ToolResultEvent,
-    ErrorEvent,
-    SessionWatcher,
-    WatcherConfig,
-    SessionStartEvent,
-    SessionEndEvent,
-    SessionIdleEvent,
-    SessionResumeEvent,
-)
+# The realtime API is imported inside the run_* functions, so --help and
+# argument errors don't pay for loading it; these names are only used in
+# annotations
+if TYPE_CHECKING:
+    from claude_sessions.realtime import (
+        MessageEvent,
+        ToolUseEvent,
+        ToolResultEvent,
+        ErrorEvent,
+        SessionStartEvent,
+        SessionEndEvent,
+        SessionIdleEvent,
+        SessionResumeEvent,
+    )
 
 
 def find_latest_session() -> Optional[Path]:
@@ -52,55 +63,187 @@ def find_latest_session() -> Optional[Path]:
     if not claude_dir.exists():
         return None
 
-    # Find all JSONL files
-    session_files = list(claude_dir.glob("**/*.jsonl"))
+    # Walk the tree with scandir: directory checks come from the
+    # directory listing itself and no Path is built per file
+    latest = None
+    latest_mtime = -1.0
+    stack = [str(claude_dir)]
+    while stack:
+        # Files and directories can vanish or be unreadable mid-walk
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".jsonl"):
+                        mtime = entry.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest, latest_mtime = entry.path, mtime
+                except OSError:
+                    continue
 
-    if not session_files:
-        return None
+    return Path(latest) if latest else None
 
-    # Return the most recently modified
-    return max(session_files, key=lambda p: p.stat().st_mtime)
+
+# Display names for MessageRole values, so handlers don't upper() per event
+_ROLE_STR = {"user": "USER", "assistant": "ASSISTANT"}
 
 
 def format_timestamp(ts: datetime) -> str:
     """Format timestamp for display."""
-    return ts.strftime("%H:%M:%S")
+    return f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
 
 
 def truncate_text(text: str, max_length: int = 80) -> str:
     """Truncate text for display."""
+    # Most text is short and single-line; skip the replace() copy
+    if len(text) <= max_length and "\n" not in text:
+        return text.strip()
     text = text.replace("\n", " ").strip()
     if len(text) > max_length:
         return text[:max_length - 3] + "..."
     return text
 
 
-def run_watch_all(poll_interval: float = 0.5, idle_timeout: float = 120.0):
-    """Watch all sessions using the high-level SessionWatcher API."""
+@dataclass(slots=True)
+class SessionStats:
+    """Event counters for one session, plus its display ids."""
+
+    session_id: str = ""
+    messages: int = 0
+    tool_uses: int = 0
+    tool_results: int = 0
+    errors: int = 0
+    # Built once here rather than on every event
+    short_id: str = field(init=False)
+    prefix: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.short_id = self.session_id[:8]
+        self.prefix = f"[{self.short_id}] "
+
+
+@lru_cache(maxsize=1024)
+def agent_prefix(agent_id: Optional[str]) -> str:
+    """Display prefix for a subagent's events, built once per agent."""
+    return f"[{agent_id[:8]}] " if agent_id else ""
+
+
+def _path_details(tool_input: dict) -> str:
+    return f": {tool_input.get('file_path', '')}"
+
+
+# Extra detail shown after each tool name, keyed by tool
+TOOL_DETAILS: dict[str, Callable[[dict], str]] = {
+    "Bash": lambda i: f": {truncate_text(i.get('command', ''), 60)}",
+    "Read": _path_details,
+    "Write": _path_details,
+    "Edit": _path_details,
+    "Grep": lambda i: f": /{i.get('pattern', '')}/",
+    "Task": lambda i: f": {i.get('description', '')}",
+}
+
+
+def _no_details(tool_input: dict) -> str:
+    return ""
+
+
+# Handlers shared by both modes. Each takes a get_stats(session_id)
+# callable first and is registered with functools.partial.
+StatsGetter = Callable[[str], SessionStats]
+
+
+def on_tool_use(get_stats: StatsGetter, event: ToolUseEvent):
+    get_stats(event.session_id).tool_uses += 1
+    details = TOOL_DETAILS.get(event.tool_name, _no_details)(event.tool_input)
+    prefix = agent_prefix(event.agent_id)
+    print(f"  {prefix}-> {event.tool_name} ({event.tool_category}){details}")
+
+
+def on_tool_result(get_stats: StatsGetter, event: ToolResultEvent):
+    get_stats(event.session_id).tool_results += 1
+    if event.is_error:
+        print(f"     ERROR: {truncate_text(event.content, 60)}")
+
+
+def on_error(get_stats: StatsGetter, event: ErrorEvent):
+    get_stats(event.session_id).errors += 1
+    print(f"\n  PARSE ERROR: {event.error_message}")
+
+
+def watch_file_changes(session_file: Path, changed: threading.Event):
+    """Set `changed` whenever session_file is modified.
+
+    Returns the started watchdog observer, or None if watchdog is not
+    installed or cannot watch the directory (e.g. some network
+    filesystems), in which case the caller should poll instead.
+    """
+    # watchdog lets --watch sleep until the file changes; without it we poll
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    target = str(session_file.resolve())
+
+    class Handler(FileSystemEventHandler):
+        def on_modified(self, event):
+            if event.src_path == target:
+                changed.set()
+
+    observer = Observer()
+    try:
+        observer.schedule(Handler(), str(session_file.resolve().parent))
+        observer.start()
+    except OSError:
+        return None
+    return observer
+
+
+def _in_shard(index: int, workers: int, session_id: str) -> bool:
+    """Whether a session belongs to worker `index` of `workers`."""
+    # crc32 rather than hash(): str hashes are salted per process
+    return zlib.crc32(session_id.encode()) % workers == index
+
+
+def watch_sessions(
+    poll_interval: float,
+    idle_timeout: float,
+    session_filter: Optional[Callable[[str], bool]] = None,
+) -> dict[str, SessionStats]:
+    """Print events from all sessions until interrupted.
+
+    Returns:
+        Stats for the sessions that were still active at exit.
+    """
+    from claude_sessions.realtime import SessionWatcher, WatcherConfig
+
     config = WatcherConfig(
         poll_interval=poll_interval,
         idle_timeout=timedelta(seconds=idle_timeout),
         end_timeout=timedelta(seconds=idle_timeout * 2.5),
+        session_filter=session_filter,
     )
     watcher = SessionWatcher(config)
 
     # Track stats per session
-    stats: dict = {}
-
-    def get_stats(session_id: str) -> dict:
-        if session_id not in stats:
-            stats[session_id] = {
-                "messages": 0,
-                "tool_uses": 0,
-                "tool_results": 0,
-                "errors": 0,
-            }
-        return stats[session_id]
+    stats: dict[str, SessionStats] = {}
+
+    def get_stats(session_id: str) -> SessionStats:
+        s = stats.get(session_id)
+        if s is None:
+            s = stats[session_id] = SessionStats(session_id)
+        return s
 
     @watcher.on("session_start")
     def on_session_start(event: SessionStartEvent):
         print(f"\n{'='*60}")
-        print(f"SESSION STARTED: {event.session_id[:8]}")
+        print(f"SESSION STARTED: {get_stats(event.session_id).short_id}")
         print(f"  Project: {event.project_slug}")
         print(f"  File: {event.file_path.name}")
         print(f"{'='*60}")
@@ -108,141 +251,157 @@ def run_watch_all(poll_interval: float = 0.5, idle_timeout: float = 120.0):
     @watcher.on("session_idle")
     def on_session_idle(event: SessionIdleEvent):
         s = get_stats(event.session_id)
-        print(f"\n  [Session {event.session_id[:8]} is now idle]")
-        print(f"    Messages: {s['messages']}, Tools: {s['tool_uses']}")
+        print(f"\n  [Session {s.short_id} is now idle]")
+        print(f"    Messages: {s.messages}, Tools: {s.tool_uses}")
 
     @watcher.on("session_resume")
     def on_session_resume(event: SessionResumeEvent):
+        short_id = get_stats(event.session_id).short_id
         idle_secs = event.idle_duration.total_seconds()
-        print(f"\n  [Session {event.session_id[:8]} resumed after {idle_secs:.0f}s]")
+        print(f"\n  [Session {short_id} resumed after {idle_secs:.0f}s]")
 
     @watcher.on("session_end")
     def on_session_end(event: SessionEndEvent):
+        s = stats.pop(event.session_id, None)
+        short_id = s.short_id if s else event.session_id[:8]
         print(f"\n{'='*60}")
-        print(f"SESSION ENDED: {event.session_id[:8]}")
+        print(f"SESSION ENDED: {short_id}")
         print(f"  Reason: {event.reason}")
         print(f"  Messages: {event.message_count}, Tools: {event.tool_count}")
         print(f"{'='*60}")
-        stats.pop(event.session_id, None)
 
     @watcher.on("message")
     def on_message(event: MessageEvent):
-        get_stats(event.session_id)["messages"] += 1
-        role = event.message.role.value.upper()
+        s = get_stats(event.session_id)
+        s.messages += 1
+        role = _ROLE_STR[event.message.role.value]
         text = truncate_text(event.message.text_content)
-        agent_prefix = f"[{event.agent_id[:8]}] " if event.agent_id else ""
-        session_prefix = f"[{event.session_id[:8]}] "
+        prefixes = s.prefix + agent_prefix(event.agent_id)
 
-        print(f"\n[{format_timestamp(event.timestamp)}] {session_prefix}{agent_prefix}{role}:")
+        print(f"\n[{format_timestamp(event.timestamp)}] {prefixes}{role}:")
         if text:
             print(f"  {text}")
 
-    @watcher.on("tool_use")
-    def on_tool_use(event: ToolUseEvent):
-        get_stats(event.session_id)["tool_uses"] += 1
-        agent_prefix = f"[{event.agent_id[:8]}] " if event.agent_id else ""
-
-        # Format tool-specific info
-        details = ""
-        if event.tool_name == "Bash":
-            cmd = event.tool_input.get("command", "")
-            details = f": {truncate_text(cmd, 60)}"
-        elif event.tool_name in ("Read", "Write", "Edit"):
-            path = event.tool_input.get("file_path", "")
-            details = f": {path}"
-        elif event.tool_name == "Grep":
-            pattern = event.tool_input.get("pattern", "")
-            details = f": /{pattern}/"
-        elif event.tool_name == "Task":
-            desc = event.tool_input.get("description", "")
-            details = f": {desc}"
-
-        print(f"  {agent_prefix}-> {event.tool_name} ({event.tool_category}){details}")
-
-    @watcher.on("tool_result")
-    def on_tool_result(event: ToolResultEvent):
-        get_stats(event.session_id)["tool_results"] += 1
-        if event.is_error:
-            print(f"     ERROR: {truncate_text(event.content, 60)}")
-
-    @watcher.on("error")
-    def on_error(event: ErrorEvent):
-        get_stats(event.session_id)["errors"] += 1
-        print(f"\n  PARSE ERROR: {event.error_message}")
+    watcher.on("tool_use", partial(on_tool_use, get_stats))
+    watcher.on("tool_result", partial(on_tool_result, get_stats))
+    watcher.on("error", partial(on_error, get_stats))
 
+    try:
+        watcher.start()
+    except KeyboardInterrupt:
+        pass
+    return stats
+
+
+def _watch_shard(
+    index: int,
+    workers: int,
+    poll_interval: float,
+    idle_timeout: float,
+    results: mp.Queue,
+) -> None:
+    """Worker process: watch one shard of the sessions and report its stats."""
+    start_periodic_flush()
+    stats = watch_sessions(
+        poll_interval, idle_timeout, partial(_in_shard, index, workers)
+    )
+    results.put(list(stats.values()))
+
+
+def _run_shards(
+    workers: int, poll_interval: float, idle_timeout: float
+) -> list[SessionStats]:
+    """Watch sessions from `workers` processes and merge their final stats."""
+    results: mp.Queue = mp.Queue()
+    procs = [
+        mp.Process(
+            target=_watch_shard,
+            args=(i, workers, poll_interval, idle_timeout, results),
+        )
+        for i in range(workers)
+    ]
+    for p in procs:
+        p.start()
+
+    # Ctrl+C reaches the workers too; each reports its stats as it stops
+    try:
+        for p in procs:
+            p.join()
+    except KeyboardInterrupt:
+        pass
+
+    merged: list[SessionStats] = []
+    for _ in procs:
+        try:
+            merged.extend(results.get(timeout=5))
+        except queue.Empty:
+            break
+    for p in procs:
+        p.join()
+    return merged
+
+
+def run_watch_all(
+    poll_interval: float = 0.5, idle_timeout: float = 120.0, workers: int = 1
+):
+    """Watch all sessions using the high-level SessionWatcher API.
+
+    With more than one worker, sessions are sharded by ID across that many
+    processes, each running its own SessionWatcher, so parsing bursts from
+    many active sessions aren't limited to one core.
+    """
     print(f"\n{'='*60}")
     print("Watching all Claude Code sessions...")
     print(f"Poll interval: {poll_interval}s, Idle timeout: {idle_timeout}s")
+    if workers > 1:
+        print(f"Workers: {workers}")
     print("Press Ctrl+C to stop")
     print(f"{'='*60}")
 
-    try:
-        watcher.start()
-    except KeyboardInterrupt:
-        print("\n\nStopped.")
+    if workers > 1:
+        active = _run_shards(workers, poll_interval, idle_timeout)
+    else:
+        active = list(watch_sessions(poll_interval, idle_timeout).values())
+    print("\n\nStopped.")
 
     # Print final summary
-    if stats:
+    if active:
         print(f"\n{'='*60}")
         print("Active sessions at exit:")
-        for session_id, s in stats.items():
-            print(f"  {session_id[:8]}: {s['messages']} msgs, {s['tool_uses']} tools")
+        for s in active:
+            print(f"  {s.short_id}: {s.messages} msgs, {s.tool_uses} tools")
         print(f"{'='*60}")
 
 
 def run_single_file(session_file: Path, watch: bool = False, poll_interval: float = 0.5):
     """Process a single session file using the low-level API."""
+    from claude_sessions.realtime import EventEmitter, IncrementalParser, JSONLTailer
+
     # Set up components
     tailer = JSONLTailer(session_file)
     incremental_parser = IncrementalParser()
     emitter = EventEmitter()
 
     # Track stats
-    stats = {"messages": 0, "tool_uses": 0, "tool_results": 0, "errors": 0}
+    stats = SessionStats()
 
     @emitter.on("message")
     def on_message(event: MessageEvent):
-        stats["messages"] += 1
-        role = event.message.role.value.upper()
+        stats.messages += 1
+        role = _ROLE_STR[event.message.role.value]
         text = truncate_text(event.message.text_content)
-        agent_prefix = f"[{event.agent_id[:8]}] " if event.agent_id else ""
+        prefix = agent_prefix(event.agent_id)
 
-        print(f"\n[{format_timestamp(event.timestamp)}] {agent_prefix}{role}:")
+        print(f"\n[{format_timestamp(event.timestamp)}] {prefix}{role}:")
         if text:
             print(f"  {text}")
 
-    @emitter.on("tool_use")
-    def on_tool_use(event: ToolUseEvent):
-        stats["tool_uses"] += 1
-        agent_prefix = f"[{event.agent_id[:8]}] " if event.agent_id else ""
-
-        # Format tool-specific info
-        details = ""
-        if event.tool_name == "Bash":
-            cmd = event.tool_input.get("command", "")
-            details = f": {truncate_text(cmd, 60)}"
-        elif event.tool_name in ("Read", "Write", "Edit"):
-            path = event.tool_input.get("file_path", "")
-            details = f": {path}"
-        elif event.tool_name == "Grep":
-            pattern = event.tool_input.get("pattern", "")
-            details = f": /{pattern}/"
-        elif event.tool_name == "Task":
-            desc = event.tool_input.get("description", "")
-            details = f": {desc}"
-
-        print(f"  {agent_prefix}-> {event.tool_name} ({event.tool_category}){details}")
-
-    @emitter.on("tool_result")
-    def on_tool_result(event: ToolResultEvent):
-        stats["tool_results"] += 1
-        if event.is_error:
-            print(f"     ERROR: {truncate_text(event.content, 60)}")
-
-    @emitter.on("error")
-    def on_error(event: ErrorEvent):
-        stats["errors"] += 1
-        print(f"\n  PARSE ERROR: {event.error_message}")
+    def get_stats(session_id: str) -> SessionStats:
+        return stats
+
+    emitter.on("tool_use", partial(on_tool_use, get_stats))
+    emitter.on("tool_result", partial(on_tool_result, get_stats))
+    emitter.on("error", partial(on_error, get_stats))
 
     # Process events
     print(f"\n{'='*60}")
@@ -262,28 +421,55 @@ def run_single_file(session_file: Path, watch: bool = False, poll_interval: floa
 
     # Watch mode
     if watch:
+        changed = threading.Event()
+        observer = watch_file_changes(session_file, changed)
+        # With an observer, sleep until the file changes (re-checking every
+        # few seconds in case an event is missed); otherwise poll
+        wait_timeout = max(poll_interval, 5.0) if observer else poll_interval
+
         print(f"\n{'='*60}")
         print("Watching for new events... (Ctrl+C to stop)")
         print(f"{'='*60}")
 
         try:
             while True:
+                changed.clear()
                 new_count = process_new_entries()
                 if new_count == 0:
-                    time.sleep(poll_interval)
+                    changed.wait(wait_timeout)
         except KeyboardInterrupt:
             print("\n\nStopped.")
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
 
     # Print summary
     print(f"\n{'='*60}")
     print("Summary:")
-    print(f"  Messages:     {stats['messages']}")
-    print(f"  Tool uses:    {stats['tool_uses']}")
-    print(f"  Tool results: {stats['tool_results']}")
-    print(f"  Errors:       {stats['errors']}")
+    print(f"  Messages:     {stats.messages}")
+    print(f"  Tool uses:    {stats.tool_uses}")
+    print(f"  Tool results: {stats.tool_results}")
+    print(f"  Errors:       {stats.errors}")
     print(f"{'='*60}")
 
 
+def start_periodic_flush(interval: float = 0.2) -> None:
+    """Block-buffer stdout and flush it every `interval` seconds.
+
+    Avoids a write() per printed line during bursts of events, while
+    output still appears promptly when the session is quiet.
+    """
+    sys.stdout.reconfigure(line_buffering=False)
+
+    def flush_loop() -> None:
+        while True:
+            time.sleep(interval)
+            sys.stdout.flush()
+
+    threading.Thread(target=flush_loop, daemon=True).start()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Demo realtime session monitoring"
@@ -301,18 +487,24 @@ def main():
     parser.add_argument(
         "--watch",
         action="store_true",
-        help="Watch for new events (poll every 0.5s)"
+        help="Watch for new events (uses watchdog if installed, else polls)"
     )
     parser.add_argument(
         "--watch-all",
         action="store_true",
         help="Watch all sessions using SessionWatcher (high-level API)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes to shard sessions across for --watch-all (default: 1)"
+    )
     parser.add_argument(
         "--poll-interval",
         type=float,
         default=0.5,
-        help="Poll interval in seconds (default: 0.5)"
+        help="Poll interval in seconds when not using watchdog (default: 0.5)"
     )
     parser.add_argument(
         "--idle-timeout",
@@ -322,12 +514,14 @@ def main():
     )
 
     args = parser.parse_args()
+    start_periodic_flush()
 
     # High-level API: watch all sessions
     if args.watch_all:
         run_watch_all(
             poll_interval=args.poll_interval,
             idle_timeout=args.idle_timeout,
+            workers=max(1, args.workers),
         )
         return
 
@@ -25,18 +25,80 @@ To set up a Slack webhook:
 5. Copy the webhook URL
 """
 
+from __future__ import annotations
+
+import http.client
 import json
 import os
+import queue
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 # Add parent directory for development
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from claude_sessions.realtime import SessionWatcher, filters
-from claude_sessions.realtime.events import SessionEventType
+# The realtime API is imported in main() once the webhook URL is known
+if TYPE_CHECKING:
+    from claude_sessions.realtime.events import SessionEventType
+
+
+@lru_cache(maxsize=1024)
+def short_id(session_id: str) -> str:
+    """Shortened session id for display, built once per session."""
+    return session_id[:8]
+
+
+def _section(text: str) -> dict:
+    """Wrap markdown text in a single-section Block Kit message."""
+    return {"blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": text}}]}
+
+
+def _format_error(event: SessionEventType) -> dict:
+    return _section(
+        f":warning: *Error in session {short_id(event.session_id)}*\n"
+        f"```{event.error_message[:500]}```"
+    )
+
+
+def _format_tool_result(event: SessionEventType) -> dict | None:
+    if not event.is_error:
+        return None
+    return _section(
+        f":x: *Tool error in session {short_id(event.session_id)}*\n"
+        f"```{event.content[:500]}```"
+    )
+
+
+def _format_session_end(event: SessionEventType) -> dict:
+    emoji = ":white_check_mark:" if event.reason == "idle_timeout" else ":checkered_flag:"
+    return _section(
+        f"{emoji} *Session ended*\n"
+        f"Session: `{short_id(event.session_id)}`\n"
+        f"Reason: {event.reason}\n"
+        f"Messages: {event.message_count}, Tools: {event.tool_count}"
+    )
+
+
+def _format_session_start(event: SessionEventType) -> dict:
+    return _section(
+        f":rocket: *New session started*\n"
+        f"Session: `{short_id(event.session_id)}`\n"
+        f"Project: {event.project_slug}"
+    )
+
+
+# Which events are sent, and how: one lookup both filters and formats.
+# Only errors, tool errors and session start/end are sent.
+SLACK_FORMATTERS = {
+    "error": _format_error,
+    "tool_result": _format_tool_result,
+    "session_end": _format_session_end,
+    "session_start": _format_session_start,
+}
 
 
 def format_slack_message(event: SessionEventType) -> dict | None:
@@ -48,98 +110,89 @@ def format_slack_message(event: SessionEventType) -> dict | None:
     Returns:
         Slack Block Kit payload or None if event shouldn't be sent
     """
-    if event.event_type == "error":
-        return {
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": (
-                            f":warning: *Error in session {event.session_id[:8]}*\n"
-                            f"```{event.error_message[:500]}```"
-                        ),
-                    },
-                }
-            ]
-        }
-
-    elif event.event_type == "tool_result" and event.is_error:
-        return {
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": (
-                            f":x: *Tool error in session {event.session_id[:8]}*\n"
-                            f"```{event.content[:500]}```"
-                        ),
-                    },
-                }
-            ]
-        }
-
-    elif event.event_type == "session_end":
-        emoji = ":white_check_mark:" if event.reason == "idle_timeout" else ":checkered_flag:"
-        return {
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": (
-                            f"{emoji} *Session ended*\n"
-                            f"Session: `{event.session_id[:8]}`\n"
-                            f"Reason: {event.reason}\n"
-                            f"Messages: {event.message_count}, Tools: {event.tool_count}"
-                        ),
-                    },
-                }
-            ]
-        }
-
-    elif event.event_type == "session_start":
-        return {
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": (
-                            f":rocket: *New session started*\n"
-                            f"Session: `{event.session_id[:8]}`\n"
-                            f"Project: {event.project_slug}"
-                        ),
-                    },
-                }
-            ]
-        }
-
-    return None
-
-
-def send_to_slack(webhook_url: str, payload: dict) -> bool:
-    """Send a payload to a Slack webhook.
+    formatter = SLACK_FORMATTERS.get(event.event_type)
+    return formatter(event) if formatter else None
 
-    Args:
-        webhook_url: Slack webhook URL
-        payload: Slack message payload
 
-    Returns:
-        True if successful, False otherwise
+class SlackSender:
+    """Post Slack payloads from a background thread.
+
+    submit() only queues the payload, so the watcher thread never waits
+    on the network. The sender thread merges payloads that queue up
+    together into one message (up to max_batch) and keeps its HTTPS
+    connection open between posts.
     """
-    try:
-        req = Request(
-            webhook_url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urlopen(req, timeout=10) as response:
-            return response.status == 200
-    except (HTTPError, URLError, TimeoutError) as e:
-        print(f"Failed to send to Slack: {e}", file=sys.stderr)
+
+    def __init__(self, webhook_url: str, stats: dict, max_batch: int = 8):
+        url = urlsplit(webhook_url)
+        self.host = url.netloc
+        self.path = url.path or "/"
+        self.stats = stats
+        self.max_batch = max_batch
+        self.queue: queue.Queue = queue.Queue(maxsize=1024)
+        self.conn: http.client.HTTPSConnection | None = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, payload: dict) -> None:
+        """Queue a payload for sending, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(payload)
+        except queue.Full:
+            self.stats["failed"] += 1
+
+    def close(self) -> None:
+        """Send everything still queued, then stop the sender thread."""
+        self.queue.put(None)
+        self.thread.join(timeout=15)
+
+    def _run(self) -> None:
+        while True:
+            payloads = [self.queue.get()]
+            # Merge whatever else is already waiting into the same message
+            while payloads[-1] is not None and len(payloads) < self.max_batch:
+                try:
+                    payloads.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = payloads[-1] is None
+            if stopping:
+                payloads.pop()
+            if payloads:
+                merged = {"blocks": [b for p in payloads for b in p["blocks"]]}
+                if self._post(merged):
+                    self.stats["sent"] += len(payloads)
+                    print(f"Sent {len(payloads)} event(s) to Slack")
+                else:
+                    self.stats["failed"] += len(payloads)
+            if stopping:
+                break
+
+        if self.conn is not None:
+            self.conn.close()
+
+    def _post(self, payload: dict) -> bool:
+        """POST one payload over the persistent connection."""
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        # Retry once on a fresh connection if Slack closed the idle one
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPSConnection(self.host, timeout=10)
+            try:
+                self.conn.request("POST", self.path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                response.read()
+                if response.status == 200:
+                    return True
+                print(f"Slack returned HTTP {response.status}", file=sys.stderr)
+                return False
+            except (OSError, http.client.HTTPException) as e:
+                self.conn.close()
+                self.conn = None
+                if attempt:
+                    print(f"Failed to send to Slack: {e}", file=sys.stderr)
         return False
 
 
@@ -155,40 +208,33 @@ def main():
         print("3. Create webhook for your channel")
         sys.exit(1)
 
+    from claude_sessions.realtime import SessionWatcher
+
     # Create watcher
     watcher = SessionWatcher()
 
-    # Define which events to send
-    # Only send: errors, tool errors, session start/end
-    event_filter = filters.or_(
-        filters.event_type("error"),
-        filters.event_type("session_start"),
-        filters.event_type("session_end"),
-        filters.has_error(),  # Includes tool_result with is_error=True
-    )
-
     # Track stats
     stats = {"sent": 0, "skipped": 0, "failed": 0}
+    sender = SlackSender(slack_url, stats)
 
+    # Called for every event: the defaults bind these lookups once, so
+    # the body reads fast locals instead of globals and attributes
     @watcher.on_any
-    def handle_event(event: SessionEventType) -> None:
-        # Apply filter
-        if not event_filter(event):
-            stats["skipped"] += 1
-            return
-
-        # Format for Slack
-        payload = format_slack_message(event)
+    def handle_event(
+        event: SessionEventType,
+        _formatters=SLACK_FORMATTERS,
+        _submit=sender.submit,
+        _stats=stats,
+    ) -> None:
+        # Format for Slack; events without a formatter are not sent
+        formatter = _formatters.get(event.event_type)
+        payload = formatter(event) if formatter else None
         if payload is None:
-            stats["skipped"] += 1
+            _stats["skipped"] += 1
             return
 
-        # Send to Slack
-        if send_to_slack(slack_url, payload):
-            stats["sent"] += 1
-            print(f"Sent {event.event_type} to Slack")
-        else:
-            stats["failed"] += 1
+        # Queue for the sender thread
+        _submit(payload)
 
     print("=" * 60)
     print("Slack Webhook Integration")
@@ -202,6 +248,8 @@ def main():
     except KeyboardInterrupt:
         print()
 
+    sender.close()
+
     print()
     print("=" * 60)
     print("Summary:")
@@ -33,44 +33,106 @@ This format is compatible with:
 - Grafana Loki - JSON labels
 """
 
+from __future__ import annotations
+
 import argparse
+import atexit
 import json
 import sys
-from datetime import datetime, timezone
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory for development
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from claude_sessions.realtime import SessionWatcher, filters
-from claude_sessions.realtime.formatters import JsonFormatter
-from claude_sessions.realtime.events import SessionEventType
+# The realtime API is imported in main() after argument parsing, so --help
+# doesn't pay for loading it
+if TYPE_CHECKING:
+    from claude_sessions.realtime.events import SessionEventType
+
+# orjson is much faster than json.dumps for the per-event output
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def write_json_line(data: dict, pretty: bool = False) -> None:
+    """Write one JSON log line to the (buffered) stdout."""
+    if pretty:
+        line = json.dumps(data, indent=2, default=str).encode("utf-8") + b"\n"
+    elif ORJSON_AVAILABLE:
+        line = orjson.dumps(data, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        line = json.dumps(data, default=str).encode("utf-8") + b"\n"
+    sys.stdout.buffer.write(line)
+
+
+def start_periodic_flush(interval: float = 0.2) -> None:
+    """Flush stdout every `interval` seconds from a background thread.
+
+    Log lines are written without flushing, so a burst of events costs
+    one write() per flush instead of one per line, while a quiet
+    stream still reaches the log shipper within `interval`. The last
+    lines are flushed at exit.
+    """
+
+    def flush_loop() -> None:
+        while True:
+            time.sleep(interval)
+            sys.stdout.buffer.flush()
+
+    threading.Thread(target=flush_loop, daemon=True).start()
+    atexit.register(sys.stdout.buffer.flush)
+
+
+def level_for(event: SessionEventType) -> str:
+    """Determine the log level of an event from its type alone."""
+    if event.event_type == "error":
+        return "error"
+    elif event.event_type == "tool_result" and event.is_error:
+        return "warning"
+    elif event.event_type in ("session_start", "session_end"):
+        return "info"
+    return "debug"
 
 
-def enrich_log_entry(event: SessionEventType, base_data: dict) -> dict:
+# [second, "YYYY-MM-DDTHH:MM:SS"] for the most recent timestamp
+_last_second: list = [0, ""]
+
+
+def now_iso() -> str:
+    """Return the current UTC time in ISO 8601 format.
+
+    The date and time-of-day part is only formatted once per second; within
+    a second just the microseconds are filled in.
+    """
+    t = time.time()
+    sec = int(t)
+    if sec != _last_second[0]:
+        _last_second[0] = sec
+        _last_second[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+    return f"{_last_second[1]}.{int((t - sec) * 1e6):06d}+00:00"
+
+
+def enrich_log_entry(level: str, base_data: dict) -> dict:
     """Enrich a log entry with standard logging fields.
 
     Args:
-        event: The session event
+        level: Log level from level_for()
         base_data: Base serialized event data from JsonFormatter
 
     Returns:
         Enriched log entry with standard logging fields
     """
-    # Determine log level based on event type
-    if event.event_type == "error":
-        level = "error"
-    elif event.event_type == "tool_result" and event.is_error:
-        level = "warning"
-    elif event.event_type in ("session_start", "session_end"):
-        level = "info"
-    else:
-        level = "debug"
-
     # Build enriched entry
     entry = {
         # Standard logging fields (at top for visibility)
-        "@timestamp": datetime.now(timezone.utc).isoformat(),
+        "@timestamp": now_iso(),
         "logger": "claude-sessions",
         "level": level,
         # Event data
@@ -113,6 +175,10 @@ def main():
     )
 
     args = parser.parse_args()
+    start_periodic_flush()
+
+    from claude_sessions.realtime import SessionWatcher, filters
+    from claude_sessions.realtime.formatters import JsonFormatter
 
     # Build filter based on arguments
     filter_list = []
@@ -137,7 +203,7 @@ def main():
 
     # Log startup
     startup_log = {
-        "@timestamp": datetime.now(timezone.utc).isoformat(),
+        "@timestamp": now_iso(),
         "logger": "claude-sessions",
         "level": "info",
         "message": "Session monitoring started",
@@ -147,32 +213,40 @@ def main():
             "min_level": args.min_level,
         },
     }
-    print(json.dumps(startup_log))
-    sys.stdout.flush()
+    write_json_line(startup_log)
 
+    # Called for every event: the defaults bind these lookups once, so
+    # the body reads fast locals instead of globals and attributes
     @watcher.on_any
-    def log_event(event: SessionEventType) -> None:
+    def log_event(
+        event: SessionEventType,
+        _level_for=level_for,
+        _filter=event_filter,
+        _to_dict=formatter.to_dict,
+        _enrich=enrich_log_entry,
+        _levels=level_order,
+        _min_level=min_level_num,
+        _write=write_json_line,
+        _pretty=args.pretty,
+    ) -> None:
+        # Apply the level filter first: it is cheap and needs no
+        # serialization, so discarded events cost almost nothing
+        level = _level_for(event)
+        if _levels[level] < _min_level:
+            return
+
         # Apply event filter if configured
-        if event_filter and not event_filter(event):
+        if _filter and not _filter(event):
             return
 
         # Get base serialized data
-        base_data = json.loads(formatter.format(event))
+        base_data = _to_dict(event)
 
         # Enrich with logging fields
-        log_entry = enrich_log_entry(event, base_data)
-
-        # Apply level filter
-        event_level = level_order.get(log_entry["level"], 0)
-        if event_level < min_level_num:
-            return
+        log_entry = _enrich(level, base_data)
 
         # Output
-        if args.pretty:
-            print(json.dumps(log_entry, indent=2, default=str))
-        else:
-            print(json.dumps(log_entry, default=str))
-        sys.stdout.flush()
+        _write(log_entry, pretty=_pretty)
 
     try:
         watcher.start()
@@ -181,12 +255,12 @@ def main():
 
     # Log shutdown
     shutdown_log = {
-        "@timestamp": datetime.now(timezone.utc).isoformat(),
+        "@timestamp": now_iso(),
         "logger": "claude-sessions",
         "level": "info",
         "message": "Session monitoring stopped",
     }
-    print(json.dumps(shutdown_log))
+    write_json_line(shutdown_log)
 
 
 if __name__ == "__main__":
@@ -6,12 +6,29 @@ from pathlib import Path
 from typing import Any, Dict
 import pytest
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from claude_sessions.models import (
     TextBlock, ToolUseBlock, ToolResultBlock,
     Message, MessageRole, ToolCall, Thread, Agent, Session, Project
 )
 
 
+def dumps_jsonl(entries: list) -> bytes:
+    """Serialize entries as JSONL bytes, one entry per line."""
+    if ORJSON_AVAILABLE:
+        return b"".join(orjson.dumps(entry) + b"\n" for entry in entries)
+    return "".join(json.dumps(entry) + "\n" for entry in entries).encode()
+
+
+# The sample_* fixtures below, and the simple model fixtures further down,
+# are built once per test session and shared by every test that requests
+# them: copy an entry or model before modifying it.
+
 # Sample UUIDs for consistent testing
 SAMPLE_SESSION_ID = "abc12345-1234-5678-9abc-def012345678"
 SAMPLE_UUID_1 = "msg-11111111-1111-1111-1111-111111111111"
@@ -21,19 +38,19 @@ SAMPLE_TOOL_USE_ID = "toolu_01ABC123DEF456"
 SAMPLE_AGENT_ID = "agent-99999999-9999-9999-9999-999999999999"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_timestamp() -> str:
     """Return a sample ISO timestamp string."""
     return "2024-01-15T10:30:00.000Z"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_datetime() -> datetime:
     """Return a sample datetime object."""
     return datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user_message_entry() -> Dict[str, Any]:
     """Valid JSONL entry for a user message."""
     return {
@@ -52,7 +69,7 @@ def sample_user_message_entry() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_assistant_message_entry() -> Dict[str, Any]:
     """Valid JSONL entry for an assistant message without tools."""
     return {
@@ -72,7 +89,7 @@ def sample_assistant_message_entry() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool_use_entry() -> Dict[str, Any]:
     """Valid JSONL entry for an assistant message with tool use."""
     return {
@@ -97,7 +114,7 @@ def sample_tool_use_entry() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool_result_entry() -> Dict[str, Any]:
     """Valid JSONL entry for a user message with tool result."""
     return {
@@ -119,7 +136,7 @@ def sample_tool_result_entry() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool_result_error_entry() -> Dict[str, Any]:
     """Valid JSONL entry for a tool result with error."""
     return {
@@ -142,7 +159,7 @@ def sample_tool_result_error_entry() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_agent_message_entry() -> Dict[str, Any]:
     """Valid JSONL entry for an agent (sub-agent) message."""
     return {
@@ -162,7 +179,7 @@ def sample_agent_message_entry() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_queue_operation_entry() -> Dict[str, Any]:
     """Non-message JSONL entry (should be skipped)."""
     return {
@@ -177,9 +194,7 @@ def temp_jsonl_file(tmp_path):
     """Factory fixture to create temporary JSONL files with content."""
     def _create_jsonl(entries: list, filename: str = "session.jsonl") -> Path:
         file_path = tmp_path / filename
-        with open(file_path, "w") as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + "\n")
+        file_path.write_bytes(dumps_jsonl(entries))
         return file_path
     return _create_jsonl
 
@@ -197,39 +212,40 @@ def mock_session_directory(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
-def mock_session_file(mock_session_directory, sample_user_message_entry, sample_tool_use_entry, sample_tool_result_entry):
-    """Create a mock session file with sample entries."""
-    project_dir = mock_session_directory / "projects" / "my-project"
-    session_file = project_dir / f"{SAMPLE_SESSION_ID}.jsonl"
-
+@pytest.fixture(scope="session")
+def mock_session_content(sample_user_message_entry, sample_tool_use_entry, sample_tool_result_entry) -> bytes:
+    """JSONL text of mock_session_file, serialized once per test session."""
     entries = [
         sample_user_message_entry,
         sample_tool_use_entry,
         sample_tool_result_entry
     ]
+    return dumps_jsonl(entries)
 
-    with open(session_file, "w") as f:
-        for entry in entries:
-            f.write(json.dumps(entry) + "\n")
 
+@pytest.fixture
+def mock_session_file(mock_session_directory, mock_session_content):
+    """Create a mock session file with sample entries."""
+    project_dir = mock_session_directory / "projects" / "my-project"
+    session_file = project_dir / f"{SAMPLE_SESSION_ID}.jsonl"
+    session_file.write_bytes(mock_session_content)
     return session_file
 
 
 # Helper constants for tests
-@pytest.fixture
+@pytest.fixture(scope="session")
 def session_id():
     """Return the sample session ID."""
     return SAMPLE_SESSION_ID
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_use_id():
     """Return the sample tool use ID."""
     return SAMPLE_TOOL_USE_ID
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agent_id():
     """Return the sample agent ID."""
     return SAMPLE_AGENT_ID
@@ -239,13 +255,13 @@ def agent_id():
 # Content Block Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def text_block():
     """Create a simple TextBlock."""
     return TextBlock(text="Sample text content")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_use_block():
     """Create a ToolUseBlock for Read tool."""
     return ToolUseBlock(
@@ -255,7 +271,7 @@ def tool_use_block():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_result_block():
     """Create a successful ToolResultBlock."""
     return ToolResultBlock(
@@ -265,7 +281,7 @@ def tool_result_block():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_result_error_block():
     """Create an error ToolResultBlock."""
     return ToolResultBlock(
@@ -279,7 +295,7 @@ def tool_result_error_block():
 # Message Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_message(sample_datetime):
     """Create a user Message object."""
     return Message(
@@ -295,7 +311,7 @@ def user_message(sample_datetime):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def assistant_message(sample_datetime):
     """Create an assistant Message object."""
     return Message(
@@ -358,7 +374,7 @@ def agent_message(sample_datetime):
 # Thread Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_thread(user_message, assistant_message):
     """Create a simple two-message thread."""
     return Thread(messages=[user_message, assistant_message])
@@ -384,7 +400,7 @@ def empty_thread():
 # Session Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_session(simple_thread):
     """Create a simple Session without agents."""
     return Session(
@@ -439,7 +455,7 @@ def empty_session():
 # Project Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_project(simple_session):
     """Create a Project with one session."""
     return Project(
@@ -511,8 +527,8 @@ def multi_session_project(sample_datetime):
 def jsonl_with_empty_lines(tmp_path):
     """Create JSONL file with empty lines."""
     file_path = tmp_path / "empty_lines.jsonl"
-    content = '{"type": "user", "uuid": "1"}\n\n{"type": "assistant", "uuid": "2"}\n   \n'
-    file_path.write_text(content)
+    content = b'{"type": "user", "uuid": "1"}\n\n{"type": "assistant", "uuid": "2"}\n   \n'
+    file_path.write_bytes(content)
     return file_path
 
 
@@ -520,36 +536,46 @@ def jsonl_with_empty_lines(tmp_path):
 def jsonl_with_invalid_json(tmp_path):
     """Create JSONL file with invalid JSON."""
     file_path = tmp_path / "invalid.jsonl"
-    content = '{"type": "user", "uuid": "1"}\nnot valid json\n{"type": "assistant", "uuid": "2"}\n'
-    file_path.write_text(content)
+    content = b'{"type": "user", "uuid": "1"}\nnot valid json\n{"type": "assistant", "uuid": "2"}\n'
+    file_path.write_bytes(content)
     return file_path
 
 
-@pytest.fixture
-def mock_project_directory_with_sessions(tmp_path, sample_user_message_entry, sample_agent_message_entry):
-    """Create a complete mock project directory with multiple sessions."""
-    projects_dir = tmp_path / "projects"
-    project_dir = projects_dir / "-home-mgm-project"
-    project_dir.mkdir(parents=True)
+@pytest.fixture(scope="session")
+def mock_project_files(sample_user_message_entry, sample_agent_message_entry) -> Dict[str, bytes]:
+    """File name -> JSONL text for mock_project_directory_with_sessions.
 
+    Serialized once per test session; each test still gets its own files.
+    """
     # Session 1 - main file
     session1_id = "session-001"
-    session1_file = project_dir / f"{session1_id}.jsonl"
     entry1 = sample_user_message_entry.copy()
     entry1["sessionId"] = session1_id
-    session1_file.write_text(json.dumps(entry1) + "\n")
 
     # Session 2 - main file + agent file
     session2_id = "session-002"
-    session2_file = project_dir / f"{session2_id}.jsonl"
     entry2 = sample_user_message_entry.copy()
     entry2["sessionId"] = session2_id
-    session2_file.write_text(json.dumps(entry2) + "\n")
 
     # Agent file for session 2
-    agent_file = project_dir / "agent-abc123.jsonl"
     agent_entry = sample_agent_message_entry.copy()
     agent_entry["sessionId"] = session2_id
-    agent_file.write_text(json.dumps(agent_entry) + "\n")
+
+    return {
+        f"{session1_id}.jsonl": dumps_jsonl([entry1]),
+        f"{session2_id}.jsonl": dumps_jsonl([entry2]),
+        "agent-abc123.jsonl": dumps_jsonl([agent_entry]),
+    }
+
+
+@pytest.fixture
+def mock_project_directory_with_sessions(tmp_path, mock_project_files):
+    """Create a complete mock project directory with multiple sessions."""
+    projects_dir = tmp_path / "projects"
+    project_dir = projects_dir / "-home-mgm-project"
+    project_dir.mkdir(parents=True)
+
+    for name, content in mock_project_files.items():
+        (project_dir / name).write_bytes(content)
 
     return tmp_path
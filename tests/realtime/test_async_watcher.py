@@ -36,6 +36,25 @@ def make_user_entry(session_id: str, uuid: str, text: str = "Hello") -> dict:
     }
 
 
+# The one session seeded_watcher writes, serialized once for the module
+SEEDED_SESSION_ID = "test-session-12345678"
+SEEDED_SESSION_LINE = (
+    json.dumps(make_user_entry(SEEDED_SESSION_ID, "msg-1")) + "\n"
+).encode()
+
+
+def make_watcher_config(base_path: Path) -> WatcherConfig:
+    """Create a WatcherConfig pointing to a mock directory."""
+    return WatcherConfig(
+        base_path=base_path,
+        poll_interval=0.1,
+        idle_timeout=timedelta(seconds=1),
+        end_timeout=timedelta(seconds=2),
+        emit_session_events=True,
+        process_existing=True,  # Must be True to discover files created before watcher starts
+    )
+
+
 @pytest.fixture
 def mock_claude_dir(tmp_path):
     """Create a mock ~/.claude directory structure."""
@@ -47,19 +66,40 @@ def mock_claude_dir(tmp_path):
 @pytest.fixture
 def watcher_config(mock_claude_dir):
     """Create a WatcherConfig pointing to mock directory."""
-    return WatcherConfig(
-        base_path=mock_claude_dir,
-        poll_interval=0.1,
-        idle_timeout=timedelta(seconds=1),
-        end_timeout=timedelta(seconds=2),
-        emit_session_events=True,
-        process_existing=True,  # Must be True to discover files created before watcher starts
-    )
+    return make_watcher_config(mock_claude_dir)
+
+
+@pytest.fixture
+def seeded_watcher(mock_claude_dir, watcher_config):
+    """Create a watcher with one single-message session file already present.
+
+    Returns:
+        Tuple of (watcher, session_file)
+    """
+    project_dir = mock_claude_dir / "projects" / "test-project"
+    project_dir.mkdir(parents=True)
+
+    session_file = project_dir / f"{SEEDED_SESSION_ID}.jsonl"
+    session_file.write_bytes(SEEDED_SESSION_LINE)
+
+    return AsyncSessionWatcher(config=watcher_config), session_file
+
+
+@pytest.fixture(scope="class")
+def class_watcher_config(tmp_path_factory):
+    """WatcherConfig shared by a class whose tests never touch the files."""
+    base_path = tmp_path_factory.mktemp("claude")
+    (base_path / "projects").mkdir()
+    return make_watcher_config(base_path)
 
 
 class TestAsyncSessionWatcherBasics:
     """Basic AsyncSessionWatcher tests."""
 
+    @pytest.fixture
+    def watcher_config(self, class_watcher_config):
+        return class_watcher_config
+
     @pytest.mark.asyncio
     async def test_initialization(self, watcher_config):
         """AsyncSessionWatcher should initialize correctly."""
@@ -123,49 +163,24 @@ class TestAsyncDecoratorHandlers:
     """Test decorator-style handler registration."""
 
     @pytest.mark.asyncio
-    async def test_sync_handler_decorator(self, mock_claude_dir, watcher_config):
-        """Sync handlers should work with @watcher.on()."""
-        project_dir = mock_claude_dir / "projects" / "test-project"
-        project_dir.mkdir(parents=True)
-
-        session_id = "test-session-12345678"
-        session_file = project_dir / f"{session_id}.jsonl"
-        session_file.write_text(
-            json.dumps(make_user_entry(session_id, "msg-1")) + "\n"
-        )
-
-        watcher = AsyncSessionWatcher(config=watcher_config)
+    @pytest.mark.parametrize("is_async", [False, True])
+    async def test_handler_decorator(self, seeded_watcher, is_async):
+        """Sync and async handlers should both work with @watcher.on()."""
+        watcher, _ = seeded_watcher
         received = []
 
-        @watcher.on("message")
-        def handler(event):
-            received.append(event)
+        if is_async:
+            @watcher.on("message")
+            async def handler(event):
+                await asyncio.sleep(0.01)  # Simulate async work
+                received.append(event)
+        else:
+            @watcher.on("message")
+            def handler(event):
+                received.append(event)
 
-        await watcher.run_for(0.3)
-
-        assert len(received) >= 1
-
-    @pytest.mark.asyncio
-    async def test_async_handler_decorator(self, mock_claude_dir, watcher_config):
-        """Async handlers should work with @watcher.on()."""
-        project_dir = mock_claude_dir / "projects" / "test-project"
-        project_dir.mkdir(parents=True)
-
-        session_id = "test-session-12345678"
-        session_file = project_dir / f"{session_id}.jsonl"
-        session_file.write_text(
-            json.dumps(make_user_entry(session_id, "msg-1")) + "\n"
-        )
-
-        watcher = AsyncSessionWatcher(config=watcher_config)
-        received = []
-
-        @watcher.on("message")
-        async def handler(event):
-            await asyncio.sleep(0.01)  # Simulate async work
-            received.append(event)
-
-        await watcher.run_for(0.3)
+        async with watcher:
+            assert await watcher.wait_for_events(event_type="message", timeout=2.0)
 
         assert len(received) >= 1
 
@@ -187,18 +202,9 @@ class TestAsyncRunFor:
         assert not watcher.is_running
 
     @pytest.mark.asyncio
-    async def test_run_for_discovers_session(self, mock_claude_dir, watcher_config):
+    async def test_run_for_discovers_session(self, seeded_watcher):
         """run_for() should discover and process sessions."""
-        project_dir = mock_claude_dir / "projects" / "test-project"
-        project_dir.mkdir(parents=True)
-
-        session_id = "test-session-12345678"
-        session_file = project_dir / f"{session_id}.jsonl"
-        session_file.write_text(
-            json.dumps(make_user_entry(session_id, "msg-1")) + "\n"
-        )
-
-        watcher = AsyncSessionWatcher(config=watcher_config)
+        watcher, _ = seeded_watcher
         received = []
 
         @watcher.on_any
@@ -211,9 +217,33 @@ class TestAsyncRunFor:
         assert len(received) >= 1
 
 
+class TestAsyncWaitForEvents:
+    """Test wait_for_events()."""
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_events(self, watcher_config):
+        """wait_for_events() should return False when nothing arrives."""
+        watcher = AsyncSessionWatcher(config=watcher_config)
+
+        async with watcher:
+            assert not await watcher.wait_for_events(event_type="message", timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_wait_requires_running_watcher(self, watcher_config):
+        """wait_for_events() should fail before start()."""
+        watcher = AsyncSessionWatcher(config=watcher_config)
+
+        with pytest.raises(RuntimeError):
+            await watcher.wait_for_events()
+
+
 class TestAsyncProperties:
     """Test async watcher properties."""
 
+    @pytest.fixture
+    def watcher_config(self, class_watcher_config):
+        return class_watcher_config
+
     @pytest.mark.asyncio
     async def test_handler_count(self, watcher_config):
         """handler_count should track registered handlers."""
@@ -253,18 +283,9 @@ class TestAsyncErrorHandling:
     """Test async error handling."""
 
     @pytest.mark.asyncio
-    async def test_handler_exception_isolated(self, mock_claude_dir, watcher_config):
+    async def test_handler_exception_isolated(self, seeded_watcher):
         """Handler exceptions should not crash the watcher."""
-        project_dir = mock_claude_dir / "projects" / "test-project"
-        project_dir.mkdir(parents=True)
-
-        session_id = "test-session-12345678"
-        session_file = project_dir / f"{session_id}.jsonl"
-        session_file.write_text(
-            json.dumps(make_user_entry(session_id, "msg-1")) + "\n"
-        )
-
-        watcher = AsyncSessionWatcher(config=watcher_config)
+        watcher, _ = seeded_watcher
         good_received = []
 
         @watcher.on("message")
@@ -276,7 +297,8 @@ class TestAsyncErrorHandling:
             good_received.append(event)
 
         # Should not crash
-        await watcher.run_for(0.3)
+        async with watcher:
+            assert await watcher.wait_for_events(event_type="message", timeout=2.0)
 
         # Good handler should still be called
         assert len(good_received) >= 1
@@ -1,6 +1,7 @@
 """Tests for claude_sessions.realtime.emitter module."""
 
 from datetime import datetime, timezone
+from functools import partial
 
 import pytest
 
@@ -216,6 +217,70 @@ class TestEventDispatch:
         assert len(received) == 2
         assert total == 2
 
+    def test_emit_many_preserves_order(self, emitter, sample_message_event, sample_tool_use_event):
+        """emit_many() should dispatch in input order across event types."""
+        received = []
+
+        @emitter.on("message")
+        def on_message(event):
+            received.append(("message", event))
+
+        @emitter.on_any
+        def on_any(event):
+            received.append(("any", event))
+
+        events = [sample_message_event, sample_tool_use_event, sample_message_event]
+        total = emitter.emit_many(iter(events))
+
+        assert total == 5
+        assert received == [
+            ("message", sample_message_event),
+            ("any", sample_message_event),
+            ("any", sample_tool_use_event),
+            ("message", sample_message_event),
+            ("any", sample_message_event),
+        ]
+
+    def test_registration_changes_invalidate_cache(self, emitter, sample_message_event):
+        """Handlers added or removed after an emit take effect immediately."""
+        first, second = [], []
+        emitter.on("message", first.append)
+        emitter.emit(sample_message_event)
+
+        emitter.on_any(second.append)
+        emitter.emit(sample_message_event)
+        assert len(first) == 2
+        assert len(second) == 1
+
+        emitter.off("message", first.append)
+        emitter.clear("session_start")
+        emitter.emit(sample_message_event)
+        assert len(first) == 2
+        assert len(second) == 2
+
+
+    def test_handler_registered_during_emit_is_not_lost(self, emitter, sample_message_event):
+        """A handler added while an emit resolves handlers is used next time."""
+        received = []
+
+        def late_handler(event):
+            received.append(event)
+
+        class RegisteringHandlers(dict):
+            """Registers late_handler midway through the first lookup."""
+
+            def get(self, key, default=None):
+                if key == EventEmitter._ANY_KEY and not received and late_handler not in self["message"]:
+                    emitter.on("message", late_handler)
+                return super().get(key, default)
+
+        emitter.on("message", lambda event: None)
+        emitter._handlers = RegisteringHandlers(emitter._handlers)
+
+        emitter.emit(sample_message_event)
+        assert emitter.emit(sample_message_event) == 2
+        assert received == [sample_message_event]
+
 
 class TestExceptionHandling:
     """Test that handler exceptions don't crash the emitter."""
@@ -240,6 +305,16 @@ class TestExceptionHandling:
         # Count reflects only successfully completed handlers
         assert count == 1
 
+    def test_failing_partial_handler_isolated(self, emitter, sample_message_event):
+        """Handlers without a __name__ (e.g. partials) can fail safely too."""
+        def bad_handler(tag, event):
+            raise ValueError(tag)
+
+        emitter.on("message", partial(bad_handler, "x"))
+
+        assert emitter.emit(sample_message_event) == 0
+        assert emitter.emit_many([sample_message_event]) == 0
+
 
 class TestClearHandlers:
     """Test handler clearing functionality."""
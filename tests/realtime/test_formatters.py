@@ -252,6 +252,14 @@ class TestJsonFormatter:
         assert data["event_type"] == "error"
         assert "error_message" in data
 
+    def test_to_dict_matches_format(self, tool_use_event):
+        """to_dict() returns the same data format() encodes."""
+        formatter = JsonFormatter()
+
+        assert formatter.to_dict(tool_use_event) == json.loads(
+            formatter.format(tool_use_event)
+        )
+
     def test_each_line_is_separate_json(self, message_event, tool_use_event):
         """Each formatted event should be a single JSON line (JSONL format)."""
         formatter = JsonFormatter()
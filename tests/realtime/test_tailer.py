@@ -2,11 +2,20 @@
 
 import json
 import os
+import time
 from pathlib import Path
 
 import pytest
 
-from claude_sessions.realtime.tailer import JSONLTailer, MultiFileTailer, TailerState
+from claude_sessions.realtime import tailer as tailer_module
+from claude_sessions.realtime.tailer import (
+    EntryBatch,
+    EntryRing,
+    JSONLTailer,
+    LazyEntry,
+    MultiFileTailer,
+    TailerState,
+)
 
 
 class TestTailerState:
@@ -18,20 +27,31 @@ class TestTailerState:
 
         assert state.position == 0
         assert state.inode == 0
-        assert state.line_buffer == ""
+        assert state.line_buffer == b""
 
     def test_reset(self, tmp_path):
         """reset() should clear position and buffer."""
         state = TailerState(
             file_path=tmp_path / "test.jsonl",
             position=100,
-            line_buffer="partial"
         )
+        state.add_pending(b"partial")
 
         state.reset()
 
         assert state.position == 0
-        assert state.line_buffer == ""
+        assert state.line_buffer == b""
+        assert state.pending_len == 0
+
+    def test_pending_chunks_join(self, tmp_path):
+        """Pending pieces should join into a single line buffer."""
+        state = TailerState(file_path=tmp_path / "test.jsonl")
+        state.add_pending(b'{"a":')
+        state.add_pending(b' 1')
+
+        assert state.pending_chunks == [b'{"a":', b' 1']
+        assert state.pending_len == 7
+        assert state.line_buffer == b'{"a": 1'
 
 
 class TestJSONLTailer:
@@ -211,6 +231,81 @@ class TestJSONLTailer:
         assert len(entries) == 1
         assert entries[0] == {"new": True}
 
+    def test_whitespace_and_crlf_lines_skipped(self, tmp_path):
+        """Blank, CRLF and whitespace-only lines should produce no entries."""
+        file_path = tmp_path / "blank.jsonl"
+        file_path.write_bytes(b'{"id": 1}\r\n\r\n   \n\t\n{"id": 2}\n')
+
+        tailer = JSONLTailer(file_path)
+        assert tailer.read_new() == [{"id": 1}, {"id": 2}]
+        tailer.close()
+
+    def test_non_json_lines_rejected_before_parsing(self, tmp_path, monkeypatch):
+        """Lines that can't be JSON containers shouldn't reach the parser."""
+        file_path = tmp_path / "noise.jsonl"
+        file_path.write_bytes(
+            b'{"id": 1}\r\n'
+            b"plain text log line\n"
+            b'{"truncated": 1\n'
+            b'[1, 2]\n'
+            b' {"id": 2} \n'
+        )
+
+        parsed = []
+        real_loads = tailer_module._loads
+
+        def counting_loads(line):
+            parsed.append(line)
+            return real_loads(line)
+
+        monkeypatch.setattr(tailer_module, "_loads", counting_loads)
+
+        tailer = JSONLTailer(file_path)
+        assert tailer.read_new() == [{"id": 1}, [1, 2], {"id": 2}]
+        tailer.close()
+
+        assert b"plain text log line" not in parsed
+        assert b'{"truncated": 1' not in parsed
+        # Small reads go through the scratch buffer but still yield bytes
+        assert all(type(line) is bytes for line in parsed)
+
+    def test_invalid_utf8_replaced(self, tmp_path):
+        """Lines with invalid UTF-8 should be decoded with replacement."""
+        file_path = tmp_path / "invalid_utf8.jsonl"
+        file_path.write_bytes(b'{"text": "bad \xff byte"}\n{"id": 2}\n')
+
+        tailer = JSONLTailer(file_path)
+        entries = tailer.read_new()
+
+        assert entries == [{"text": "bad \ufffd byte"}, {"id": 2}]
+
+    def test_multibyte_character_split_across_reads(self, tmp_path):
+        """A UTF-8 sequence split between writes should decode intact."""
+        file_path = tmp_path / "split.jsonl"
+        encoded = '{"text": "caf\u00e9 \u2603"}\n'.encode("utf-8")
+        cut = encoded.index("\u2603".encode("utf-8")) + 1
+        file_path.write_bytes(encoded[:cut])
+
+        tailer = JSONLTailer(file_path)
+        assert tailer.read_new() == []
+
+        with open(file_path, "ab") as f:
+            f.write(encoded[cut:])
+
+        assert tailer.read_new() == [{"text": "caf\u00e9 \u2603"}]
+        tailer.close()
+
+    def test_stdlib_json_backend(self, tmp_path, monkeypatch):
+        """Parsing should behave the same without orjson installed."""
+        monkeypatch.setattr(tailer_module, "_loads", json.loads)
+        file_path = tmp_path / "stdlib.jsonl"
+        file_path.write_bytes(b'{"id": 1}\nnot json\n{"text": "\xff"}\n')
+
+        tailer = JSONLTailer(file_path)
+        entries = tailer.read_new()
+
+        assert entries == [{"id": 1}, {"text": "\ufffd"}]
+
     def test_unicode_handling(self, tmp_path):
         """Tailer should handle UTF-8 content."""
         file_path = tmp_path / "unicode.jsonl"
@@ -254,6 +349,437 @@ class TestJSONLTailer:
         tailer.read_new()
         assert tailer.position == len(content.encode("utf-8"))
 
+    def test_descriptor_reused_across_reads(self, tmp_path):
+        """The file should be opened once and reused for later reads."""
+        file_path = tmp_path / "persistent.jsonl"
+        file_path.write_text(json.dumps({"id": 1}) + "\n")
+
+        tailer = JSONLTailer(file_path)
+        tailer.read_new()
+        fd = tailer.state.fd
+        assert fd is not None
+
+        with open(file_path, "a") as f:
+            f.write(json.dumps({"id": 2}) + "\n")
+
+        assert tailer.read_new() == [{"id": 2}]
+        assert tailer.state.fd == fd
+        tailer.close()
+
+    def test_close_releases_descriptor(self, tmp_path):
+        """close() should release the descriptor; reads reopen the file."""
+        file_path = tmp_path / "close.jsonl"
+        file_path.write_text(json.dumps({"id": 1}) + "\n")
+
+        with JSONLTailer(file_path) as tailer:
+            tailer.read_new()
+            assert tailer.state.fd is not None
+        assert tailer.state.fd is None
+
+        with open(file_path, "a") as f:
+            f.write(json.dumps({"id": 2}) + "\n")
+
+        assert tailer.read_new() == [{"id": 2}]
+        tailer.close()
+
+    def test_file_rotation_detection(self, tmp_path):
+        """Replacing the file should reopen it and read from the start."""
+        file_path = tmp_path / "rotate.jsonl"
+        file_path.write_text(json.dumps({"old": True}) + "\n")
+
+        tailer = JSONLTailer(file_path)
+        assert tailer.read_new() == [{"old": True}]
+
+        replacement = tmp_path / "rotate.jsonl.new"
+        replacement.write_text(
+            json.dumps({"new": 1}) + "\n" + json.dumps({"new": 2}) + "\n"
+        )
+        os.replace(replacement, file_path)
+
+        assert tailer.read_new() == [{"new": 1}, {"new": 2}]
+        tailer.close()
+
+    def test_access_pattern_hints(self, tmp_path, monkeypatch):
+        """Opening advises sequential access; read_all() also prefetches."""
+        calls = []
+        monkeypatch.setattr(
+            tailer_module, "_fadvise", lambda fd, advice: calls.append(advice)
+        )
+        file_path = tmp_path / "hints.jsonl"
+        file_path.write_text('{"id": 1}\n')
+
+        tailer = JSONLTailer(file_path)
+        tailer.read_new()
+        assert calls == [tailer_module._FADV_SEQUENTIAL]
+
+        calls.clear()
+        assert tailer.read_all() == [{"id": 1}]
+        assert calls == [tailer_module._FADV_SEQUENTIAL, tailer_module._FADV_WILLNEED]
+        tailer.close()
+
+    @pytest.mark.asyncio
+    async def test_read_all_async(self, tmp_path):
+        """read_all_async() should return the same entries as read_all()."""
+        file_path = tmp_path / "async.jsonl"
+        file_path.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(50)))
+
+        tailer = JSONLTailer(file_path)
+        entries = await tailer.read_all_async()
+
+        assert entries == [{"id": i} for i in range(50)]
+        assert entries == tailer.read_all()
+        tailer.close()
+
+    def test_iter_new_reads_in_bounded_chunks(self, tmp_path):
+        """iter_new() should yield every entry while reading small chunks."""
+        file_path = tmp_path / "iter.jsonl"
+        lines = [json.dumps({"id": i, "pad": "x" * (i % 7)}) for i in range(100)]
+        file_path.write_text("\n".join(lines) + "\n")
+
+        tailer = JSONLTailer(file_path)
+        entries = tailer.iter_new(chunk_size=64)
+
+        first = next(entries)
+        assert first["id"] == 0
+        # Only a chunk or so has been consumed so far
+        assert tailer.position < 200
+
+        rest = list(entries)
+        assert [e["id"] for e in rest] == list(range(1, 100))
+        assert tailer.position == file_path.stat().st_size
+        assert list(tailer.iter_new()) == []
+        tailer.close()
+
+    def test_scratch_buffer_reused(self, tmp_path):
+        """Small reads should land in one reused scratch buffer."""
+        file_path = tmp_path / "scratch.jsonl"
+        file_path.write_text('{"id": 1}\n{"id": 2')
+
+        tailer = JSONLTailer(file_path)
+        assert tailer.read_new() == [{"id": 1}]
+        scratch = tailer.state.scratch
+        assert len(scratch) > 0
+
+        with open(file_path, "a") as f:
+            f.write('}\n{"id": 3}\n')
+
+        assert tailer.read_new() == [{"id": 2}, {"id": 3}]
+        assert tailer.state.scratch is scratch
+        tailer.close()
+
+    def test_large_reads_use_memory_map(self, tmp_path, monkeypatch):
+        """Reads above the mmap threshold should parse the same entries."""
+        monkeypatch.setattr(tailer_module, "_MMAP_THRESHOLD", 16)
+        file_path = tmp_path / "mapped.jsonl"
+        entries = [{"id": i, "text": "x" * i} for i in range(50)]
+        file_path.write_text("\n".join(json.dumps(e) for e in entries) + "\n")
+
+        tailer = JSONLTailer(file_path)
+        assert tailer.read_new() == entries
+
+        # Appends start at an unaligned offset into the file
+        more = [{"id": "more", "n": i} for i in range(3)]
+        with open(file_path, "a") as f:
+            f.write("\n".join(json.dumps(e) for e in more) + "\n")
+
+        assert tailer.read_new() == more
+        assert tailer.position == file_path.stat().st_size
+        tailer.close()
+
+    def test_single_stat_per_poll(self, tmp_path, monkeypatch):
+        """A poll should stat the file once and skip the read when idle."""
+        file_path = tmp_path / "stat.jsonl"
+        file_path.write_text('{"id": 1}\n')
+        tailer = JSONLTailer(file_path)
+
+        calls = []
+
+        def counting(name, func):
+            def wrapper(*args, **kwargs):
+                calls.append(name)
+                return func(*args, **kwargs)
+            return wrapper
+
+        monkeypatch.setattr(os, "stat", counting("stat", os.stat))
+        monkeypatch.setattr(os, "fstat", counting("fstat", os.fstat))
+
+        assert tailer.read_new() == [{"id": 1}]
+        assert calls == ["stat"]
+
+        calls.clear()
+        assert tailer.read_new() == []
+        assert calls == ["stat"]
+        assert tailer.state.fd is not None
+        tailer.close()
+
+    def test_line_spanning_many_reads(self, tmp_path):
+        """A long line written across many polls should parse once complete."""
+        file_path = tmp_path / "long.jsonl"
+        file_path.write_text('{"text": "')
+
+        tailer = JSONLTailer(file_path)
+        assert tailer.read_new() == []
+
+        for _ in range(5):
+            with open(file_path, "a") as f:
+                f.write("x" * 100)
+            assert tailer.read_new() == []
+
+        assert len(tailer.state.pending_chunks) == 6
+
+        with open(file_path, "a") as f:
+            f.write('"}\n')
+
+        assert tailer.read_new() == [{"text": "x" * 500}]
+        assert not tailer.has_pending_data
+        assert tailer.state.pending_chunks == []
+        tailer.close()
+
+    def test_large_reads_split_in_bulk(self, tmp_path, monkeypatch):
+        """Bulk-split reads should keep partial-line buffering intact."""
+        monkeypatch.setattr(tailer_module, "_SPLIT_THRESHOLD", 8)
+        file_path = tmp_path / "bulk.jsonl"
+        file_path.write_text('{"id": 1}\n\n{"id": 2}\n{"id":')
+
+        tailer = JSONLTailer(file_path)
+        assert tailer.read_new() == [{"id": 1}, {"id": 2}]
+        assert tailer.state.line_buffer == b'{"id":'
+
+        with open(file_path, "a") as f:
+            f.write(' 3}\n{"id": 4}\n')
+
+        assert tailer.read_new() == [{"id": 3}, {"id": 4}]
+        assert not tailer.has_pending_data
+        tailer.close()
+
+
+class TestResumeSidecar:
+    """Test warm restarts from a saved position sidecar."""
+
+    def test_resume_skips_already_read_entries(self, tmp_path):
+        """A new tailer should continue where the saved one stopped."""
+        file_path = tmp_path / "session.jsonl"
+        sidecar = tmp_path / "session.pos"
+        file_path.write_text('{"id": 1}\n{"id": 2}\n{"id":')
+
+        with JSONLTailer(file_path, resume_from=sidecar) as tailer:
+            assert len(tailer.read_new()) == 2
+        assert sidecar.stat().st_size == 24
+
+        with open(file_path, "a") as f:
+            f.write(' 3}\n')
+
+        with JSONLTailer(file_path, resume_from=sidecar) as tailer:
+            # The pending partial line is re-read from its start
+            assert tailer.read_new() == [{"id": 3}]
+
+    def test_resume_ignored_after_rotation(self, tmp_path):
+        """A sidecar for a replaced file should be ignored."""
+        file_path = tmp_path / "session.jsonl"
+        sidecar = tmp_path / "session.pos"
+        file_path.write_text('{"id": 1}\n')
+
+        with JSONLTailer(file_path, resume_from=sidecar) as tailer:
+            tailer.read_new()
+
+        replacement = tmp_path / "new.jsonl"
+        replacement.write_text('{"id": 1}\n{"id": 2}\n')
+        os.replace(replacement, file_path)
+
+        with JSONLTailer(file_path, resume_from=sidecar) as tailer:
+            assert tailer.position == 0
+            assert len(tailer.read_new()) == 2
+
+    def test_save_state_requires_path(self, tmp_path):
+        """save_state() without a sidecar configured needs a path."""
+        file_path = tmp_path / "session.jsonl"
+        file_path.touch()
+        tailer = JSONLTailer(file_path)
+
+        with pytest.raises(ValueError):
+            tailer.save_state()
+
+        tailer.save_state(tmp_path / "explicit.pos")
+        assert (tmp_path / "explicit.pos").stat().st_size == 24
+        tailer.close()
+
+
+class TestLazyEntries:
+    """Test lazy-mode parsing in JSONLTailer."""
+
+    def test_type_read_without_parsing(self, tmp_path):
+        """Known entry types should be returned unparsed."""
+        file_path = tmp_path / "lazy.jsonl"
+        file_path.write_text(
+            '{"type": "queue-operation", "operation": "enqueue"}\n'
+            '{"parentUuid": null, "type": "user", "message": {"content": "hi"}}\n'
+        )
+
+        tailer = JSONLTailer(file_path, lazy=True)
+        entries = tailer.read_new()
+        tailer.close()
+
+        assert all(isinstance(e, LazyEntry) for e in entries)
+        assert [e["type"] for e in entries] == ["queue-operation", "user"]
+        assert not any(e.is_loaded for e in entries)
+
+        assert entries[1].get("message") == {"content": "hi"}
+        assert entries[1].is_loaded
+        assert entries[0] == {"type": "queue-operation", "operation": "enqueue"}
+
+    def test_nested_type_not_trusted(self, tmp_path):
+        """A "type" inside a nested object should force a full parse."""
+        file_path = tmp_path / "nested.jsonl"
+        file_path.write_text(
+            '{"message": {"type": "user"}, "type": "assistant"}\n'
+            '{"type": "unknown-kind"}\n'
+        )
+
+        tailer = JSONLTailer(file_path, lazy=True)
+        entries = tailer.read_new()
+        tailer.close()
+
+        assert entries == [
+            {"message": {"type": "user"}, "type": "assistant"},
+            {"type": "unknown-kind"},
+        ]
+        assert not any(isinstance(e, LazyEntry) for e in entries)
+
+    def test_malformed_lazy_entry_raises_on_access(self):
+        """Malformed lines surface a ValueError once a field is needed."""
+        entry = LazyEntry(b'{"type": "user", "message": ', "user")
+
+        assert entry["type"] == "user"
+        with pytest.raises(ValueError):
+            entry["message"]
+
+    def test_parser_skips_non_messages_without_parsing(self, tmp_path):
+        """IncrementalParser only needs the type to skip an entry."""
+        from claude_sessions.realtime import IncrementalParser
+
+        file_path = tmp_path / "skip.jsonl"
+        file_path.write_text('{"type": "summary", "summary": "done"}\n')
+
+        tailer = JSONLTailer(file_path, lazy=True)
+        (entry,) = tailer.read_new()
+        tailer.close()
+
+        assert IncrementalParser().parse_entry(entry) == []
+        assert not entry.is_loaded
+
+
+class TestEntryBatch:
+    """Test read_batch() and EntryBatch."""
+
+    def test_batch_holds_types_and_raw_lines(self, tmp_path):
+        """read_batch() should peek types and keep raw lines unparsed."""
+        file_path = tmp_path / "batch.jsonl"
+        file_path.write_text(
+            '{"type": "user", "id": 1}\n'
+            "\n"
+            '{"type": "summary", "id": 2}\n'
+            '{"id": 3}\n'
+        )
+
+        tailer = JSONLTailer(file_path)
+        batch = tailer.read_batch()
+        tailer.close()
+
+        assert isinstance(batch, EntryBatch)
+        assert len(batch) == 3
+        assert batch.types == ["user", "summary", None]
+        assert list(batch) == [
+            {"type": "user", "id": 1},
+            {"type": "summary", "id": 2},
+            {"id": 3},
+        ]
+
+    def test_select_parses_only_matching(self, tmp_path, monkeypatch):
+        """select() should parse only lines of the requested types."""
+        file_path = tmp_path / "select.jsonl"
+        file_path.write_text(
+            '{"type": "user", "id": 1}\n'
+            '{"type": "summary", "id": 2}\n'
+            '{"message": {"type": "x"}, "type": "assistant", "id": 3}\n'
+            '{"type": "user", "id": '
+        )
+
+        tailer = JSONLTailer(file_path)
+        batch = tailer.read_batch()
+        tailer.close()
+
+        parsed = []
+        real_loads = tailer_module._loads
+
+        def counting_loads(line):
+            parsed.append(line)
+            return real_loads(line)
+
+        monkeypatch.setattr(tailer_module, "_loads", counting_loads)
+
+        assert [e["id"] for e in batch.select("user", "assistant")] == [1, 3]
+        # The summary line is never parsed; the partial line isn't in the batch
+        assert len(parsed) == 2
+
+    def test_empty_batch(self, tmp_path):
+        """With no new data read_batch() returns an empty batch."""
+        file_path = tmp_path / "empty.jsonl"
+        file_path.touch()
+
+        tailer = JSONLTailer(file_path)
+        assert len(tailer.read_batch()) == 0
+        tailer.close()
+
+
+class TestEntryRing:
+    """Test EntryRing and JSONLTailer.read_into()."""
+
+    def test_push_and_drain_wraps_around(self):
+        """The ring should keep FIFO order across wrap-around."""
+        ring = EntryRing(capacity=3)
+
+        assert ring.push(b"1") and ring.push(b"2")
+        assert ring.drain() == [b"1", b"2"]
+
+        for line in (b"3", b"4", b"5"):
+            assert ring.push(line)
+        assert not ring.push(b"6")
+        assert ring.free == 0
+
+        assert ring.drain(max_items=2) == [b"3", b"4"]
+        assert len(ring) == 1
+        assert ring.drain() == [b"5"]
+
+    def test_invalid_capacity(self):
+        """Capacity must be positive."""
+        with pytest.raises(ValueError):
+            EntryRing(capacity=0)
+
+    def test_read_into_applies_back_pressure(self, tmp_path):
+        """Lines that don't fit are held and nothing new is read."""
+        file_path = tmp_path / "ring.jsonl"
+        file_path.write_text(
+            "".join(json.dumps({"id": i}) + "\n" for i in range(5)) + "\n"
+        )
+
+        tailer = JSONLTailer(file_path)
+        ring = EntryRing(capacity=2)
+
+        assert tailer.read_into(ring) == 2
+        assert tailer.read_into(ring) == 0  # full
+
+        with open(file_path, "a") as f:
+            f.write(json.dumps({"id": 5}) + "\n")
+
+        received = ring.drain_entries()
+        while True:
+            if not tailer.read_into(ring) and not len(ring):
+                break
+            received.extend(ring.drain_entries())
+
+        assert received == [{"id": i} for i in range(6)]
+        tailer.close()
+
 
 class TestMultiFileTailer:
     """Test MultiFileTailer class."""
@@ -344,3 +870,67 @@ class TestMultiFileTailer:
         # Should read all entries again
         results = tailer.read_new()
         assert len(results) == 2
+
+    def test_wait_for_changes_returns_written_files(self, tmp_path):
+        """wait_for_changes() should report only files that were written."""
+        file1 = tmp_path / "file1.jsonl"
+        file2 = tmp_path / "file2.jsonl"
+        file1.touch()
+        file2.touch()
+
+        multi = MultiFileTailer([file1, file2])
+        try:
+            # Initial call reports every file so pre-existing data is read
+            for tailer in multi.wait_for_changes(timeout=0.1):
+                tailer.read_new()
+
+            with open(file2, "a") as f:
+                f.write(json.dumps({"id": 2}) + "\n")
+
+            changed = []
+            deadline = time.monotonic() + 5.0
+            while not changed and time.monotonic() < deadline:
+                changed = multi.wait_for_changes(timeout=0.5)
+
+            assert [t.file_path for t in changed] == [file2]
+            assert changed[0].read_new() == [{"id": 2}]
+        finally:
+            multi.close()
+
+    def test_wait_for_changes_without_watchdog(self, tmp_path, monkeypatch):
+        """Without watchdog, changes are detected by comparing sizes."""
+        monkeypatch.setattr(tailer_module, "WATCHDOG_AVAILABLE", False)
+        file1 = tmp_path / "file1.jsonl"
+        file2 = tmp_path / "file2.jsonl"
+        file1.write_text(json.dumps({"id": 1}) + "\n")
+        file2.touch()
+
+        multi = MultiFileTailer([file1, file2])
+        changed = multi.wait_for_changes(timeout=0.01)
+
+        assert [t.file_path for t in changed] == [file1]
+        changed[0].read_new()
+        assert multi.wait_for_changes(timeout=0.01) == []
+        multi.close()
+
+    def test_wait_for_changes_without_watchdog_blocks_without_timeout(self, tmp_path, monkeypatch):
+        """Without watchdog, timeout=None should wait for a change."""
+        import threading
+
+        monkeypatch.setattr(tailer_module, "WATCHDOG_AVAILABLE", False)
+        file1 = tmp_path / "file1.jsonl"
+        file1.touch()
+
+        def write():
+            file1.write_text(json.dumps({"id": 1}) + "\n")
+
+        multi = MultiFileTailer([file1])
+        timer = threading.Timer(0.2, write)
+        timer.start()
+        start = time.monotonic()
+        changed = multi.wait_for_changes()
+        timer.join()
+
+        assert time.monotonic() - start >= 0.15
+        assert [t.file_path for t in changed] == [file1]
+        multi.close()
@@ -96,6 +96,12 @@ def make_tool_result_entry(session_id: str, uuid: str, parent_uuid: str, tool_us
     }
 
 
+def append_entry(path: Path, entry: dict) -> None:
+    """Append one JSONL entry to a file."""
+    with open(path, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
 @pytest.fixture
 def mock_claude_dir(tmp_path):
     """Create a mock ~/.claude directory structure."""
@@ -184,6 +190,21 @@ class TestSessionDiscovery:
         session_starts = [e for e in events if isinstance(e, SessionStartEvent)]
         assert len(session_starts) >= 1
 
+    def test_start_handlers_can_query_watcher(self, mock_claude_dir, watcher_config):
+        """Session start is emitted without the watcher lock held."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        append_entry(project_dir / "session-a.jsonl", make_user_entry("session-a", "a-1"))
+
+        watcher = SessionWatcher(config=watcher_config)
+        seen = []
+        watcher.on("session_start", lambda e: seen.append(watcher.get_active_sessions()))
+        watcher._discover_existing_sessions()
+
+        assert seen == [["session-a"]]
+        # Already-tracked sessions are not registered twice
+        assert watcher._track_session("session-a", "test-project", project_dir) is None
+
 
 class TestEventStreaming:
     """Test that events stream correctly."""
@@ -325,6 +346,50 @@ class TestBackgroundMode:
         watcher.stop()
         assert not watcher._running
 
+    @pytest.mark.asyncio
+    async def test_run_async_and_stop(self, mock_claude_dir, watcher_config):
+        """run_async should poll from the event loop until stopped."""
+        import asyncio
+
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        with open(project_dir / "session-a.jsonl", "w") as f:
+            f.write(json.dumps(make_user_entry("session-a", "a-1")) + "\n")
+
+        watcher = SessionWatcher(config=watcher_config)
+        messages = []
+        watcher.on("message", messages.append)
+
+        task = asyncio.create_task(watcher.run_async())
+        await asyncio.sleep(0.2)
+        assert watcher._running
+        assert [m.session_id for m in messages] == ["session-a"]
+
+        watcher.stop()
+        await asyncio.wait_for(task, timeout=2.0)
+        assert not watcher._running
+
+    @pytest.mark.asyncio
+    async def test_run_async_cancel_stops_watching(
+        self, mock_claude_dir, watcher_config
+    ):
+        """Cancelling run_async should stop watching; a later stop() is a no-op."""
+        import asyncio
+
+        watcher = SessionWatcher(config=watcher_config)
+
+        task = asyncio.create_task(watcher.run_async())
+        await asyncio.sleep(0.2)
+        assert watcher._running
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=2.0)
+        assert not watcher._running
+
+        watcher.stop()
+        assert not watcher._running
+
 
 class TestMultipleSessions:
     """Test handling multiple concurrent sessions."""
@@ -354,6 +419,29 @@ class TestMultipleSessions:
         # Should have seen all sessions
         assert len(sessions_seen) >= 1
 
+    def test_session_filter_skips_rejected_sessions(self, mock_claude_dir, watcher_config):
+        """Sessions rejected by session_filter should not be tracked."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+
+        for i in range(4):
+            session_id = f"session-{i:08d}"
+            (project_dir / f"{session_id}.jsonl").write_text(
+                json.dumps(make_user_entry(session_id, f"msg-{i}")) + "\n"
+            )
+
+        watcher_config.session_filter = lambda sid: sid.endswith(("0", "2"))
+        watcher = SessionWatcher(config=watcher_config)
+        sessions_seen = set()
+
+        @watcher.on("message")
+        def on_message(event):
+            sessions_seen.add(event.session_id)
+
+        watcher.run_for(0.3)
+
+        assert sessions_seen == {"session-00000000", "session-00000002"}
+
 
 class TestErrorHandling:
     """Test error handling and robustness."""
@@ -419,3 +507,396 @@ class TestErrorHandling:
 
         # Good handler should still be called
         assert len(good_received) >= 1
+
+
+class TestChangeTracking:
+    """Test that watchdog-driven polling only reads changed sessions."""
+
+    def test_only_dirty_sessions_are_read(self, mock_claude_dir, watcher_config):
+        """With an observer running, unmodified sessions are not polled."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        file_a = project_dir / "session-a.jsonl"
+        file_b = project_dir / "session-b.jsonl"
+        append_entry(file_a, make_user_entry("session-a", "a-1"))
+        append_entry(file_b, make_user_entry("session-b", "b-1"))
+
+        watcher = SessionWatcher(config=watcher_config)
+        watcher._discover_existing_sessions()
+
+        messages = []
+        watcher.on("message", messages.append)
+
+        # Pretend watchdog is running and only reported session-a
+        watcher._observer = object()
+        append_entry(file_a, make_user_entry("session-a", "a-2"))
+        append_entry(file_b, make_user_entry("session-b", "b-2"))
+        watcher._queue_file_event("modified", str(file_a))
+        watcher._poll_cycle()
+
+        assert [m.session_id for m in messages] == ["session-a"]
+
+        # session-b is picked up once its change is reported
+        watcher._queue_file_event("modified", str(file_b))
+        watcher._poll_cycle()
+        assert [m.session_id for m in messages] == ["session-a", "session-b"]
+        watcher._observer = None
+
+    def test_created_event_for_tracked_session_reads_it(self, mock_claude_dir, watcher_config):
+        """A created event for a session found by the scan should read new data."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        session_file = project_dir / "session-a.jsonl"
+        append_entry(session_file, make_user_entry("session-a", "a-1"))
+
+        watcher = SessionWatcher(config=watcher_config)
+        watcher._discover_existing_sessions()
+
+        messages = []
+        watcher.on("message", messages.append)
+
+        # The observer queued the creation before the scan tracked the file
+        watcher._observer = object()
+        append_entry(session_file, make_user_entry("session-a", "a-2"))
+        watcher._queue_file_event("created", str(session_file))
+        watcher._poll_cycle()
+
+        assert [m.message.uuid for m in messages] == ["a-2"]
+        watcher._observer = None
+
+    def test_agent_file_changes_mark_parent_dirty(self, mock_claude_dir, watcher_config):
+        """Modifications to a known agent file should read its session."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        session_file = project_dir / "session-a.jsonl"
+        agent_file = project_dir / "agent-1234.jsonl"
+        append_entry(session_file, make_user_entry("session-a", "a-1"))
+        append_entry(agent_file, make_user_entry("session-a", "agent-1"))
+
+        watcher = SessionWatcher(config=watcher_config)
+        watcher._discover_existing_sessions()
+
+        messages = []
+        watcher.on("message", messages.append)
+
+        watcher._observer = object()
+        append_entry(agent_file, make_user_entry("session-a", "agent-2"))
+        watcher._queue_file_event("modified", str(agent_file))
+        watcher._poll_cycle()
+
+        assert [m.message.uuid for m in messages] == ["agent-2"]
+        watcher._observer = None
+
+    def test_event_path_spelling_matches_tracked_file(self, mock_claude_dir, tmp_path):
+        """A change reported under another spelling of the path is still read."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        session_file = project_dir / "session-a.jsonl"
+        append_entry(session_file, make_user_entry("session-a", "a-1"))
+
+        # Configured through a symlink, reported by the observer resolved
+        link = tmp_path / "claude-link"
+        link.symlink_to(mock_claude_dir)
+        watcher = SessionWatcher(config=WatcherConfig(base_path=link))
+        watcher._discover_existing_sessions()
+
+        messages = []
+        watcher.on("message", messages.append)
+
+        watcher._observer = object()
+        append_entry(session_file, make_user_entry("session-a", "a-2"))
+        watcher._queue_file_event(
+            "modified", str(project_dir / ".." / "test-project" / "session-a.jsonl")
+        )
+        watcher._poll_cycle()
+
+        assert [m.message.uuid for m in messages] == ["a-2"]
+        watcher._observer = None
+
+    def test_agent_file_registered_once(self, mock_claude_dir, watcher_config):
+        """An agent file already claimed by a session is not read again."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        agent_file = project_dir / "agent-1234.jsonl"
+        append_entry(project_dir / "session-a.jsonl", make_user_entry("session-a", "a-1"))
+        append_entry(agent_file, make_user_entry("session-a", "agent-1"))
+
+        watcher = SessionWatcher(config=watcher_config)
+        messages = []
+        watcher.on("message", messages.append)
+        watcher._discover_existing_sessions()
+
+        # A late created event and a second session's discovery both skip it
+        append_entry(project_dir / "session-b.jsonl", make_user_entry("session-b", "b-1"))
+        watcher._handle_file_created(str(agent_file))
+        watcher._discover_existing_sessions()
+
+        uuids = [m.message.uuid for m in messages]
+        assert uuids.count("agent-1") == 1
+        assert list(watcher._sessions["session-a"].agent_files) == ["agent-1234"]
+        assert watcher._sessions["session-b"].agent_files == {}
+
+
+class TestFileEventQueue:
+    """Test buffering of watchdog file events between poll cycles."""
+
+    def test_event_bursts_are_coalesced(self, mock_claude_dir, watcher_config):
+        """Repeated events for one path should be handled once per cycle."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        session_file = project_dir / "session-a.jsonl"
+        append_entry(session_file, make_user_entry("session-a", "a-1"))
+
+        watcher = SessionWatcher(config=watcher_config)
+        handled = []
+        watcher._handle_file_created = lambda path: handled.append(("created", path))
+        watcher._handle_file_modified = lambda path: handled.append(("modified", path))
+
+        watcher._queue_file_event("created", str(session_file))
+        for _ in range(50):
+            watcher._queue_file_event("modified", str(session_file))
+        watcher._process_pending_file_events()
+
+        assert handled == [
+            ("created", str(session_file)),
+            ("modified", str(session_file)),
+        ]
+
+    def test_event_overflow_triggers_rescan(self, mock_claude_dir, watcher_config):
+        """Dropping queued events should fall back to a full rescan."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        file_a = project_dir / "session-a.jsonl"
+        append_entry(file_a, make_user_entry("session-a", "a-1"))
+
+        watcher_config.max_pending_events = 4
+        watcher = SessionWatcher(config=watcher_config)
+        watcher._discover_existing_sessions()
+
+        messages = []
+        watcher.on("message", messages.append)
+        watcher._observer = object()
+
+        # session-b's created event is pushed out by the storm
+        append_entry(file_a, make_user_entry("session-a", "a-2"))
+        append_entry(project_dir / "session-b.jsonl", make_user_entry("session-b", "b-1"))
+        watcher._queue_file_event("created", str(project_dir / "session-b.jsonl"))
+        for i in range(10):
+            watcher._queue_file_event("modified", str(project_dir / f"other-{i}.jsonl"))
+        assert len(watcher._pending_files) == 4
+
+        watcher._poll_cycle()
+
+        assert sorted(m.message.uuid for m in messages) == ["a-2", "b-1"]
+        assert not watcher._events_dropped
+        watcher._observer = None
+
+    def test_wait_for_work_wakes_on_event_or_deadline(self, watcher_config):
+        """With an observer, the loop sleeps until an event or a deadline."""
+        import threading
+
+        watcher = SessionWatcher(config=watcher_config)
+        watcher._observer = object()
+
+        timer = threading.Timer(
+            0.05, watcher._queue_file_event, ("modified", "/tmp/x.jsonl")
+        )
+        timer.start()
+        start = time.monotonic()
+        watcher._wait_for_work(limit=5.0)
+        assert time.monotonic() - start < 2.0
+        timer.join()
+
+        # Idle deadline 50ms from now (idle_timeout is 1s)
+        from claude_sessions.realtime.watcher import TrackedSession
+
+        tracked = TrackedSession(
+            session_id="s",
+            project_slug="p",
+            file_path=Path("/tmp/s.jsonl"),
+            tailer=None,
+            last_activity=datetime.now(timezone.utc) - timedelta(milliseconds=950),
+        )
+        watcher._sessions["s"] = tracked
+        watcher._schedule_idle_check(tracked)
+        start = time.monotonic()
+        watcher._wait_for_work(limit=5.0)
+        assert time.monotonic() - start < 2.0
+        watcher._observer = None
+
+
+class TestSessionTimeouts:
+    """Test idle and end timeout processing."""
+
+    def test_active_sessions_drop_ended(self, mock_claude_dir, watcher_config):
+        """get_active_sessions() should list sessions until they end."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        for sid in ("session-a", "session-b"):
+            with open(project_dir / f"{sid}.jsonl", "w") as f:
+                f.write(json.dumps(make_user_entry(sid, f"{sid}-1")) + "\n")
+
+        watcher = SessionWatcher(config=watcher_config)
+        watcher._discover_existing_sessions()
+        assert sorted(watcher.get_active_sessions()) == ["session-a", "session-b"]
+
+        # Idle, then end, session-a only
+        tracked = watcher._sessions["session-a"]
+        other = watcher._sessions["session-b"]
+        later = tracked.last_activity + timedelta(seconds=10)
+        for now in (later, later + timedelta(seconds=10)):
+            other.update_activity(now)
+            watcher._check_timeouts(now)
+
+        assert tracked.is_ended
+        assert watcher.get_active_sessions() == ["session-b"]
+
+    def test_ended_session_releases_tailer(self, mock_claude_dir, watcher_config):
+        """Ending a session should close its tailer and forget its file."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        session_file = project_dir / "session-a.jsonl"
+        with open(session_file, "w") as f:
+            f.write(json.dumps(make_user_entry("session-a", "a-1")) + "\n")
+
+        watcher = SessionWatcher(config=watcher_config)
+        watcher._discover_existing_sessions()
+        tracked = watcher._sessions["session-a"]
+        tailer = tracked.tailer
+        tailer.read_new()
+        assert tailer.state.fd is not None
+
+        later = tracked.last_activity + timedelta(seconds=10)
+        watcher._check_timeouts(later)
+        watcher._check_timeouts(later + timedelta(seconds=10))
+
+        assert tracked.is_ended
+        assert tracked.tailer is None
+        assert tracked.agent_files == {}
+        assert tailer.state.fd is None
+        assert not watcher._file_to_session
+        # Late writes to an ended session are ignored
+        watcher._process_session_updates(tracked)
+
+    def test_timeouts_only_visit_due_sessions(self, mock_claude_dir, watcher_config):
+        """Sessions are examined only once their deadline has passed."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        with open(project_dir / "session-a.jsonl", "w") as f:
+            f.write(json.dumps(make_user_entry("session-a", "a-1")) + "\n")
+
+        watcher = SessionWatcher(config=watcher_config)
+        events = []
+        watcher.on("session_idle", events.append)
+        watcher.on("session_end", events.append)
+        watcher._discover_existing_sessions()
+
+        tracked = watcher._sessions["session-a"]
+        start = tracked.last_activity
+
+        # Nothing due yet: the session stays queued for idle
+        watcher._check_timeouts(start + timedelta(milliseconds=500))
+        assert list(watcher._idle_order) == ["session-a"]
+        assert events == []
+
+        # Idle fires, moving the session to the end queue
+        watcher._check_timeouts(start + timedelta(seconds=1.5))
+        assert [e.event_type for e in events] == ["session_idle"]
+        assert list(watcher._idle_order) == []
+        assert list(watcher._end_order) == ["session-a"]
+
+        watcher._check_timeouts(start + timedelta(seconds=2.5))
+        assert [e.event_type for e in events] == ["session_idle", "session_end"]
+        assert list(watcher._end_order) == []
+
+    def test_activity_reorders_idle_queue(self, mock_claude_dir, watcher_config):
+        """Activity moves a session behind the others and cancels its end."""
+        project_dir = mock_claude_dir / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
+        for sid in ("session-a", "session-b"):
+            with open(project_dir / f"{sid}.jsonl", "w") as f:
+                f.write(json.dumps(make_user_entry(sid, f"{sid}-1")) + "\n")
+
+        watcher = SessionWatcher(config=watcher_config)
+        watcher._discover_existing_sessions()
+        a, b = watcher._sessions["session-a"], watcher._sessions["session-b"]
+        assert list(watcher._idle_order) == ["session-a", "session-b"]
+
+        later = b.last_activity + timedelta(seconds=1.5)
+        watcher._check_timeouts(later)
+        assert a.is_idle and b.is_idle
+
+        # session-a resumes: back in the idle queue, out of the end queue
+        a.update_activity(later)
+        watcher._schedule_idle_check(a)
+        assert list(watcher._idle_order) == ["session-a"]
+        assert list(watcher._end_order) == ["session-b"]
+
+        watcher._check_timeouts(later + timedelta(seconds=0.4))
+        assert not a.is_ended and not b.is_ended
+
+        watcher._check_timeouts(later + timedelta(seconds=0.6))
+        assert b.is_ended
+        assert not a.is_idle
+
+
+class TestTrackedSessionClock:
+    """Test TrackedSession lifecycle checks with an explicit clock."""
+
+    def test_idle_and_end_use_given_time(self, tmp_path):
+        """check_idle/check_ended should compare against the passed time."""
+        from claude_sessions.realtime.tailer import JSONLTailer
+        from claude_sessions.realtime.watcher import TrackedSession
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        file_path = tmp_path / "s.jsonl"
+        tracked = TrackedSession(
+            session_id="s",
+            project_slug="p",
+            file_path=file_path,
+            tailer=JSONLTailer(file_path),
+        )
+        tracked.update_activity(start)
+
+        timeout = timedelta(minutes=2)
+        assert not tracked.check_idle(timeout, start + timedelta(minutes=1))
+        assert tracked.check_idle(timeout, start + timedelta(minutes=3))
+        assert tracked.idle_since == start
+
+        assert not tracked.check_ended(timeout, start + timedelta(minutes=1))
+        assert tracked.check_ended(timeout, start + timedelta(minutes=3))
+
+        assert tracked.update_activity(start + timedelta(minutes=4)) is True
+        assert tracked.last_activity == start + timedelta(minutes=4)
+
+
+class TestObserverSelection:
+    """Test choosing between native and polling watchdog observers."""
+
+    def test_force_polling_uses_polling_observer(self, mock_claude_dir, watcher_config):
+        """force_polling should select watchdog's PollingObserver."""
+        watchdog = pytest.importorskip("watchdog.observers.polling")
+
+        watcher_config.force_polling = True
+        watcher_config.observer_timeout = 0.2
+        watcher = SessionWatcher(config=watcher_config)
+
+        observer = watcher._create_observer(watcher_config.projects_path)
+        assert isinstance(observer, watchdog.PollingObserver)
+        assert observer.timeout == 0.2
+
+    def test_network_filesystem_detection(self, tmp_path):
+        """The longest matching mount point decides the filesystem type."""
+        from claude_sessions.realtime.watcher import _is_network_filesystem
+
+        mounts = tmp_path / "mounts"
+        mounts.write_text(
+            "/dev/sda1 / ext4 rw 0 0\n"
+            "server:/export /mnt/share nfs4 rw 0 0\n"
+            "/dev/sdb1 /mnt/share/local ext4 rw 0 0\n"
+        )
+
+        assert _is_network_filesystem(Path("/mnt/share/x"), str(mounts))
+        assert not _is_network_filesystem(Path("/mnt/share/local/x"), str(mounts))
+        assert not _is_network_filesystem(Path("/mnt/shared"), str(mounts))
+        assert not _is_network_filesystem(Path("/home"), str(tmp_path / "missing"))
@@ -5,15 +5,18 @@ These tests verify webhook dispatching, batching, and retry logic.
 
 import json
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 
+from claude_sessions.realtime import webhook as webhook_module
 from claude_sessions.realtime.webhook import (
+    AsyncWebhookDispatcher,
     WebhookConfig,
     WebhookPayload,
     WebhookDispatcher,
+    serialize_event,
 )
 from claude_sessions.realtime.events import (
     MessageEvent,
@@ -97,6 +100,15 @@ class TestWebhookConfig:
         assert config.batch_size == 5
         assert config.max_retries == 5
 
+    def test_display_url_is_derived(self):
+        """display_url is a precomputed, shortened copy of url."""
+        url = "https://example.com/" + "x" * 100
+        config = WebhookConfig(url=url)
+
+        assert config.display_url == url[:50]
+        assert "display_url" not in repr(config)
+        assert config == WebhookConfig(url=url)
+
 
 class TestWebhookPayload:
     """Test WebhookPayload dataclass."""
@@ -112,6 +124,17 @@ class TestWebhookPayload:
         assert len(payload.events) == 1
         assert payload.source == "test"
 
+    def test_utc_now_iso_matches_datetime(self):
+        """Payload timestamps parse back to the current UTC time."""
+        before = datetime.now(timezone.utc)
+        stamp = webhook_module._utc_now_iso()
+        after = datetime.now(timezone.utc)
+
+        parsed = datetime.fromisoformat(stamp)
+        assert parsed.tzinfo == timezone.utc
+        # Microseconds are truncated rather than rounded
+        assert before - timedelta(microseconds=1) <= parsed <= after
+
     def test_to_dict(self):
         """WebhookPayload should serialize to dict."""
         payload = WebhookPayload(
@@ -136,6 +159,92 @@ class TestWebhookPayload:
         data = json.loads(json_str)
         assert data["source"] == "test"
 
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_to_bytes_matches_to_json(self, use_orjson, monkeypatch):
+        """to_bytes() should encode the same document as to_json()."""
+        if use_orjson and not webhook_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(webhook_module, "ORJSON_AVAILABLE", use_orjson)
+
+        payload = WebhookPayload(
+            events=[{"type": "test", "text": "héllo ✓", "count": 3}],
+            timestamp="2024-01-15T14:32:05+00:00",
+            source="test"
+        )
+
+        body = payload.to_bytes()
+        assert isinstance(body, bytes)
+        assert json.loads(body) == json.loads(payload.to_json())
+        # to_json() keeps the stdlib format whichever encoder to_bytes() uses
+        assert payload.to_json() == json.dumps(
+            payload.to_dict(), default=str, ensure_ascii=False
+        )
+
+
+class TestSerializeEvent:
+    """Test event serialization for webhook payloads."""
+
+    def test_message_fields(self, message_event):
+        """Message events include role and a text preview."""
+        data = serialize_event(message_event)
+        assert data == {
+            "event_type": "message",
+            "timestamp": "2024-01-15T14:32:05+00:00",
+            "session_id": "session-12345678",
+            "role": "user",
+            "text_preview": "Hello world",
+            "has_tool_calls": False,
+        }
+
+    def test_tool_use_fields(self, tool_use_event):
+        """Tool use events include the tool but not its input."""
+        data = serialize_event(tool_use_event)
+        assert data["tool_name"] == "Read"
+        assert data["tool_category"] == "file_read"
+        assert data["tool_use_id"] == "toolu_123"
+        assert "tool_input" not in data
+
+    def test_error_fields(self, sample_datetime):
+        """Error events include the error message."""
+        event = ErrorEvent(
+            timestamp=sample_datetime,
+            session_id="s",
+            error_message="boom",
+        )
+        assert serialize_event(event)["error_message"] == "boom"
+
+
+class TestEventQueue:
+    """Test the per-webhook event queue."""
+
+    def test_fifo_and_bounds(self):
+        """Items come out in order; capacity and emptiness raise."""
+        import queue
+
+        q = webhook_module._EventQueue(maxsize=2)
+        assert q.empty()
+        q.put_nowait(1)
+        q.put_nowait(2)
+        with pytest.raises(queue.Full):
+            q.put_nowait(3)
+        assert q.qsize() == 2
+        assert q.get_nowait() == 1
+        assert q.get(timeout=0) == 2
+        with pytest.raises(queue.Empty):
+            q.get(timeout=0.01)
+
+    def test_get_wakes_on_put_from_other_thread(self):
+        """A waiting consumer is woken by a producer's put."""
+        import threading
+
+        q = webhook_module._EventQueue(maxsize=10)
+        timer = threading.Timer(0.05, q.put_nowait, ("event",))
+        timer.start()
+        start = time.monotonic()
+        assert q.get(timeout=5.0) == "event"
+        assert time.monotonic() - start < 2.0
+        timer.join()
+
 
 class TestWebhookDispatcher:
     """Test WebhookDispatcher class."""
@@ -268,6 +377,65 @@ class TestWebhookDispatcherRetry:
         assert backoffs[1] == 2.0
         assert backoffs[2] == 4.0
 
+    def test_failed_batch_retried_without_blocking(self, message_event, tool_use_event):
+        """A failing batch is resent later while new batches keep flowing."""
+        attempts = []
+
+        def send(config, payload):
+            event_type = payload.events[0]["event_type"]
+            attempts.append(event_type)
+            if event_type == "message" and attempts.count("message") == 1:
+                raise ConnectionError("boom")
+
+        dispatcher = WebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=1,
+            retry_backoff=0.2,
+        ))
+        dispatcher._send_request = send
+
+        dispatcher.start()
+        dispatcher.handle_event(message_event)
+        dispatcher.handle_event(tool_use_event)
+        for _ in range(200):
+            if len(attempts) >= 3:
+                break
+            time.sleep(0.01)
+        dispatcher.stop()
+
+        # The tool_use batch went out before the message batch was retried
+        assert attempts == ["message", "tool_use", "message"]
+        stats = dispatcher.get_stats()["https://example.com/webhook"]
+        assert stats["sent"] == 2
+        assert stats["failed"] == 0
+
+    def test_pending_retries_get_final_attempt_on_stop(self, message_event):
+        """stop() makes one last attempt for batches still backing off."""
+        dispatcher = WebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=1,
+            retry_backoff=60.0,
+        ))
+        calls = []
+
+        def send(config, payload):
+            calls.append(payload)
+            raise ConnectionError("boom")
+
+        dispatcher._send_request = send
+        dispatcher.start()
+        dispatcher.handle_event(message_event)
+        for _ in range(100):
+            if calls:
+                break
+            time.sleep(0.01)
+        dispatcher.stop()
+
+        assert len(calls) == 2
+        assert dispatcher.get_stats()["https://example.com/webhook"]["failed"] == 1
+
 
 class TestWebhookDispatcherIntegration:
     """Integration tests with mocked HTTP."""
@@ -301,3 +469,359 @@ class TestWebhookDispatcherIntegration:
         # Should have attempted to send
         # Note: May not be called if batching logic prevents it
         # The key thing is that no exceptions were raised
+
+    @patch('claude_sessions.realtime.webhook.urlopen')
+    def test_large_bodies_gzipped_above_threshold(self, mock_urlopen):
+        """Bodies reaching gzip_threshold are compressed, smaller ones are not."""
+        import gzip
+
+        mock_urlopen.return_value.__enter__.return_value.status = 200
+        small = WebhookPayload(events=[{"n": 1}], timestamp="t")
+        large = WebhookPayload(events=[{"n": i} for i in range(200)], timestamp="t")
+        config = WebhookConfig(url="https://example.com/webhook", gzip_threshold=1024)
+
+        webhook_module._post_with_urllib(config, small)
+        webhook_module._post_with_urllib(config, large)
+
+        small_req, large_req = (c.args[0] for c in mock_urlopen.call_args_list)
+        assert small_req.get_header("Content-encoding") is None
+        assert small_req.data == small.to_bytes()
+        assert large_req.get_header("Content-encoding") == "gzip"
+        assert gzip.decompress(large_req.data) == large.to_bytes()
+
+    @pytest.mark.skipif(
+        not webhook_module.REQUESTS_AVAILABLE, reason="requests not installed"
+    )
+    def test_requests_session_reused_across_batches(self, message_event):
+        """All batches for a webhook go through one pooled session."""
+        dispatcher = WebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=1,
+            batch_timeout=0.1,
+        ))
+
+        session = MagicMock()
+        with patch.object(webhook_module.requests, "Session", return_value=session):
+            dispatcher.start()
+            dispatcher.handle_event(message_event)
+            dispatcher.handle_event(message_event)
+            dispatcher.stop()
+
+        assert session.post.call_count == 2
+        session.close.assert_called_once()
+        assert dispatcher._sessions == {}
+
+    @pytest.mark.skipif(
+        not webhook_module.REQUESTS_AVAILABLE, reason="requests not installed"
+    )
+    def test_requests_response_streamed(self):
+        """Responses are streamed; error bodies are read only for the message."""
+        requests = webhook_module.requests
+        dispatcher = WebhookDispatcher()
+        config = WebhookConfig(url="https://example.com/webhook")
+        payload = WebhookPayload(events=[], timestamp="t")
+        response = MagicMock()
+        response.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
+        response.iter_content.return_value = iter([b"rate limited"])
+        dispatcher._sessions[config.url] = session = MagicMock()
+        session.post.return_value = response
+
+        with pytest.raises(requests.HTTPError, match="500 Server Error: rate limited"):
+            dispatcher._send_with_requests(config, payload)
+
+        assert session.post.call_args.kwargs["stream"] is True
+        response.__exit__.assert_called_once()
+
+    @pytest.mark.skipif(
+        not webhook_module.REQUESTS_AVAILABLE, reason="requests not installed"
+    )
+    def test_sessions_use_keepalive_adapter(self):
+        """Webhook sessions set TCP_NODELAY and keep-alive on their sockets."""
+        import socket
+
+        dispatcher = WebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(url="https://example.com/webhook"))
+        dispatcher.start()
+        try:
+            session = dispatcher._sessions["https://example.com/webhook"]
+            adapter = session.get_adapter("https://example.com/webhook")
+            options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        finally:
+            dispatcher.stop()
+
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+    @pytest.mark.skipif(
+        not webhook_module.HTTPX_AVAILABLE, reason="httpx[http2] not installed"
+    )
+    def test_http2_client_shared_across_webhooks(self, message_event):
+        """With http2=True every webhook posts through one httpx client."""
+        dispatcher = WebhookDispatcher(http2=True)
+        for name in ("a", "b"):
+            dispatcher.add_webhook(WebhookConfig(
+                url=f"https://example.com/{name}",
+                batch_size=1,
+            ))
+
+        client = MagicMock()
+        with patch.object(webhook_module.httpx, "Client", return_value=client) as cls:
+            dispatcher.start()
+            dispatcher.handle_event(message_event)
+            dispatcher.stop()
+
+        assert cls.call_args.kwargs["http2"] is True
+        assert sorted(c.args[0] for c in client.post.call_args_list) == [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        client.close.assert_called_once()
+        assert dispatcher._sessions == {}
+
+    def test_http2_falls_back_without_httpx(self, message_event):
+        """http2=True without httpx installed uses the default backend."""
+        sent = []
+        dispatcher = WebhookDispatcher(http2=True)
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=1,
+        ))
+
+        with patch.object(webhook_module, "HTTPX_AVAILABLE", False), patch.object(
+            webhook_module, "REQUESTS_AVAILABLE", False
+        ), patch.object(
+            webhook_module,
+            "_post_with_urllib",
+            lambda config, payload: sent.append(payload),
+        ):
+            dispatcher.start()
+            dispatcher.handle_event(message_event)
+            dispatcher.stop()
+
+        assert len(sent) == 1
+
+    def test_queued_events_sent_as_one_batch(self, message_event):
+        """Events already queued are drained into a single batch."""
+        sent = []
+        dispatcher = WebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=5,
+            batch_timeout=60.0,
+        ))
+        dispatcher._send_request = lambda config, payload: sent.append(payload)
+
+        dispatcher._running = True
+        for _ in range(7):
+            dispatcher.handle_event(message_event)
+        dispatcher._running = False
+
+        dispatcher.start()
+        for _ in range(100):
+            if sent:
+                break
+            time.sleep(0.01)
+        dispatcher.stop()
+
+        assert [len(p.events) for p in sent] == [5, 2]
+
+    def test_partial_batch_sent_at_batch_timeout(self, message_event):
+        """A partial batch goes out once batch_timeout has passed."""
+        sent = []
+        dispatcher = WebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=10,
+            batch_timeout=0.1,
+        ))
+        dispatcher._send_request = lambda config, payload: sent.append(payload)
+
+        dispatcher.start()
+        dispatcher.handle_event(message_event)
+        for _ in range(100):
+            if sent:
+                break
+            time.sleep(0.01)
+        assert [len(p.events) for p in sent] == [1]
+
+        # stop() flushes what is queued before it, then the thread exits
+        dispatcher.handle_event(message_event)
+        dispatcher.handle_event(message_event)
+        dispatcher.stop()
+        assert [len(p.events) for p in sent] == [1, 2]
+        assert dispatcher._threads == {}
+
+    def test_router_applies_filters_per_webhook(self, message_event, tool_use_event):
+        """One handle_event() call fans out to each matching webhook."""
+        sent = {}
+        dispatcher = WebhookDispatcher()
+        for name, wanted in (("a", "message"), ("b", "tool_use")):
+            dispatcher.add_webhook(WebhookConfig(
+                url=f"https://example.com/{name}",
+                batch_size=10,
+                batch_timeout=60.0,
+                event_filter=lambda e, wanted=wanted: e.event_type == wanted,
+            ))
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/broken",
+            event_filter=lambda e: 1 / 0,
+        ))
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/all",
+            batch_size=10,
+            batch_timeout=60.0,
+        ))
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/typed",
+            batch_size=10,
+            batch_timeout=60.0,
+            event_types={"tool_use"},
+        ))
+        dispatcher._send_request = (
+            lambda config, payload: sent.setdefault(config.url, []).extend(
+                e["event_type"] for e in payload.events
+            )
+        )
+
+        dispatcher.start()
+        for event in (message_event, tool_use_event, message_event):
+            dispatcher.handle_event(event)
+        dispatcher.stop()
+
+        assert sent == {
+            "https://example.com/a": ["message", "message"],
+            "https://example.com/b": ["tool_use"],
+            "https://example.com/all": ["message", "tool_use", "message"],
+            "https://example.com/typed": ["tool_use"],
+        }
+        assert dispatcher.get_stats()["https://example.com/a"]["filtered"] == 1
+        assert dispatcher.get_stats()["https://example.com/all"]["filtered"] == 0
+        assert dispatcher.get_stats()["https://example.com/typed"]["filtered"] == 2
+
+
+class TestAsyncWebhookDispatcher:
+    """Test the asyncio-based dispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_sends_batches_from_other_threads(self, message_event, tool_use_event):
+        """Events handed over from a worker thread are batched and sent."""
+        import asyncio
+
+        sent = []
+        dispatcher = AsyncWebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=2,
+            batch_timeout=60.0,
+            event_filter=lambda e: e.event_type == "message",
+        ))
+
+        with patch.object(webhook_module, "AIOHTTP_AVAILABLE", False), patch.object(
+            webhook_module,
+            "_post_with_urllib",
+            lambda config, payload: sent.append(payload),
+        ):
+            async with dispatcher:
+                for event in (message_event, tool_use_event, message_event):
+                    await asyncio.to_thread(dispatcher.handle_event, event)
+                for _ in range(100):
+                    if sent:
+                        break
+                    await asyncio.sleep(0.01)
+
+        assert len(sent) == 1
+        assert len(sent[0].events) == 2
+        stats = dispatcher.get_stats()["https://example.com/webhook"]
+        assert stats == {"sent": 1, "failed": 0, "filtered": 1}
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_partial_batch(self, message_event):
+        """stop() sends events still waiting for their batch."""
+        sent = []
+        dispatcher = AsyncWebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=10,
+            batch_timeout=60.0,
+        ))
+
+        with patch.object(webhook_module, "AIOHTTP_AVAILABLE", False), patch.object(
+            webhook_module,
+            "_post_with_urllib",
+            lambda config, payload: sent.append(payload),
+        ):
+            await dispatcher.start()
+            dispatcher.handle_event(message_event)
+            await dispatcher.stop()
+
+        assert [len(p.events) for p in sent] == [1]
+        assert not dispatcher._tasks
+
+    @pytest.mark.asyncio
+    async def test_failing_filter_does_not_block_other_webhooks(self, message_event):
+        """A filter that raises skips only its own webhook."""
+        def bad_filter(event):
+            raise ValueError("boom")
+
+        sent = []
+        dispatcher = AsyncWebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/bad",
+            batch_size=10,
+            batch_timeout=60.0,
+            event_filter=bad_filter,
+        ))
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/good",
+            batch_size=10,
+            batch_timeout=60.0,
+            event_filter=lambda e: True,
+        ))
+
+        with patch.object(webhook_module, "AIOHTTP_AVAILABLE", False), patch.object(
+            webhook_module,
+            "_post_with_urllib",
+            lambda config, payload: sent.append(config.url),
+        ):
+            await dispatcher.start()
+            dispatcher.handle_event(message_event)
+            await dispatcher.stop()
+
+        assert sent == ["https://example.com/good"]
+
+    @pytest.mark.asyncio
+    async def test_stop_honors_timeout_with_full_queue(self, message_event):
+        """stop() returns within its timeout even if a queue is full."""
+        import asyncio
+        import threading
+
+        release = threading.Event()
+        dispatcher = AsyncWebhookDispatcher()
+        dispatcher.add_webhook(WebhookConfig(
+            url="https://example.com/webhook",
+            batch_size=1,
+            batch_timeout=60.0,
+        ))
+        assert not dispatcher._queues
+
+        with patch.object(webhook_module, "AIOHTTP_AVAILABLE", False), patch.object(
+            webhook_module,
+            "_post_with_urllib",
+            lambda config, payload: release.wait(5.0),
+        ):
+            await dispatcher.start()
+            try:
+                # First event blocks the sender, the rest fill the queue
+                dispatcher.handle_event(message_event)
+                await asyncio.sleep(0.05)
+                for _ in range(10000):
+                    dispatcher.handle_event(message_event)
+                assert dispatcher._queues["https://example.com/webhook"].full()
+
+                start = time.monotonic()
+                await dispatcher.stop(timeout=0.2)
+                assert time.monotonic() - start < 1.0
+                assert not dispatcher._tasks
+            finally:
+                release.set()